@@ -75,16 +75,16 @@ class BaseLLM(
     def child(
         self, name: str
     ) -> BaseLLM[TInput, TOutput, THistoryEntry, TModelParameters]:
-        """Create a child LLM."""
-        if self._cached is None:
+        """Create a child LLM (with child cache and rate limiting flow)."""
+        if self._cached is None and self._rate_limiter is None:
             return self
         return self.__class__(
             events=self._events,
-            cached=self._cached.child(name),
+            cached=self._cached.child(name) if self._cached else None,
             usage_extractor=self._usage_extractor,
             history_extractor=self._history_extractor,
             variable_injector=self._variable_injector,
-            rate_limiter=self._rate_limiter,
+            rate_limiter=self._rate_limiter.child(name) if self._rate_limiter else None,
             retryer=self._retryer,
             json_receiver=self._json_receiver,
         )
@@ -9,6 +9,8 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
+from fnllm.caching.base import CacheMetadataPolicy
+
 from .json_strategy import JsonStrategy
 from .retry_strategy import RetryStrategy
 
@@ -34,6 +36,26 @@ class Config(BaseModel, frozen=True, extra="allow"):
         description="The maximum concurrency. This is the number of concurrent requests that can be made at once.",
     )
 
+    adaptive_concurrency: bool = Field(
+        default=False,
+        description="Adapt the concurrency (up to max_concurrency) to the request latency and rate-limit errors.",
+    )
+
+    priority_scheduling: bool = Field(
+        default=False,
+        description="Admit requests into the rate limits by their `priority`, rather than (roughly) first-come first-served.",
+    )
+
+    priority_aging_interval: float = Field(
+        default=10.0,
+        description="With priority scheduling, the number of seconds after which a waiting request is promoted by one priority level.",
+    )
+
+    fair_share_weights: dict[str, float] | None = Field(
+        default=None,
+        description="Share the rate limits between child LLMs by name, with these weights (unlisted children weigh 1). None disables fair sharing.",
+    )
+
     tokens_per_minute: int | Literal["auto"] | None = Field(
         default=None,
         description="The max number of tokens per minute. (None=no limit; 'auto'=reactive tpm)",
@@ -48,6 +70,21 @@ class Config(BaseModel, frozen=True, extra="allow"):
         default=True, description="Use burst mode when submitting requests."
     )
 
+    shared_limits_path: str | None = Field(
+        default=None,
+        description="A SQLite database file through which the processes of a host share the RPM/TPM limits. None keeps the limits per process.",
+    )
+
+    shared_limits_key: str | None = Field(
+        default=None,
+        description="The name of the shared RPM/TPM limits (defaults to the deployment or model); processes with the same key split the limits.",
+    )
+
+    remote_limits_address: str | None = Field(
+        default=None,
+        description="The 'host:port' of a limiter coordinator through which processes across hosts share the RPM/TPM limits (see `LimiterCoordinator`). None keeps the limits local.",
+    )
+
     json_strategy: JsonStrategy = Field(
         default=JsonStrategy.VALID,
         description="The strategy to use for JSON parsing.",
@@ -57,3 +94,13 @@ class Config(BaseModel, frozen=True, extra="allow"):
         default=RetryStrategy.EXPONENTIAL_BACKOFF,
         description="The retry strategy to use for the LLM service.",
     )
+
+    cache_metadata_policy: CacheMetadataPolicy = Field(
+        default=CacheMetadataPolicy.FULL,
+        description="How much metadata to write along with cached responses.",
+    )
+
+    cache_content_store: bool = Field(
+        default=False,
+        description="Whether to store large cache metadata strings (e.g. shared system prompts) once, referenced by hash.",
+    )
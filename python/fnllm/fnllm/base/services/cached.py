@@ -4,11 +4,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Generic, cast
 
 from typing_extensions import Unpack
 
+from fnllm.caching.base import CacheMetadataPolicy
 from fnllm.types.generics import (
     THistoryEntry,
     TInput,
@@ -23,7 +25,9 @@ from .decorator import LLMDecorator
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
+    from fnllm.base.services.semantic_cache import SemanticCache, SemanticMatch
     from fnllm.caching import Cache
+    from fnllm.caching.content import ContentStore
     from fnllm.events import LLMEvents
     from fnllm.types.io import LLMInput
 
@@ -41,6 +45,18 @@ class CacheAdapter(ABC, Generic[TInput, TOutput]):
     ) -> dict[str, Any]:
         """Get the cache metadata from the prompt and kwargs."""
 
+    def build_cache_key_from_data(
+        self, prompt: TInput, kwargs: LLMInput[Any, Any, Any], data: dict[str, Any]
+    ) -> str:
+        """Build a cache key from the cache input data (as returned by `get_cache_input_data`). Override this to avoid building the input data twice per request."""
+        return self.build_cache_key(prompt, kwargs)
+
+    def get_semantic_cache_input(
+        self, prompt: TInput, kwargs: LLMInput[Any, Any, Any], data: dict[str, Any]
+    ) -> tuple[str, str] | None:
+        """Get the `(scope, text)` to look up in a semantic cache (the normalized prompt text, and a key of everything else that must match exactly). Returns None if the request does not support semantic caching."""
+        return None
+
     @abstractmethod
     def wrap_output(
         self,
@@ -59,7 +75,19 @@ class Cached(
     LLMDecorator[TOutput, THistoryEntry],
     Generic[TInput, TOutput, THistoryEntry, TModelParameters],
 ):
-    """A base class for a cache-interacting LLM."""
+    """
+    A base class for a cache-interacting LLM.
+
+    Concurrent requests with the same cache key are coalesced: the first request invokes the LLM, and the others wait
+    for its result (and are reported as cache hits) instead of making their own calls.
+
+    When a `semantic_cache` is provided, requests that miss the cache are also looked up by prompt similarity, unless
+    they opt out with `semantic_cache=False`.
+
+    When a `content_store` is provided, large strings in the cache metadata (e.g. system prompts shared by many
+    requests) are stored once in it, and referenced by hash. The `metadata_policy` controls how much metadata is
+    written at all.
+    """
 
     def __init__(
         self,
@@ -67,11 +95,18 @@ class Cached(
         cache: Cache,
         events: LLMEvents,
         cache_adapter: CacheAdapter[TInput, TOutput],
+        semantic_cache: SemanticCache | None = None,
+        content_store: ContentStore | None = None,
+        metadata_policy: CacheMetadataPolicy = CacheMetadataPolicy.FULL,
     ):
         """Create a new CachingLLM."""
         self._events = events
         self._cache = cache
         self._cache_adapter = cache_adapter
+        self._semantic_cache = semantic_cache
+        self._content_store = content_store
+        self._metadata_policy = metadata_policy
+        self._inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
 
     def child(
         self, name: str
@@ -81,6 +116,11 @@ class Cached(
             cache=self._cache.child(name),
             events=self._events,
             cache_adapter=self._cache_adapter,
+            semantic_cache=self._semantic_cache.child(name)
+            if self._semantic_cache is not None
+            else None,
+            content_store=self._content_store,
+            metadata_policy=self._metadata_policy,
         )
 
     def _dump_output(self, output: TOutput) -> dict[str, Any]:
@@ -96,7 +136,6 @@ class Cached(
         """Execute the LLM with a cache."""
 
         async def invoke(prompt: TInput, **kwargs: Unpack[LLMInput[Any, Any, Any]]):
-            key = self._cache_adapter.build_cache_key(prompt, kwargs)
             name = kwargs.get("name")
             bypass_cache = kwargs.get("bypass_cache", False)
             bust_cache = kwargs.get("bust_cache", False)
@@ -108,18 +147,17 @@ class Cached(
             if bypass_cache:
                 return await delegate(prompt, **kwargs)
 
-            metadata = self._get_metadata(
-                key=key,
-                data=self._cache_adapter.get_cache_input_data(prompt, kwargs),
-                metadata=cache_metadata,
-            )
+            data = self._cache_adapter.get_cache_input_data(prompt, kwargs)
+            key = self._cache_adapter.build_cache_key_from_data(prompt, kwargs, data)
 
             #
             # If we're busting the cache, invoke the LLM, write the result,  and don't bother checking for collisions
             #
             if bust_cache:
                 result = await delegate(prompt, **kwargs)
-                await self._cache.set(key, self._dump_output(result.output), metadata)
+                await self._write(
+                    key, self._dump_output(result.output), data, cache_metadata
+                )
                 return result
 
             #
@@ -127,43 +165,134 @@ class Cached(
             #
             cached = await self._cache.get(key)
             if cached is not None:
-                await self._events.on_cache_hit(key, name)
-                output = self._cache_adapter.wrap_output(prompt, kwargs, cached)
-                return LLMOutput(output=output, cache_hit=True)
-
-            #
-            # If we don't have a cache hit, invoke the LLM
-            #
-            result = await delegate(prompt, **kwargs)
+                return await self._cache_hit(key, name, prompt, kwargs, cached)
 
             #
-            # Check for inflight collisions
+            # If the same request is already inflight, wait for its result instead of invoking the LLM
             #
-            cached = await self._cache.get(key)
+            cached = await self._await_inflight(key)
             if cached is not None:
-                await self._events.on_cache_hit(key, name)
-                output = self._cache_adapter.wrap_output(prompt, kwargs, cached)
-                return LLMOutput(output=output, cache_hit=True)
+                return await self._cache_hit(key, name, prompt, kwargs, cached)
 
-            #
-            # Write out to the cache
-            #
-            await self._events.on_cache_miss(key, name)
-            await self._cache.set(key, self._dump_output(result.output), metadata)
+            inflight = asyncio.get_running_loop().create_future()
+            self._inflight[key] = inflight
+            try:
+                #
+                # Check the semantic cache for a near-duplicate request (only once per inflight key)
+                #
+                match = await self._match_semantic(prompt, kwargs, data)
+                if match is not None and match.key is not None:
+                    cached = await self._cache.get(match.key)
+                    if cached is not None:
+                        inflight.set_result(cached)
+                        return await self._cache_hit(
+                            match.key, name, prompt, kwargs, cached
+                        )
+
+                #
+                # If we don't have a cache hit, invoke the LLM
+                #
+                result = await delegate(prompt, **kwargs)
+
+                #
+                # Check for inflight collisions (e.g. from other processes sharing the cache)
+                #
+                cached = await self._cache.get(key)
+                if cached is not None:
+                    inflight.set_result(cached)
+                    return await self._cache_hit(key, name, prompt, kwargs, cached)
+
+                #
+                # Write out to the cache
+                #
+                await self._events.on_cache_miss(key, name)
+                output = self._dump_output(result.output)
+                await self._write(key, output, data, cache_metadata)
+                inflight.set_result(output)
+                if match is not None and self._semantic_cache is not None:
+                    await self._semantic_cache.add(match, key)
+            except asyncio.CancelledError:
+                inflight.cancel()
+                raise
+            except BaseException as e:
+                if not inflight.done():
+                    inflight.set_exception(e)
+                    # mark the exception as retrieved, in case nobody is waiting on it
+                    inflight.exception()
+                raise
+            finally:
+                if self._inflight.get(key) is inflight:
+                    del self._inflight[key]
 
             return result
 
         return cast(Any, invoke)
 
+    async def _await_inflight(self, key: str) -> dict[str, Any] | None:
+        """Wait for the result of an inflight request with the same key, if there is one."""
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # the inflight request was cancelled; retry (or take over) the request
+                if inflight.cancelled():
+                    continue
+                raise
+        return None
+
+    async def _match_semantic(
+        self, prompt: TInput, kwargs: LLMInput[Any, Any, Any], data: dict[str, Any]
+    ) -> SemanticMatch | None:
+        """Look up a request in the semantic cache, if enabled."""
+        if self._semantic_cache is None or not kwargs.get("semantic_cache", True):
+            return None
+        semantic_input = self._cache_adapter.get_semantic_cache_input(
+            prompt, kwargs, data
+        )
+        if semantic_input is None:
+            return None
+        return await self._semantic_cache.match(*semantic_input)
+
+    async def _cache_hit(
+        self,
+        key: str,
+        name: str | None,
+        prompt: TInput,
+        kwargs: LLMInput[Any, Any, Any],
+        cached: dict[str, Any],
+    ) -> LLMOutput[TOutput, Any, THistoryEntry]:
+        await self._events.on_cache_hit(key, name)
+        output = self._cache_adapter.wrap_output(prompt, kwargs, cached)
+        return LLMOutput(output=output, cache_hit=True)
+
+    async def _write(
+        self,
+        key: str,
+        output: dict[str, Any],
+        data: dict[str, Any],
+        custom_metadata: dict[str, Any] | None,
+    ) -> None:
+        """Write an output into the cache, with metadata according to the metadata policy."""
+        metadata = self._get_metadata(key=key, data=data, metadata=custom_metadata)
+        if metadata is not None and self._content_store is not None:
+            metadata = await self._content_store.compact(metadata)
+        await self._cache.set(key, output, metadata)
+
     def _get_metadata(
         self,
         *,
         key: str,
         data: dict[str, Any],
         metadata: dict[str, Any] | None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Get the metadata for the cache."""
-        result = {"input": data, "key": key}
+        if self._metadata_policy == CacheMetadataPolicy.NONE:
+            return None
+        result: dict[str, Any] = (
+            {"input": data, "key": key}
+            if self._metadata_policy == CacheMetadataPolicy.FULL
+            else {"key": key}
+        )
         if metadata:
             result["custom"] = metadata
         return result
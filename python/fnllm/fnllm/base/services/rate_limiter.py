@@ -27,7 +27,7 @@ class RateLimiter(
     LLMDecorator[TOutput, THistoryEntry],
     Generic[TInput, TOutput, THistoryEntry, TModelParameters],
 ):
-    """A base class to rate limit the LLM."""
+    """A base class to rate limit the LLM. Requests are attributed to the `flow` (e.g. child LLM name) in the manifests."""
 
     def __init__(
         self,
@@ -35,15 +35,29 @@ class RateLimiter(
         *,
         events: LLMEvents,
         estimator: TokenEstimator[TInput, TJsonModel, THistoryEntry, TModelParameters],
+        flow: str | None = None,
     ):
         """Create a new BaseRateLimitLLM."""
         self._limiter = limiter
         self._events = events
         self._estimator = estimator
+        self._flow = flow
+
+    def child(
+        self, name: str
+    ) -> RateLimiter[TInput, TOutput, THistoryEntry, TModelParameters]:
+        """Create a child RateLimiter, sharing the limiter under the child flow."""
+        return self.__class__(
+            self._limiter,
+            events=self._events,
+            estimator=self._estimator,
+            flow=name if self._flow is None else f"{self._flow}/{name}",
+        )
 
     async def _handle_post_request_limiting(
         self,
         result: LLMOutput[TOutput, TJsonModel, THistoryEntry],
+        priority: int = 0,
     ) -> None:
         reconciliation = await self._limiter.reconcile(output=result)
         if reconciliation is not None:
@@ -52,7 +66,9 @@ class RateLimiter(
             # If we didn't get an explicit reconciliation, try to adjust the usage based on the actual output tokens
             diff = result.metrics.tokens_diff
             if diff > 0:
-                manifest = Manifest(post_request_tokens=diff)
+                manifest = Manifest(
+                    post_request_tokens=diff, priority=priority, flow=self._flow
+                )
                 # consume the token difference
                 async with self._limiter.use(manifest):
                     await self._events.on_post_limit(manifest)
@@ -68,7 +84,12 @@ class RateLimiter(
         async def invoke(prompt: TInput, **args: Unpack[LLMInput[Any, Any, Any]]):
             estimated_input_tokens = self._estimator(prompt, args)
 
-            manifest = Manifest(request_tokens=estimated_input_tokens)
+            manifest = Manifest(
+                request_tokens=estimated_input_tokens,
+                priority=args.get("priority", 0),
+                deadline=args.get("deadline"),
+                flow=self._flow,
+            )
             try:
                 async with self._limiter.use(manifest):
                     await self._events.on_limit_acquired(manifest)
@@ -77,7 +98,7 @@ class RateLimiter(
                 await self._events.on_limit_released(manifest)
 
             result.metrics.estimated_input_tokens = estimated_input_tokens
-            await self._handle_post_request_limiting(result)
+            await self._handle_post_request_limiting(result, manifest.priority)
 
             return result
 
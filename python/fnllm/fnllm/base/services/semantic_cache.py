@@ -0,0 +1,188 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Semantic (near-duplicate) cache lookups."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from fnllm.caching.base import Cache
+    from fnllm.types.generalized import EmbeddingsLLM
+
+_log = logging.getLogger(__name__)
+
+_INITIAL_CAPACITY = 64
+
+SEMANTIC_INDEX_NAMESPACE = ".fnllm-semantic"
+"""The child cache holding the index entries (reserved, so the store can be shared with the response cache)."""
+
+
+@dataclass(frozen=True)
+class SemanticMatch:
+    """The result of a semantic cache lookup."""
+
+    scope: str
+    """The scope of the lookup (entries only match within the same scope)."""
+
+    embedding: npt.NDArray[np.float32]
+    """The normalized embedding of the looked up text."""
+
+    key: str | None = None
+    """The cache key of the nearest entry, if its similarity is above the threshold."""
+
+    similarity: float = 0.0
+    """The cosine similarity of the nearest entry."""
+
+
+class SemanticCacheIndex:
+    """An in-memory nearest-neighbour index over normalized embeddings."""
+
+    def __init__(self) -> None:
+        """Create a new SemanticCacheIndex."""
+        self._keys: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._vectors: npt.NDArray[np.float32] | None = None
+
+    def __len__(self) -> int:
+        """Get the number of indexed entries."""
+        return len(self._keys)
+
+    def add(self, key: str, vector: npt.NDArray[np.float32]) -> None:
+        """Index a normalized vector. Vectors with a different dimension than the indexed ones are ignored."""
+        if self._vectors is None:
+            self._vectors = np.empty((_INITIAL_CAPACITY, vector.shape[0]), np.float32)
+        elif vector.shape[0] != self._vectors.shape[1]:
+            return
+
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self._keys)
+            if row == self._vectors.shape[0]:
+                self._vectors = np.concatenate([
+                    self._vectors,
+                    np.empty_like(self._vectors),
+                ])
+            self._keys.append(key)
+            self._rows[key] = row
+        self._vectors[row] = vector
+
+    def search(self, vector: npt.NDArray[np.float32]) -> tuple[str, float] | None:
+        """Find the nearest indexed entry (by cosine similarity) to a normalized vector."""
+        if self._vectors is None or vector.shape[0] != self._vectors.shape[1]:
+            return None
+        similarities = self._vectors[: len(self._keys)] @ vector
+        row = int(np.argmax(similarities))
+        return self._keys[row], float(similarities[row])
+
+
+class SemanticCache:
+    """
+    A semantic cache layer, used by `Cached` to serve near-duplicate requests.
+
+    Prompts are embedded with an embeddings LLM, and looked up in a nearest-neighbour index of the prompts of the
+    cached responses. Responses whose prompt similarity is above the `threshold` are served as cache hits. Index
+    entries are persisted into the `SEMANTIC_INDEX_NAMESPACE` child of `cache` (which can be the response cache), and
+    loaded on first use.
+    """
+
+    def __init__(
+        self,
+        cache: Cache,
+        embeddings_llm: EmbeddingsLLM[Any, Any, Any],
+        *,
+        threshold: float = 0.95,
+    ):
+        """Create a new SemanticCache."""
+        self._cache = cache
+        self._entries: Cache | None = None
+        self._embeddings_llm = embeddings_llm
+        self._threshold = threshold
+        self._indexes: dict[str, SemanticCacheIndex] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    def child(self, name: str) -> SemanticCache:
+        """Create a child semantic cache."""
+        return SemanticCache(
+            self._cache.child(name), self._embeddings_llm, threshold=self._threshold
+        )
+
+    async def match(self, scope: str, text: str) -> SemanticMatch | None:
+        """Find the cache key of the nearest previously cached prompt. Returns None if the text cannot be embedded."""
+        await self._load()
+        try:
+            result = await self._embeddings_llm([text])
+        except Exception:  # noqa: BLE001
+            # the semantic cache is best-effort: fall back to exact cache hits
+            _log.warning("semantic cache lookup failed", exc_info=True)
+            return None
+
+        embeddings = result.output.embeddings
+        if not embeddings:
+            return None
+
+        embedding = _normalize(embeddings[0])
+        index = self._indexes.get(scope)
+        nearest = index.search(embedding) if index is not None else None
+        if nearest is None or nearest[1] < self._threshold:
+            return SemanticMatch(scope=scope, embedding=embedding)
+        return SemanticMatch(
+            scope=scope, embedding=embedding, key=nearest[0], similarity=nearest[1]
+        )
+
+    async def add(self, match: SemanticMatch, key: str) -> None:
+        """Index the cache key of a response to the prompt of a (missed) lookup."""
+        self._index(match.scope).add(key, match.embedding)
+        await self._index_entries().set(
+            key, {"scope": match.scope, "embedding": match.embedding.tolist()}
+        )
+
+    async def _load(self) -> None:
+        """Load the persisted index entries."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                async for key, entry in self._index_entries().iter_entries():
+                    # skip the entries of child caches
+                    if "/" in key:
+                        continue
+                    result = entry["result"]
+                    self._index(result["scope"]).add(
+                        key, np.asarray(result["embedding"], np.float32)
+                    )
+            except NotImplementedError:
+                _log.warning(
+                    "cache %s cannot be iterated, the semantic cache index will not be loaded",
+                    type(self._cache).__name__,
+                )
+            self._loaded = True
+
+    def _index_entries(self) -> Cache:
+        """Get the child cache of the index entries (created on first use)."""
+        if self._entries is None:
+            self._entries = self._cache.child(SEMANTIC_INDEX_NAMESPACE)
+        return self._entries
+
+    def _index(self, scope: str) -> SemanticCacheIndex:
+        index = self._indexes.get(scope)
+        if index is None:
+            index = self._indexes[scope] = SemanticCacheIndex()
+        return index
+
+
+def _normalize(vector: list[float]) -> npt.NDArray[np.float32]:
+    """Normalize a vector to unit length, so dot products are cosine similarities."""
+    result = np.asarray(vector, np.float32)
+    norm = np.linalg.norm(result)
+    return result / norm if norm > 0 else result
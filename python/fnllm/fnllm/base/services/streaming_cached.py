@@ -0,0 +1,124 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Cached streaming LLM Implementation."""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Any, Generic, cast
+
+from typing_extensions import Unpack
+
+from fnllm.caching.base import CacheMetadataPolicy
+from fnllm.types.generics import (
+    THistoryEntry,
+    TInput,
+    TJsonModel,
+    TModelParameters,
+    TOutput,
+)
+
+from .cached import CacheAdapter, Cached
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from fnllm.caching import Cache
+    from fnllm.caching.content import ContentStore
+    from fnllm.events import LLMEvents
+    from fnllm.types.io import LLMInput, LLMOutput
+
+
+class StreamingCacheAdapter(CacheAdapter[TInput, TOutput]):
+    """A cache adapter for streaming outputs, which can only be dumped once their stream completes."""
+
+    @abstractmethod
+    def record_output(
+        self,
+        output: TOutput,
+        on_complete: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> TOutput:
+        """Wrap a streaming output, so its recorded stream is dumped to `on_complete` once the stream completes."""
+
+    def dump_raw_model(self, output: TOutput) -> dict[str, Any]:
+        """Streaming outputs are dumped by `record_output`."""
+        msg = "Streaming outputs can only be dumped once their stream completes."
+        raise NotImplementedError(msg)
+
+
+class StreamingCached(
+    Cached[TInput, TOutput, THistoryEntry, TModelParameters],
+    Generic[TInput, TOutput, THistoryEntry, TModelParameters],
+):
+    """
+    A cache-interacting streaming LLM.
+
+    Streams are written to the cache once they are fully consumed (streams that are closed early or fail are not
+    cached), and cache hits are replayed from the recorded stream without invoking the LLM.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: Cache,
+        events: LLMEvents,
+        cache_adapter: StreamingCacheAdapter[TInput, TOutput],
+        content_store: ContentStore | None = None,
+        metadata_policy: CacheMetadataPolicy = CacheMetadataPolicy.FULL,
+    ):
+        """Create a new StreamingCached."""
+        super().__init__(
+            cache=cache,
+            events=events,
+            cache_adapter=cache_adapter,
+            content_store=content_store,
+            metadata_policy=metadata_policy,
+        )
+        self._streaming_cache_adapter = cache_adapter
+
+    def child(
+        self, name: str
+    ) -> StreamingCached[TInput, TOutput, THistoryEntry, TModelParameters]:
+        """Create a child StreamingCached instance."""
+        return StreamingCached(
+            cache=self._cache.child(name),
+            events=self._events,
+            cache_adapter=self._streaming_cache_adapter,
+            content_store=self._content_store,
+            metadata_policy=self._metadata_policy,
+        )
+
+    def decorate(
+        self,
+        delegate: Callable[
+            ..., Awaitable[LLMOutput[TOutput, TJsonModel, THistoryEntry]]
+        ],
+    ) -> Callable[..., Awaitable[LLMOutput[TOutput, TJsonModel, THistoryEntry]]]:
+        """Execute the streaming LLM with a cache."""
+
+        async def invoke(prompt: TInput, **kwargs: Unpack[LLMInput[Any, Any, Any]]):
+            name = kwargs.get("name")
+
+            if kwargs.get("bypass_cache"):
+                return await delegate(prompt, **kwargs)
+
+            data = self._cache_adapter.get_cache_input_data(prompt, kwargs)
+            key = self._cache_adapter.build_cache_key_from_data(prompt, kwargs, data)
+
+            if not kwargs.get("bust_cache"):
+                cached = await self._cache.get(key)
+                if cached is not None:
+                    return await self._cache_hit(key, name, prompt, kwargs, cached)
+
+            await self._events.on_cache_miss(key, name)
+            result = await delegate(prompt, **kwargs)
+
+            async def write(recorded: dict[str, Any]) -> None:
+                await self._write(key, recorded, data, kwargs.get("cache_metadata"))
+
+            result.output = self._streaming_cache_adapter.record_output(
+                result.output, write
+            )
+            return result
+
+        return cast(Any, invoke)
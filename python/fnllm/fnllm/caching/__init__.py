@@ -2,7 +2,32 @@
 
 """Caching base package."""
 
-from .base import Cache
+from .base import Cache, CacheMetadataPolicy, CacheStats, EvictionPolicy
+from .content import ContentStore
 from .file import FileCache
+from .memory import MemoryCache
+from .serializers import (
+    CacheSerializer,
+    CompactCacheSerializer,
+    JsonCacheSerializer,
+)
+from .snapshot import export_snapshot, load_snapshot
+from .sqlite import SqliteCache
+from .tiered import TieredCache
 
-__all__ = ["Cache", "FileCache"]
+__all__ = [
+    "Cache",
+    "CacheMetadataPolicy",
+    "CacheSerializer",
+    "CacheStats",
+    "CompactCacheSerializer",
+    "ContentStore",
+    "EvictionPolicy",
+    "FileCache",
+    "JsonCacheSerializer",
+    "MemoryCache",
+    "SqliteCache",
+    "TieredCache",
+    "export_snapshot",
+    "load_snapshot",
+]
@@ -5,10 +5,72 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 from abc import ABC, abstractmethod
-from typing import Any
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping, Sequence
+
+# Reused across calls (`json.dumps` builds a new encoder whenever options are passed); the output is identical to
+# `json.dumps(data, sort_keys=True)`, so existing cache keys stay valid.
+_KEY_ENCODER = json.JSONEncoder(sort_keys=True, check_circular=False)
+
+EVICTION_TARGET_RATIO: Final[float] = 0.9
+"""When a persistent cache exceeds its byte quota, entries are evicted until it is back under this fraction of the quota."""
+
+
+class EvictionPolicy(str, Enum):
+    """The order in which entries are evicted when a cache exceeds its quota."""
+
+    LRU = "lru"
+    """Evict the least recently used entries first."""
+
+    LFU = "lfu"
+    """Evict the least frequently used entries first (ties are broken by recency)."""
+
+
+class CacheMetadataPolicy(str, Enum):
+    """How much metadata is written along with cached LLM responses."""
+
+    FULL = "full"
+    """Write the cache key, the full request input (messages and parameters) and the custom metadata."""
+
+    HASHED = "hashed"
+    """Write the cache key (a hash of the request input) and the custom metadata, without the request input."""
+
+    NONE = "none"
+    """Write no metadata."""
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """A snapshot of the size and usage of a cache."""
+
+    entries: int
+    """The number of entries in the cache."""
+
+    size: int
+    """The (approximate) size of the entries, in bytes."""
+
+    hits: int = 0
+    """The number of reads that found an entry."""
+
+    misses: int = 0
+    """The number of reads that did not find an entry."""
+
+    evictions: int = 0
+    """The number of entries evicted to stay within the cache quota."""
+
+    @property
+    def hit_ratio(self) -> float:
+        """The fraction of reads that found an entry."""
+        reads = self.hits + self.misses
+        return self.hits / reads if reads else 0.0
 
 
 class Cache(ABC):
@@ -47,9 +109,41 @@ class Cache(ABC):
     def child(self, key: str) -> Cache:
         """Create a child cache."""
 
+    async def stats(self) -> CacheStats:
+        """Get the size and usage statistics of the cache."""
+        raise NotImplementedError
+
+    def iter_entries(self) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        Iterate over the entries of the cache (including child caches).
+
+        Entries are yielded as `(key, {"result": ..., "metadata": ...})` pairs. The keys of child cache entries are
+        prefixed with the child path (e.g. `child/key`), so they can be written back through this cache.
+        """
+        raise NotImplementedError
+
+    async def has_many(self, keys: Sequence[str]) -> list[bool]:
+        """Check if the cache has several values. Results are returned in the same order as `keys`."""
+        return list(await asyncio.gather(*[self.has(key) for key in keys]))
+
+    async def get_many(self, keys: Sequence[str]) -> list[Any | None]:
+        """Retrieve several values from the cache. Results are returned in the same order as `keys`."""
+        return list(await asyncio.gather(*[self.get(key) for key in keys]))
+
+    async def set_many(
+        self,
+        values: Mapping[str, Any],
+        metadata: Mapping[str, dict[str, Any] | None] | None = None,
+    ) -> None:
+        """Write several values into the cache, with optional per-key metadata."""
+        metadata = metadata or {}
+        await asyncio.gather(*[
+            self.set(key, value, metadata.get(key)) for key, value in values.items()
+        ])
+
     def create_key(self, data: Any, *, prefix: str | None = None) -> str:
         """Create a custom key by hashing the data. Returns `{data_hash}_v{strategy_version}` or `{prefix}_{data_hash}_v{strategy_version}`."""
-        data_hash = _hash(json.dumps(data, sort_keys=True))
+        data_hash = _hash(_KEY_ENCODER.encode(data))
 
         if prefix is not None:
             return f"{prefix}_{data_hash}_v{self.__cache_strategy_version__}"
@@ -2,16 +2,48 @@
 
 """Azure Blob Storage Cache."""
 
+import asyncio
 import json
+import logging
 import re
+import threading
 from contextlib import suppress
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+from azure.core.exceptions import (
+    HttpResponseError,
+    ResourceExistsError,
+    ResourceNotFoundError,
+)
 from azure.storage.blob import BlobClient, BlobServiceClient, ContainerClient
 
-from .base import Cache
+from .base import EVICTION_TARGET_RATIO, Cache, CacheStats, EvictionPolicy
+from .executor import run_blocking
+from .serializers import CacheSerializer, InvalidCacheEntryError, JsonCacheSerializer
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Mapping,
+        Sequence,
+    )
+    from concurrent.futures import Executor
+
+    from azure.storage.blob import BlobProperties
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+_log = logging.getLogger(__name__)
+
+_DELETE_BATCH_SIZE = 256
+"""The maximum number of sub-requests in an Azure Blob Storage batch."""
+
+_READ_BATCH_SIZE = 256
 
 
 class InvalidBlobContainerNameError(ValueError):
@@ -35,6 +67,16 @@ class BlobCache(Cache):
     The Blob-Storage implementation.
 
     Note that this implementation does not track audit fields "created" and "accessed", since these are natively available in Azure Blob Storage.
+    Blob client calls are performed in a thread pool so that cache access does not block the event loop.
+    Entries are written with the given `serializer` (pretty-printed JSON by default).
+
+    `clear` and `sweep` are scoped to this cache's path prefix (including child caches); they list the blobs under the
+    prefix and delete them with batch requests of up to 256 blobs, running up to `max_batch_concurrency` batches at once.
+
+    With `max_bytes`, the blobs under this cache's path prefix (including child caches) are capped at that many bytes:
+    when a write exceeds the quota, the oldest blobs are deleted until the cache is back under `EVICTION_TARGET_RATIO`
+    of the quota. Reads do not update any blob property, so blobs are evicted in write order (`EvictionPolicy.LFU`
+    is not supported). The running size is approximate, and re-synchronized with a listing on every eviction.
     """
 
     _connection_string: str | None
@@ -51,8 +93,17 @@ class BlobCache(Cache):
         encoding: str | None = None,
         path_prefix: str | None = None,
         storage_account_blob_url: str | None = None,
+        executor: "Executor | None" = None,
+        serializer: CacheSerializer | None = None,
+        max_batch_concurrency: int = 16,
+        max_bytes: int | None = None,
+        eviction_policy: EvictionPolicy = EvictionPolicy.LRU,
     ):
         """Create a new BlobStorage instance."""
+        if eviction_policy != EvictionPolicy.LRU:
+            msg = f"BlobCache does not support the {eviction_policy.value} eviction policy."
+            raise InvalidBlobCacheArgumentsError(msg)
+
         if connection_string:
             self._blob_service_client = BlobServiceClient.from_connection_string(
                 connection_string
@@ -75,6 +126,15 @@ class BlobCache(Cache):
         self._connection_string = connection_string
         self._path_prefix = path_prefix or ""
         self._storage_account_blob_url = storage_account_blob_url
+        self._executor = executor
+        self._serializer = serializer or JsonCacheSerializer(encoding=self._encoding)
+        self._max_batch_concurrency = max_batch_concurrency
+        self._max_bytes = max_bytes
+        self._quota_lock = threading.Lock()
+        self._usage: int | None = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
         self._storage_account_name = (
             storage_account_blob_url.split("//")[1].split(".")[0]
             if storage_account_blob_url
@@ -114,49 +174,225 @@ class BlobCache(Cache):
     async def has(self, key: str) -> bool:
         """Check if a key exists in the cache."""
         key = self._keyname(key)
-        blob_client = self.blob_client(key)
-        return blob_client.exists()
+        return await run_blocking(self._executor, self.blob_client(key).exists)
 
     async def get(self, key: str) -> Any | None:
         """Get a value from the cache."""
+        result = await run_blocking(self._executor, self._get, key)
+        if result is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return result
+
+    async def set(
+        self, key: str, value: Any, metadata: dict[str, Any] | None = None
+    ) -> None:
+        """Set a value in the cache."""
+        await run_blocking(self._executor, self._set, key, value, metadata)
+
+    async def remove(self, key: str) -> None:
+        """Delete a key from the cache."""
+        key = self._keyname(key)
+        await run_blocking(self._executor, self.blob_client(key).delete_blob)
+
+    async def clear(self) -> None:
+        """Clear the cache (including child caches)."""
+        names = await run_blocking(
+            self._executor, lambda: [blob.name for blob in self._list_blobs()]
+        )
+        await self._delete_blobs(names)
+        self._usage = None
+
+    async def sweep(self, age: int, *, remove_unreadable: bool = False) -> None:
+        """
+        Sweep the cache (including child caches) for blobs that have not been used in `age` seconds.
+
+        Blobs are considered used when they are written, or read when last access time tracking is enabled on the
+        storage account. With `remove_unreadable`, every remaining blob is downloaded to check that it can be parsed.
+        """
+        threshold = datetime.now(timezone.utc) - timedelta(seconds=age)
+        blobs = await run_blocking(self._executor, self._list_blobs)
+        stale = {blob.name for blob in blobs if _last_used(blob) < threshold}
+
+        if remove_unreadable:
+            remaining = [blob.name for blob in blobs if blob.name not in stale]
+            readable = await self._map_bounded(
+                lambda name: run_blocking(self._executor, self._is_readable, name),
+                remaining,
+            )
+            stale.update(
+                name for name, ok in zip(remaining, readable, strict=True) if not ok
+            )
+
+        _log.debug("sweeping %d blobs from %s", len(stale), self.container_name)
+        await self._delete_blobs(sorted(stale))
+        self._usage = None
+
+    async def stats(self) -> CacheStats:
+        """Get the size and usage statistics of the blobs under this cache's path prefix (including child caches)."""
+        blobs = await run_blocking(self._executor, self._list_blobs)
+        return CacheStats(
+            entries=len(blobs),
+            size=sum(blob.size for blob in blobs),
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+    async def iter_entries(self) -> "AsyncIterator[tuple[str, dict[str, Any]]]":
+        """Iterate over the entries of the cache (including child caches), downloading them with bounded concurrency."""
+        names = await run_blocking(
+            self._executor, lambda: [blob.name for blob in self._list_blobs()]
+        )
+        start = len(self._path_prefix) + 1 if self._path_prefix else 0
+        for i in range(0, len(names), _READ_BATCH_SIZE):
+            batch = names[i : i + _READ_BATCH_SIZE]
+            entries = await self._map_bounded(
+                lambda name: run_blocking(self._executor, self._read_entry, name),
+                batch,
+            )
+            for name, entry in zip(batch, entries, strict=True):
+                if entry is not None:
+                    yield (
+                        name[start:],
+                        {"result": entry["result"], "metadata": entry.get("metadata")},
+                    )
+
+    async def has_many(self, keys: "Sequence[str]") -> list[bool]:
+        """Check if the cache has several values."""
+        return await self._map_bounded(self.has, keys)
+
+    async def get_many(self, keys: "Sequence[str]") -> list[Any | None]:
+        """Retrieve several values from the cache."""
+        return await self._map_bounded(self.get, keys)
+
+    async def set_many(
+        self,
+        values: "Mapping[str, Any]",
+        metadata: "Mapping[str, dict[str, Any] | None] | None" = None,
+    ) -> None:
+        """Write several values into the cache."""
+        metadata = metadata or {}
+        await self._map_bounded(
+            lambda key: self.set(key, values[key], metadata.get(key)), list(values)
+        )
+
+    async def _map_bounded(
+        self, fn: "Callable[[K], Awaitable[T]]", keys: "Sequence[K]"
+    ) -> list[T]:
+        """
+        Apply a blob operation to several keys with bounded concurrency.
+
+        Azure Blob Storage has no multi-get API, so batches fan out over the I/O pool without flooding it.
+        """
+        semaphore = asyncio.Semaphore(self._max_batch_concurrency)
+
+        async def run(key: K) -> T:
+            async with semaphore:
+                return await fn(key)
+
+        return list(await asyncio.gather(*[run(key) for key in keys]))
+
+    async def _delete_blobs(self, names: list[str]) -> None:
+        """Delete blobs with concurrent batch requests."""
+        batches = [
+            names[i : i + _DELETE_BATCH_SIZE]
+            for i in range(0, len(names), _DELETE_BATCH_SIZE)
+        ]
+        await self._map_bounded(
+            lambda batch: run_blocking(self._executor, self._delete_batch, batch),
+            batches,
+        )
+
+    def _delete_batch(self, names: list[str]) -> None:
+        try:
+            responses = self.container_client.delete_blobs(
+                *names, raise_on_any_failure=False
+            )
+        except HttpResponseError:
+            # e.g. accounts with a hierarchical namespace don't support batch requests
+            _log.debug("batch delete is not supported, deleting blobs one by one")
+            for name in names:
+                with suppress(ResourceNotFoundError):
+                    self.blob_client(name).delete_blob()
+            return
+
+        for name, response in zip(names, responses, strict=False):
+            if response.status_code not in (202, 404):
+                _log.warning(
+                    "failed to delete blob %s (status %d)", name, response.status_code
+                )
+
+    def _get(self, key: str) -> Any | None:
+        data = self._read_entry(self._keyname(key))
+        return data["result"] if data is not None else None
+
+    def _read_entry(self, name: str) -> dict[str, Any] | None:
         try:
-            key = self._keyname(key)
-            blob_client = self.blob_client(key)
+            blob_client = self.blob_client(name)
             blob_data = blob_client.download_blob().readall()
         except ResourceNotFoundError:
             return None
         else:
             try:
-                blob_data = blob_data.decode(self._encoding)
-                data = json.loads(blob_data)
-            except json.JSONDecodeError:
+                return self._serializer.loads(blob_data)
+            except (json.JSONDecodeError, InvalidCacheEntryError):
                 return None
             except UnicodeDecodeError:
                 return None
-            else:
-                return data["result"]
 
-    async def set(
-        self, key: str, value: Any, metadata: dict[str, Any] | None = None
-    ) -> None:
-        """Set a value in the cache."""
+    def _set(self, key: str, value: Any, metadata: dict[str, Any] | None) -> None:
         key = self._keyname(key)
-        content = json.dumps(
-            {"result": value, "metadata": metadata}, indent=2, ensure_ascii=False
-        )
+        content = self._serializer.dumps({"result": value, "metadata": metadata})
         blob_client = self.blob_client(key)
-        blob_client.upload_blob(content.encode(self._encoding), overwrite=True)
+        blob_client.upload_blob(content, overwrite=True)
+        self._enforce_quota(len(content))
 
-    async def remove(self, key: str) -> None:
-        """Delete a key from the cache."""
-        key = self._keyname(key)
-        blob_client = self.blob_client(key)
-        blob_client.delete_blob()
+    def _enforce_quota(self, written: int) -> None:
+        """Track the size of the cache, and evict the oldest blobs when it exceeds the quota."""
+        if self._max_bytes is None:
+            return
 
-    async def clear(self) -> None:
-        """Clear the cache."""
-        for blob in [*self.container_client.list_blob_names()]:
-            self.blob_client(blob).delete_blob()
+        with self._quota_lock:
+            if self._usage is None:
+                self._usage = sum(blob.size for blob in self._list_blobs())
+            else:
+                # overwritten blobs are counted twice until the next eviction
+                self._usage += written
+            if self._usage <= self._max_bytes:
+                return
+
+            blobs = sorted(self._list_blobs(), key=lambda blob: blob.last_modified)
+            usage = sum(blob.size for blob in blobs)
+            target = int(self._max_bytes * EVICTION_TARGET_RATIO)
+            evicted: list[str] = []
+            for blob in blobs:
+                if usage <= target:
+                    break
+                evicted.append(blob.name)
+                usage -= blob.size
+            _log.debug("evicting %d blobs", len(evicted))
+            for i in range(0, len(evicted), _DELETE_BATCH_SIZE):
+                self._delete_batch(evicted[i : i + _DELETE_BATCH_SIZE])
+            self._evictions += len(evicted)
+            self._usage = usage
+
+    def _list_blobs(self) -> list["BlobProperties"]:
+        """List the blobs under this cache's path prefix."""
+        prefix = f"{self._path_prefix}/" if self._path_prefix else None
+        return list(self.container_client.list_blobs(name_starts_with=prefix))
+
+    def _is_readable(self, name: str) -> bool:
+        """Check if a blob can be parsed as a cache entry."""
+        try:
+            self._serializer.loads(self.blob_client(name).download_blob().readall())
+        except ResourceNotFoundError:
+            return True
+        except (json.JSONDecodeError, InvalidCacheEntryError, UnicodeDecodeError):
+            _log.warning("Cache entry %s is corrupted", name)
+            return False
+        return True
 
     def child(self, key: str) -> "BlobCache":
         """Create a child storage instance."""
@@ -167,6 +403,10 @@ class BlobCache(Cache):
             encoding=self._encoding,
             path_prefix=path,
             storage_account_blob_url=self._storage_account_blob_url,
+            executor=self._executor,
+            serializer=self._serializer,
+            max_batch_concurrency=self._max_batch_concurrency,
+            max_bytes=self._max_bytes,
         )
 
     def _keyname(self, key: str) -> str:
@@ -174,6 +414,13 @@ class BlobCache(Cache):
         return str(Path(self._path_prefix) / key)
 
 
+def _last_used(blob: "BlobProperties") -> datetime:
+    """Get when a blob was last written, or read (when access time tracking is enabled)."""
+    if blob.last_accessed_on is not None:
+        return max(blob.last_modified, blob.last_accessed_on)
+    return blob.last_modified
+
+
 def validate_blob_container_name(container_name: str) -> bool:
     """Check if the provided blob container name is valid based on Azure rules.
 
@@ -0,0 +1,101 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Content-addressed storage of large cached values."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from fnllm.caching.base import Cache
+
+CONTENT_REF: Final[str] = "$content"
+"""The key of the `{"$content": key}` references that replace stored contents."""
+
+CONTENT_STORE_NAMESPACE: Final[str] = ".fnllm-content"
+"""The child cache reserved for the contents stored by LLM response caches."""
+
+
+class ContentStore:
+    """
+    Stores large strings (e.g. shared system prompts in cache metadata) once, keyed by their hash.
+
+    `compact` replaces the strings of a value that are at least `min_size` characters long with
+    `{"$content": key}` references, writing each distinct string to the cache only once. `expand` restores them, e.g.
+    to read back the metadata of the entries listed by `Cache.iter_entries`. Contents can be evicted, swept, or cleared
+    independently of the values referencing them, so `compact` checks the cache for every content it references.
+    """
+
+    def __init__(self, cache: Cache, *, min_size: int = 1024):
+        """Create a new ContentStore."""
+        self._cache = cache
+        self._min_size = min_size
+
+    async def compact(self, value: Any) -> Any:
+        """Replace the large strings of a (JSON-like) value with content references, storing their contents."""
+        contents: dict[str, str] = {}
+        result = self._replace(value, contents)
+        if contents:
+            await self._store(contents)
+        return result
+
+    async def expand(self, value: Any) -> Any:
+        """Replace the content references of a value with their contents. Missing contents are left as references."""
+        refs: set[str] = set()
+        _collect_refs(value, refs)
+        if not refs:
+            return value
+        keys = list(refs)
+        contents = {
+            key: content
+            for key, content in zip(keys, await self._cache.get_many(keys), strict=True)
+            if content is not None
+        }
+        return _restore(value, contents)
+
+    def _replace(self, value: Any, contents: dict[str, str]) -> Any:
+        if isinstance(value, str):
+            if len(value) < self._min_size:
+                return value
+            key = self._cache.create_key(value, prefix="content")
+            contents[key] = value
+            return {CONTENT_REF: key}
+        if isinstance(value, dict):
+            return {k: self._replace(v, contents) for k, v in value.items()}
+        if isinstance(value, list | tuple):
+            return [self._replace(v, contents) for v in value]
+        return value
+
+    async def _store(self, contents: dict[str, str]) -> None:
+        keys = list(contents)
+        exists = await self._cache.has_many(keys)
+        missing = {
+            key: contents[key] for key, e in zip(keys, exists, strict=True) if not e
+        }
+        if missing:
+            await self._cache.set_many(missing)
+
+
+def _is_ref(value: Any) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and CONTENT_REF in value
+
+
+def _collect_refs(value: Any, refs: set[str]) -> None:
+    if _is_ref(value):
+        refs.add(value[CONTENT_REF])
+    elif isinstance(value, dict):
+        for v in value.values():
+            _collect_refs(v, refs)
+    elif isinstance(value, list):
+        for v in value:
+            _collect_refs(v, refs)
+
+
+def _restore(value: Any, contents: dict[str, str]) -> Any:
+    if _is_ref(value):
+        return contents.get(value[CONTENT_REF], value)
+    if isinstance(value, dict):
+        return {k: _restore(v, contents) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_restore(v, contents) for v in value]
+    return value
@@ -0,0 +1,42 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Thread-pool helpers to run blocking cache I/O off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor
+
+T = TypeVar("T")
+
+DEFAULT_MAX_IO_WORKERS = 32
+"""The number of worker threads in the shared cache I/O pool."""
+
+_default_executor: ThreadPoolExecutor | None = None
+
+
+def default_io_executor() -> ThreadPoolExecutor:
+    """Get the bounded thread pool shared by the cache implementations."""
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = ThreadPoolExecutor(
+            max_workers=DEFAULT_MAX_IO_WORKERS,
+            thread_name_prefix="fnllm-cache-io",
+        )
+    return _default_executor
+
+
+async def run_blocking(
+    executor: Executor | None, fn: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Run a blocking function in the given executor (or the shared cache I/O pool)."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor or default_io_executor(), functools.partial(fn, *args, **kwargs)
+    )
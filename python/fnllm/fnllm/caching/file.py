@@ -4,21 +4,189 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import threading
 import time
+from contextlib import suppress
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from fnllm.caching.base import Cache
+from fnllm.caching.base import (
+    EVICTION_TARGET_RATIO,
+    Cache,
+    CacheStats,
+    EvictionPolicy,
+)
+from fnllm.caching.executor import run_blocking
+from fnllm.caching.serializers import (
+    CacheSerializer,
+    InvalidCacheEntryError,
+    JsonCacheSerializer,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
+    from concurrent.futures import Executor
 
 _log = logging.getLogger(__name__)
 
 
+INDEX_FILE_NAME = ".fnllm-index"
+"""The name of the entry index journal kept in each cache directory."""
+
+LAYOUT_FILE_NAME = ".fnllm-layout"
+"""The name of the file recording the shard depth of a sharded cache directory."""
+
+SHARD_DIR_PREFIX = ".fnllm-"
+"""The prefix of hash-prefix shard directory names (e.g. `.fnllm-ab`), reserved so they can't collide with child caches."""
+
+_INDEX_FLUSH_THRESHOLD = 256
+_READ_BATCH_SIZE = 256
+
+
+@dataclass
+class FileCacheIndexEntry:
+    """Index information for a single cache entry."""
+
+    created: float
+    """When the entry was written (epoch seconds)."""
+
+    accessed: float
+    """When the entry was last known to be read or written (epoch seconds)."""
+
+    size: int
+    """The size of the entry on disk, in bytes."""
+
+    hits: int = 0
+    """The number of recorded reads of the entry."""
+
+
+class _FileCacheIndex:
+    """
+    An append-only journal of the entries in a cache directory.
+
+    Writes and removals are appended as JSON lines. Access times (and counts) are buffered in memory and appended in
+    batches, since the entry's modification time remains the source of truth for when it was last read.
+    """
+
+    def __init__(self, path: Path, seed: Callable[[], dict[str, FileCacheIndexEntry]]):
+        self._path = path
+        self._seed = seed
+        self._lock = threading.Lock()
+        self._accessed: dict[str, tuple[float, int]] = {}
+
+    def record_set(self, entries: list[tuple[str, float, int]]) -> None:
+        self._append([["set", key, created, size] for key, created, size in entries])
+
+    def record_remove(self, key: str) -> None:
+        self._append([["remove", key]])
+
+    def record_access(self, key: str, accessed: float) -> None:
+        with self._lock:
+            _, hits = self._accessed.get(key, (0.0, 0))
+            self._accessed[key] = (accessed, hits + 1)
+            should_flush = len(self._accessed) >= _INDEX_FLUSH_THRESHOLD
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            accessed, self._accessed = self._accessed, {}
+        if accessed:
+            self._append([["access", k, t, n] for k, (t, n) in accessed.items()])
+
+    def exists(self) -> bool:
+        return self._path.exists()
+
+    def entries(self) -> dict[str, FileCacheIndexEntry]:
+        """Replay the journal."""
+        self.flush()
+        entries: dict[str, FileCacheIndexEntry] = {}
+        with suppress(FileNotFoundError), self._path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # a torn write, e.g. the process died mid-append
+                    continue
+                match record:
+                    case ["set", str(key), created, size]:
+                        entries[key] = FileCacheIndexEntry(created, created, size)
+                    case ["remove", str(key)]:
+                        entries.pop(key, None)
+                    case ["access", str(key), accessed, *hits] if key in entries:
+                        # older journals don't record access counts
+                        entry = entries[key]
+                        entry.accessed = max(entry.accessed, accessed)
+                        entry.hits += hits[0] if hits else 1
+        return entries
+
+    def rewrite(self, entries: dict[str, FileCacheIndexEntry]) -> None:
+        """Compact the journal so that it only contains the given entries."""
+        with self._lock:
+            self._accessed = {}
+            self._write(entries)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._accessed = {}
+
+    def _append(self, records: list[list[Any]]) -> None:
+        content = "".join(_journal_line(r) for r in records)
+        with self._lock:
+            if not self._path.exists():
+                # seed the journal with the entries written before it existed (e.g. by an older version)
+                self._write(self._seed())
+            with self._path.open("a", encoding="utf-8") as f:
+                f.write(content)
+
+    def _write(self, entries: dict[str, FileCacheIndexEntry]) -> None:
+        tmp_path = self._path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for key, entry in entries.items():
+                f.write(_journal_line(["set", key, entry.created, entry.size]))
+                if entry.accessed > entry.created or entry.hits:
+                    f.write(_journal_line(["access", key, entry.accessed, entry.hits]))
+        tmp_path.replace(self._path)
+
+
 class FileCache(Cache):
-    """The FileCache class."""
+    """
+    The FileCache class.
+
+    Filesystem I/O is performed in a thread pool so that cache access does not block the event loop.
+    By default, a bounded pool shared by all cache instances is used; pass `executor` to size it independently.
+
+    Entries are written with the given `serializer` (pretty-printed JSON by default). Entries written with
+    any of the built-in serializers remain readable when the serializer is changed.
 
-    def __init__(self, cache_path: Path | str, encoding: str | None = None):
+    Each cache directory keeps a lightweight index journal (created/accessed/size per key), which lets `sweep` and
+    `disk_usage` run without opening every entry. With `shard_depth > 0`, entries are spread across nested
+    hash-prefix directories (e.g. `.fnllm-ab/.fnllm-cd/<key>`) to keep directories small. The shard depth is recorded
+    in each cache directory, and when a directory is opened with another `shard_depth`, its entries are migrated (moved)
+    into the new layout.
+
+    With `max_bytes`, each cache directory (i.e. the cache and each of its children) is capped at that many bytes: when
+    a write exceeds the quota, entries are evicted in `eviction_policy` order until the directory is back under
+    `EVICTION_TARGET_RATIO` of the quota. The running size is tracked per process, and re-synchronized with the index
+    on every eviction.
+    """
+
+    def __init__(
+        self,
+        cache_path: Path | str,
+        encoding: str | None = None,
+        *,
+        executor: Executor | None = None,
+        serializer: CacheSerializer | None = None,
+        shard_depth: int = 0,
+        max_bytes: int | None = None,
+        eviction_policy: EvictionPolicy = EvictionPolicy.LRU,
+    ):
         """Initialize the cache."""
         if isinstance(cache_path, str):
             cache_path = Path(cache_path)
@@ -26,6 +194,19 @@ class FileCache(Cache):
         self._cache_path = cache_path
         self._cache_path.mkdir(exist_ok=True, parents=True)
         self._encoding = encoding or "utf-8"
+        self._executor = executor
+        self._serializer = serializer or JsonCacheSerializer(encoding=self._encoding)
+        self._shard_depth = max(shard_depth, 0)
+        self._index = _FileCacheIndex(cache_path / INDEX_FILE_NAME, self._scan_index)
+        self._namespaces: dict[str, FileCache] = {}
+        self._max_bytes = max_bytes
+        self._eviction_policy = eviction_policy
+        self._quota_lock = threading.Lock()
+        self._usage: int | None = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._migrate_layout()
 
     @property
     def root_path(self) -> Path:
@@ -33,71 +214,349 @@ class FileCache(Cache):
         return self._cache_path
 
     async def sweep(self, age: int, *, remove_unreadable: bool = False) -> None:
-        """Sweep the cache for entries older than `age` seconds."""
-        _log.debug("sweeping cache %s", self._cache_path)
-        now = time.time()
-
-        for f in self._cache_path.iterdir():
-            if f.is_dir():
-                continue
+        """
+        Sweep the cache for entries older than `age` seconds.
 
-            try:
-                cache_entry = json.loads(f.read_text(encoding=self._encoding))
-            except json.JSONDecodeError:
-                _log.warning("Cache entry %s is corrupted", f)
-                if remove_unreadable:
-                    _log.debug("removing file %s", f)
-                    f.unlink()
-                continue
-
-            if now - cache_entry["accessed"] > age:
-                _log.debug("removing file %s", f)
-                f.unlink()
+        The entry age is based on the file modification time, which is bumped whenever an entry is read.
+        Only the entries that the index reports as stale are inspected on disk.
+        """
+        await run_blocking(
+            self._executor, self._sweep, age, remove_unreadable=remove_unreadable
+        )
 
     async def has(self, key: str) -> bool:
         """Check if the cache has a value."""
-        return (self._cache_path / key).exists()
+        cache, key = self._resolve(key)
+        return await run_blocking(self._executor, cache.entry_path(key).exists)
 
     async def get(self, key: str) -> Any | None:
         """Retrieve a value from the cache."""
-        path = self._cache_path / key
+        cache, key = self._resolve(key)
+        if cache is not self:
+            return await cache.get(key)
+        result = await run_blocking(self._executor, self._get, key)
+        self._count_reads([result])
+        return result
+
+    async def remove(self, key: str) -> None:
+        """Remove a value from the cache."""
+        cache, key = self._resolve(key)
+        if cache is not self:
+            await cache.remove(key)
+            return
+        await run_blocking(self._executor, self._remove, key)
+
+    async def clear(self) -> None:
+        """Clear the cache."""
+        await run_blocking(self._executor, self._clear)
+
+    async def set(
+        self, key: str, value: Any, metadata: dict[str, Any] | None = None
+    ) -> None:
+        """Write a value into the cache."""
+        cache, key = self._resolve(key)
+        if cache is not self:
+            await cache.set(key, value, metadata)
+            return
+        await run_blocking(self._executor, self._set, key, value, metadata)
+
+    async def has_many(self, keys: Sequence[str]) -> list[bool]:
+        """Check if the cache has several values, in a single I/O job."""
+        if _has_namespaced_keys(keys):
+            return await super().has_many(keys)
+        return await run_blocking(
+            self._executor, lambda: [self.entry_path(key).exists() for key in keys]
+        )
+
+    async def get_many(self, keys: Sequence[str]) -> list[Any | None]:
+        """Retrieve several values from the cache, in a single I/O job."""
+        if _has_namespaced_keys(keys):
+            return await super().get_many(keys)
+        results = await run_blocking(
+            self._executor, lambda: [self._get(key) for key in keys]
+        )
+        self._count_reads(results)
+        return results
+
+    async def set_many(
+        self,
+        values: Mapping[str, Any],
+        metadata: Mapping[str, dict[str, Any] | None] | None = None,
+    ) -> None:
+        """Write several values into the cache, in a single I/O job."""
+        if _has_namespaced_keys(list(values)):
+            await super().set_many(values, metadata)
+            return
+        await run_blocking(self._executor, self._set_many, values, metadata or {})
+
+    async def iter_entries(self) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Iterate over the entries of the cache (including child caches), reading them in batches."""
+        paths = await run_blocking(self._executor, lambda: list(self._scan_tree()))
+        for start in range(0, len(paths), _READ_BATCH_SIZE):
+            batch = paths[start : start + _READ_BATCH_SIZE]
+            entries = await run_blocking(
+                self._executor, lambda b=batch: [self._read_entry(p) for _, p in b]
+            )
+            for (key, _), entry in zip(batch, entries, strict=True):
+                if entry is not None:
+                    yield (
+                        key,
+                        {"result": entry["result"], "metadata": entry.get("metadata")},
+                    )
+
+    async def disk_usage(self) -> int:
+        """Get the total size of the entries in this cache directory (excluding child caches), in bytes."""
+        entries = await run_blocking(self._executor, self._index_entries)
+        return sum(entry.size for entry in entries.values())
+
+    async def stats(self) -> CacheStats:
+        """Get the size and usage statistics of this cache directory (excluding child caches)."""
+        entries = await run_blocking(self._executor, self._index_entries)
+        return CacheStats(
+            entries=len(entries),
+            size=sum(entry.size for entry in entries.values()),
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+    async def index(self) -> dict[str, FileCacheIndexEntry]:
+        """Get the index entries for this cache directory (excluding child caches)."""
+        return await run_blocking(self._executor, self._index_entries)
+
+    async def rebuild_index(self) -> None:
+        """Rebuild the index by scanning the cache directory (e.g. for entries written by older versions)."""
+        await run_blocking(self._executor, self._rebuild_index)
+
+    def child(self, key: str) -> FileCache:
+        """Create a child cache."""
+        return FileCache(
+            self._cache_path / key,
+            self._encoding,
+            executor=self._executor,
+            serializer=self._serializer,
+            shard_depth=self._shard_depth,
+            max_bytes=self._max_bytes,
+            eviction_policy=self._eviction_policy,
+        )
 
+    def entry_path(self, key: str) -> Path:
+        """Get the path of a cache entry in this cache directory."""
+        if self._shard_depth <= 0:
+            return self._cache_path / key
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        shards = [
+            f"{SHARD_DIR_PREFIX}{digest[i * 2 : i * 2 + 2]}"
+            for i in range(self._shard_depth)
+        ]
+        return self._cache_path.joinpath(*shards, key)
+
+    def _resolve(self, key: str) -> tuple[FileCache, str]:
+        """Resolve keys that address a child cache (e.g. `child/key`) to the child cache and the local key."""
+        if "/" not in key:
+            return self, key
+
+        namespace, key = key.rsplit("/", 1)
+        if namespace not in self._namespaces:
+            self._namespaces[namespace] = self.child(namespace)
+        return self._namespaces[namespace], key
+
+    def _sweep(self, age: int, *, remove_unreadable: bool) -> None:
+        _log.debug("sweeping cache %s", self._cache_path)
+        now = time.time()
+
+        if remove_unreadable:
+            for key, path in self._scan_entries():
+                if not self._is_readable(path):
+                    _log.warning("Cache entry %s is corrupted", path)
+                    _log.debug("removing file %s", path)
+                    path.unlink()
+                    self._index.record_remove(key)
+
+        entries = self._index_entries()
+        survivors: dict[str, FileCacheIndexEntry] = {}
+        for key, entry in entries.items():
+            if now - entry.accessed > age:
+                path = self.entry_path(key)
+                try:
+                    # the entry may have been read by another process since it was indexed
+                    entry.accessed = max(entry.accessed, path.stat().st_mtime)
+                except FileNotFoundError:
+                    continue
+                if now - entry.accessed > age:
+                    _log.debug("removing file %s", path)
+                    path.unlink()
+                    continue
+            survivors[key] = entry
+
+        if survivors or self._index.exists():
+            self._index.rewrite(survivors)
+        with self._quota_lock:
+            self._usage = None
+
+    def _index_entries(self) -> dict[str, FileCacheIndexEntry]:
+        if not self._index.exists():
+            self._rebuild_index()
+        return self._index.entries()
+
+    def _rebuild_index(self) -> None:
+        entries = self._scan_index()
+        if entries:
+            self._index.rewrite(entries)
+
+    def _scan_index(self) -> dict[str, FileCacheIndexEntry]:
+        """Index the entries of the cache directory from their file stats."""
+        entries: dict[str, FileCacheIndexEntry] = {}
+        for key, path in self._scan_entries():
+            with suppress(FileNotFoundError):
+                stat = path.stat()
+                entries[key] = FileCacheIndexEntry(
+                    created=stat.st_mtime, accessed=stat.st_mtime, size=stat.st_size
+                )
+        return entries
+
+    def _scan_entries(
+        self, root: Path | None = None, shard_depth: int | None = None
+    ) -> Iterator[tuple[str, Path]]:
+        """Scan the cache directory (or a child cache directory) for entries, without opening them."""
+        directories = [root or self._cache_path]
+        depth = self._shard_depth if shard_depth is None else shard_depth
+        for _ in range(depth):
+            directories = [
+                d
+                for parent in directories
+                for d in parent.iterdir()
+                if d.is_dir() and _is_shard_name(d.name)
+            ]
+
+        for directory in directories:
+            for f in directory.iterdir():
+                if f.is_file() and not f.name.startswith((
+                    INDEX_FILE_NAME,
+                    LAYOUT_FILE_NAME,
+                )):
+                    yield f.name, f
+
+    def _scan_tree(
+        self, root: Path | None = None, prefix: str = ""
+    ) -> Iterator[tuple[str, Path]]:
+        """Scan the cache directory and its child cache directories for entries, keyed by their path (e.g. `child/key`)."""
+        root = root or self._cache_path
+        for key, path in self._scan_entries(root):
+            yield f"{prefix}{key}", path
+        for child in root.iterdir():
+            if child.is_dir() and not _is_shard_name(child.name):
+                yield from self._scan_tree(child, f"{prefix}{child.name}/")
+
+    def _is_readable(self, path: Path) -> bool:
+        """Check if a cache entry can be parsed."""
+        try:
+            self._serializer.loads(path.read_bytes())
+        except (json.JSONDecodeError, InvalidCacheEntryError, UnicodeDecodeError):
+            return False
+        return True
+
+    def _get(self, key: str) -> Any | None:
+        path = self.entry_path(key)
+        cache_entry = self._read_entry(path)
+        if cache_entry is None:
+            return None
+
+        # Mark the cache entry as accessed to keep it alive, without rewriting its content
+        _touch(path)
+        self._index.record_access(key, time.time())
+
+        return cache_entry["result"]
+
+    def _read_entry(self, path: Path) -> dict[str, Any] | None:
         if not path.exists():
             return None
 
         try:
-            cache_entry = json.loads(path.read_text(encoding=self._encoding))
-        except json.JSONDecodeError:
+            return self._serializer.loads(path.read_bytes())
+        except (json.JSONDecodeError, InvalidCacheEntryError):
             _log.warning("Cache entry %s is corrupted", path)
-            return None
         except PermissionError:
             _log.error("Permission denied for file %s", path)
-            return None
         except UnicodeDecodeError:
             _log.error("Encoding error reading file %s", path)
-            return None
+        return None
+
+    def _set(self, key: str, value: Any, metadata: dict[str, Any] | None) -> None:
+        self._set_many({key: value}, {key: metadata})
+
+    def _set_many(
+        self,
+        values: Mapping[str, Any],
+        metadata: Mapping[str, dict[str, Any] | None],
+    ) -> None:
+        if self._max_bytes is None:
+            self._index.record_set([
+                self._write_entry(key, value, metadata.get(key))
+                for key, value in values.items()
+            ])
+            return
 
-        # Mark the cache entry as updated to keep it alive
-        cache_entry["accessed"] = time.time()
-        (self._cache_path / key).write_text(
-            _content_text(cache_entry),
-            encoding=self._encoding,
+        replaced = sum(_entry_size(self.entry_path(key)) for key in values)
+        written = [
+            self._write_entry(key, value, metadata.get(key))
+            for key, value in values.items()
+        ]
+        self._index.record_set(written)
+        self._enforce_quota(
+            sum(size for _, _, size in written) - replaced, protected=set(values)
         )
 
-        return cache_entry["result"]
+    def _enforce_quota(self, delta: int, *, protected: set[str] | None = None) -> None:
+        """Track the size of the cache directory, and evict entries when it exceeds the quota."""
+        if self._max_bytes is None:
+            return
 
-    async def remove(self, key: str) -> None:
-        """Remove a value from the cache."""
-        (self._cache_path / key).unlink()
+        with self._quota_lock:
+            if self._usage is None:
+                # the index already includes the latest writes
+                self._usage = sum(e.size for e in self._index_entries().values())
+            else:
+                self._usage += delta
 
-    async def clear(self) -> None:
-        """Clear the cache."""
-        _clear_dir(self._cache_path)
+            if self._usage > self._max_bytes:
+                self._usage = self._evict(
+                    int(self._max_bytes * EVICTION_TARGET_RATIO), protected or set()
+                )
 
-    async def set(
-        self, key: str, value: Any, metadata: dict[str, Any] | None = None
-    ) -> None:
-        """Write a value into the cache."""
+    def _evict(self, target: int, protected: set[str]) -> int:
+        """Evict entries until the cache directory is at most `target` bytes. Returns the remaining size."""
+        entries = self._index_entries()
+        usage = sum(entry.size for entry in entries.values())
+        # the entries being written have no reads yet, so they are evicted last
+        if self._eviction_policy == EvictionPolicy.LFU:
+            order = sorted(
+                entries,
+                key=lambda k: (k in protected, entries[k].hits, entries[k].accessed),
+            )
+        else:
+            order = sorted(entries, key=lambda k: (k in protected, entries[k].accessed))
+
+        for key in order:
+            if usage <= target:
+                break
+            _log.debug("evicting cache entry %s", key)
+            with suppress(FileNotFoundError):
+                self.entry_path(key).unlink()
+            usage -= entries.pop(key).size
+            self._evictions += 1
+
+        self._index.rewrite(entries)
+        return usage
+
+    def _count_reads(self, results: list[Any | None]) -> None:
+        hits = sum(1 for result in results if result is not None)
+        self._hits += hits
+        self._misses += len(results) - hits
+
+    def _write_entry(
+        self, key: str, value: Any, metadata: dict[str, Any] | None
+    ) -> tuple[str, float, int]:
         create_time = time.time()
         content = {
             "result": value,
@@ -105,19 +564,100 @@ class FileCache(Cache):
             "created": create_time,
             "accessed": create_time,
         }
-        (self._cache_path / key).write_text(
-            _content_text(content),
-            encoding=self._encoding,
+        data = self._serializer.dumps(content)
+        path = self.entry_path(key)
+        if self._shard_depth > 0:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return key, create_time, len(data)
+
+    def _remove(self, key: str) -> None:
+        path = self.entry_path(key)
+        size = _entry_size(path) if self._max_bytes is not None else 0
+        path.unlink()
+        self._index.record_remove(key)
+        self._enforce_quota(-size)
+
+    def _clear(self) -> None:
+        self._index.reset()
+        _clear_dir(self._cache_path)
+        self._write_layout()
+        with self._quota_lock:
+            self._usage = None
+
+    def _migrate_layout(self) -> None:
+        """Move the entries written with another shard depth into the layout of this cache."""
+        try:
+            depth = int((self._cache_path / LAYOUT_FILE_NAME).read_text())
+        except (FileNotFoundError, ValueError):
+            depth = 0
+        if depth == self._shard_depth:
+            return
+
+        _log.info(
+            "migrating cache %s from shard depth %d to %d",
+            self._cache_path,
+            depth,
+            self._shard_depth,
         )
+        for key, path in list(self._scan_entries(shard_depth=depth)):
+            target = self.entry_path(key)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # the entry may have been migrated by another process
+            with suppress(FileNotFoundError):
+                path.replace(target)
+        _prune_shard_dirs(self._cache_path)
+        self._write_layout()
 
-    def child(self, key: str) -> FileCache:
-        """Create a child cache."""
-        return FileCache(self._cache_path / key)
+    def _write_layout(self) -> None:
+        path = self._cache_path / LAYOUT_FILE_NAME
+        if self._shard_depth > 0:
+            path.write_text(str(self._shard_depth))
+        else:
+            path.unlink(missing_ok=True)
+
+
+def _journal_line(record: list[Any]) -> str:
+    """Encode an index journal record."""
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def _has_namespaced_keys(keys: Sequence[str]) -> bool:
+    """Check if any key addresses a child cache (e.g. `child/key`)."""
+    return any("/" in key for key in keys)
+
+
+def _is_shard_name(name: str) -> bool:
+    """Check if a directory name is a hash-prefix shard."""
+    digits = name.removeprefix(SHARD_DIR_PREFIX)
+    return (
+        len(digits) == 2
+        and name.startswith(SHARD_DIR_PREFIX)
+        and all(c in "0123456789abcdef" for c in digits)
+    )
+
+
+def _prune_shard_dirs(path: Path) -> None:
+    """Remove the empty shard directories of a cache directory."""
+    for d in path.iterdir():
+        if d.is_dir() and _is_shard_name(d.name):
+            _prune_shard_dirs(d)
+            with suppress(OSError):
+                d.rmdir()
+
+
+def _entry_size(path: Path) -> int:
+    """Get the size of a cache entry on disk (0 if it doesn't exist)."""
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
 
 
-def _content_text(item: dict[str, Any]) -> str:
-    """Return the content of the cache item."""
-    return json.dumps(item, indent=2, ensure_ascii=False)
+def _touch(path: Path) -> None:
+    """Bump the modification time of a cache entry."""
+    with suppress(FileNotFoundError):
+        os.utime(path)
 
 
 def _clear_dir(path: Path) -> None:
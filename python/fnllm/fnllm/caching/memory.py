@@ -0,0 +1,249 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""In-memory LRU cache implementation for the `Cache` protocol."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from fnllm.caching.base import Cache, CacheStats, EvictionPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping, Sequence
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class _MemoryCacheEntry:
+    """A single in-memory cache entry."""
+
+    value: Any
+    metadata: dict[str, Any] | None
+    size: int
+    created: float
+    accessed: float
+    hits: int = 0
+
+
+class _MemoryCacheStore:
+    """The store shared between a memory cache and its children."""
+
+    def __init__(
+        self,
+        max_entries: int | None,
+        max_bytes: int | None,
+        eviction_policy: EvictionPolicy,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.eviction_policy = eviction_policy
+        self.entries: OrderedDict[str, _MemoryCacheEntry] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> _MemoryCacheEntry | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        entry.hits += 1
+        entry.accessed = time.time()
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: _MemoryCacheEntry) -> None:
+        self.pop(key)
+        self.entries[key] = entry
+        self.bytes += entry.size
+        self.evict(protected=key)
+
+    def pop(self, key: str) -> _MemoryCacheEntry | None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+        return entry
+
+    def evict(self, *, protected: str | None = None) -> None:
+        while self.entries and self._is_over_capacity():
+            if self.eviction_policy == EvictionPolicy.LFU and len(self.entries) > 1:
+                # entries are kept in recency order, so ties are broken by recency;
+                # the entry being written has no reads yet, so it is not an eviction candidate
+                key = min(
+                    (k for k in self.entries if k != protected),
+                    key=lambda k: self.entries[k].hits,
+                )
+                entry = self.entries.pop(key)
+            else:
+                key, entry = self.entries.popitem(last=False)
+            self.bytes -= entry.size
+            self.evictions += 1
+            _log.debug("evicting cache entry %s", key)
+
+    def _is_over_capacity(self) -> bool:
+        if self.max_entries is not None and len(self.entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.bytes > self.max_bytes
+
+
+class MemoryCache(Cache):
+    """
+    An in-memory LRU (or LFU) cache.
+
+    Entries are evicted in least-recently-used order (or least-frequently-used order, with `EvictionPolicy.LFU`) when
+    either `max_entries` or `max_bytes` is exceeded.
+    Entry sizes are approximated by their JSON-encoded length. Child caches share the parent's store (and therefore its bounds and counters),
+    but keep their keys in a separate namespace.
+
+    Note that values are stored by reference; callers should not mutate values after writing them into the cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        eviction_policy: EvictionPolicy = EvictionPolicy.LRU,
+        path_prefix: str | None = None,
+    ):
+        """Create a new MemoryCache."""
+        self._store = _MemoryCacheStore(max_entries, max_bytes, eviction_policy)
+        self._path_prefix = path_prefix or ""
+
+    @property
+    def hits(self) -> int:
+        """Number of `get` calls that found an entry."""
+        return self._store.hits
+
+    @property
+    def misses(self) -> int:
+        """Number of `get` calls that did not find an entry."""
+        return self._store.misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of entries evicted to stay within the cache bounds."""
+        return self._store.evictions
+
+    @property
+    def size(self) -> int:
+        """Approximate size of all the entries in the store, in bytes."""
+        return self._store.bytes
+
+    def __len__(self) -> int:
+        """Return the number of entries in the store."""
+        return len(self._store.entries)
+
+    async def stats(self) -> CacheStats:
+        """Get the size of this cache's namespace (including child caches), and the usage counters of the store."""
+        keys = self._namespace_keys()
+        return CacheStats(
+            entries=len(keys),
+            size=sum(self._store.entries[key].size for key in keys),
+            hits=self._store.hits,
+            misses=self._store.misses,
+            evictions=self._store.evictions,
+        )
+
+    async def iter_entries(self) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Iterate over the entries of the cache (including child caches)."""
+        start = len(self._path_prefix) + 1 if self._path_prefix else 0
+        for key in self._namespace_keys():
+            entry = self._store.entries.get(key)
+            if entry is not None:
+                yield key[start:], {"result": entry.value, "metadata": entry.metadata}
+
+    async def has(self, key: str) -> bool:
+        """Check if the cache has a value."""
+        return self._keyname(key) in self._store.entries
+
+    async def get(self, key: str) -> Any | None:
+        """Retrieve a value from the cache."""
+        entry = self._store.get(self._keyname(key))
+        return entry.value if entry is not None else None
+
+    async def remove(self, key: str) -> None:
+        """Remove a value from the cache."""
+        self._store.pop(self._keyname(key))
+
+    async def clear(self) -> None:
+        """Clear the cache."""
+        for key in self._namespace_keys():
+            self._store.pop(key)
+
+    async def sweep(self, age: int, *, remove_unreadable: bool = False) -> None:
+        """Sweep the cache for entries older than `age` seconds."""
+        now = time.time()
+        for key in self._namespace_keys():
+            if now - self._store.entries[key].accessed > age:
+                _log.debug("removing cache entry %s", key)
+                self._store.pop(key)
+
+    async def set(
+        self, key: str, value: Any, metadata: dict[str, Any] | None = None
+    ) -> None:
+        """Write a value into the cache."""
+        create_time = time.time()
+        self._store.put(
+            self._keyname(key),
+            _MemoryCacheEntry(
+                value=value,
+                metadata=metadata,
+                size=_entry_size(value, metadata),
+                created=create_time,
+                accessed=create_time,
+            ),
+        )
+
+    async def has_many(self, keys: Sequence[str]) -> list[bool]:
+        """Check if the cache has several values."""
+        return [self._keyname(key) in self._store.entries for key in keys]
+
+    async def get_many(self, keys: Sequence[str]) -> list[Any | None]:
+        """Retrieve several values from the cache."""
+        entries = [self._store.get(self._keyname(key)) for key in keys]
+        return [entry.value if entry is not None else None for entry in entries]
+
+    async def set_many(
+        self,
+        values: Mapping[str, Any],
+        metadata: Mapping[str, dict[str, Any] | None] | None = None,
+    ) -> None:
+        """Write several values into the cache."""
+        metadata = metadata or {}
+        for key, value in values.items():
+            await self.set(key, value, metadata.get(key))
+
+    def child(self, key: str) -> MemoryCache:
+        """Create a child cache."""
+        child = MemoryCache(path_prefix=self._keyname(key))
+        child._store = self._store
+        return child
+
+    def _keyname(self, key: str) -> str:
+        """Get the key name."""
+        return f"{self._path_prefix}/{key}" if self._path_prefix else key
+
+    def _namespace_keys(self) -> list[str]:
+        """Get the keys in this cache's namespace (including child namespaces)."""
+        if not self._path_prefix:
+            return list(self._store.entries)
+        prefix = f"{self._path_prefix}/"
+        return [k for k in self._store.entries if k.startswith(prefix)]
+
+
+def _entry_size(value: Any, metadata: dict[str, Any] | None) -> int:
+    """Approximate the size of a cache entry, in bytes."""
+    content = json.dumps(
+        {"result": value, "metadata": metadata}, ensure_ascii=False, default=str
+    )
+    return len(content.encode())
@@ -0,0 +1,192 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Serializers for persisted cache entries."""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+import zlib
+from abc import ABC, abstractmethod
+from array import array
+from typing import Any, Final
+
+COMPACT_MAGIC: Final[bytes] = b"FNLC"
+"""The header prefix of entries written by the `CompactCacheSerializer`."""
+
+COMPACT_FORMAT_VERSION: Final[int] = 1
+"""The version of the compact entry layout."""
+
+_FLAG_COMPRESSED: Final[int] = 0x01
+_ARRAY_REF: Final[str] = "__fnllm_array__"
+_HEADER = struct.Struct("<4sBB")
+_JSON_LENGTH = struct.Struct("<I")
+
+
+class InvalidCacheEntryError(ValueError):
+    """Raised when a serialized cache entry cannot be decoded."""
+
+    def __init__(self, message: str):
+        """Create a new InvalidCacheEntryError."""
+        super().__init__(message)
+
+
+class CacheSerializer(ABC):
+    """
+    Cache entry serializer base class.
+
+    Every serializer can read entries written by any of the built-in serializers, so the
+    serialization format of a cache can be changed without invalidating existing entries.
+    """
+
+    @abstractmethod
+    def dumps(self, entry: dict[str, Any]) -> bytes:
+        """Serialize a cache entry."""
+
+    def loads(self, data: bytes) -> dict[str, Any]:
+        """Deserialize a cache entry."""
+        if data.startswith(COMPACT_MAGIC):
+            return _loads_compact(data)
+        return _loads_json(data, self.encoding)
+
+    @property
+    def encoding(self) -> str:
+        """Text encoding used for JSON entries."""
+        return "utf-8"
+
+
+class JsonCacheSerializer(CacheSerializer):
+    """Serialize cache entries as JSON text. The default indentation matches the historical cache format."""
+
+    def __init__(self, *, indent: int | None = 2, encoding: str | None = None):
+        """Create a new JsonCacheSerializer."""
+        self._indent = indent
+        self._encoding = encoding or "utf-8"
+
+    @property
+    def encoding(self) -> str:
+        """Text encoding used for JSON entries."""
+        return self._encoding
+
+    def dumps(self, entry: dict[str, Any]) -> bytes:
+        """Serialize a cache entry."""
+        separators = None if self._indent is not None else (",", ":")
+        content = json.dumps(
+            entry, indent=self._indent, separators=separators, ensure_ascii=False
+        )
+        return content.encode(self._encoding)
+
+
+class CompactCacheSerializer(CacheSerializer):
+    """
+    Serialize cache entries into a compact binary layout.
+
+    Entries are written as compact JSON, with lists of floats (e.g. embedding vectors) moved into packed binary arrays.
+    Vectors are stored as 32-bit floats when that is lossless, and as 64-bit floats otherwise.
+    The payload is optionally zlib-compressed.
+    """
+
+    def __init__(
+        self,
+        *,
+        compress: bool = False,
+        compression_level: int = 6,
+        min_array_length: int = 8,
+    ):
+        """Create a new CompactCacheSerializer."""
+        self._compress = compress
+        self._compression_level = compression_level
+        self._min_array_length = min_array_length
+
+    def dumps(self, entry: dict[str, Any]) -> bytes:
+        """Serialize a cache entry."""
+        arrays: list[bytes] = []
+        offset = 0
+
+        def pack(value: Any) -> Any:
+            nonlocal offset
+            if isinstance(value, dict):
+                return {k: pack(v) for k, v in value.items()}
+            if isinstance(value, list | tuple):
+                if len(value) >= self._min_array_length and all(
+                    type(v) is float for v in value
+                ):
+                    typecode, packed = _pack_floats(value)
+                    arrays.append(packed)
+                    ref = {_ARRAY_REF: [typecode, offset, len(value)]}
+                    offset += len(packed)
+                    return ref
+                return [pack(v) for v in value]
+            return value
+
+        content = json.dumps(
+            pack(entry), separators=(",", ":"), ensure_ascii=False
+        ).encode()
+        payload = b"".join([_JSON_LENGTH.pack(len(content)), content, *arrays])
+
+        flags = 0
+        if self._compress:
+            flags |= _FLAG_COMPRESSED
+            payload = zlib.compress(payload, self._compression_level)
+
+        return _HEADER.pack(COMPACT_MAGIC, COMPACT_FORMAT_VERSION, flags) + payload
+
+
+def _pack_floats(values: list[float] | tuple[float, ...]) -> tuple[str, bytes]:
+    """Pack floats into a little-endian binary array, using single precision when lossless."""
+    packed = array("f", values)
+    if packed.tolist() != list(values):
+        packed = array("d", values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.typecode, packed.tobytes()
+
+
+def _unpack_floats(typecode: str, data: bytes) -> list[float]:
+    """Unpack a little-endian binary array of floats."""
+    unpacked = array(typecode)
+    unpacked.frombytes(data)
+    if sys.byteorder != "little":
+        unpacked.byteswap()
+    return unpacked.tolist()
+
+
+def _loads_json(data: bytes, encoding: str) -> dict[str, Any]:
+    """Deserialize a JSON cache entry."""
+    return json.loads(data.decode(encoding))
+
+
+def _loads_compact(data: bytes) -> dict[str, Any]:
+    """Deserialize a compact cache entry."""
+    try:
+        _, version, flags = _HEADER.unpack_from(data)
+        if version > COMPACT_FORMAT_VERSION:
+            msg = f"Unsupported compact cache entry version {version}."
+            raise InvalidCacheEntryError(msg)
+
+        payload = data[_HEADER.size :]
+        if flags & _FLAG_COMPRESSED:
+            payload = zlib.decompress(payload)
+
+        (json_length,) = _JSON_LENGTH.unpack_from(payload)
+        content_end = _JSON_LENGTH.size + json_length
+        content = json.loads(payload[_JSON_LENGTH.size : content_end])
+        arrays = memoryview(payload)[content_end:]
+    except (struct.error, zlib.error) as e:
+        msg = "Compact cache entry is corrupted."
+        raise InvalidCacheEntryError(msg) from e
+
+    def unpack(value: Any) -> Any:
+        if isinstance(value, dict):
+            ref = value.get(_ARRAY_REF)
+            if ref is not None and len(value) == 1:
+                typecode, start, count = ref
+                end = start + count * array(typecode).itemsize
+                return _unpack_floats(typecode, arrays[start:end].tobytes())
+            return {k: unpack(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [unpack(v) for v in value]
+        return value
+
+    return unpack(content)
@@ -0,0 +1,153 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Export caches to snapshot files, and preload caches from them."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Final
+
+from fnllm.caching.executor import run_blocking
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from fnllm.caching.base import Cache
+
+_log = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT: Final[str] = "fnllm-cache-snapshot"
+"""The format identifier in the header of snapshot files."""
+
+SNAPSHOT_FORMAT_VERSION: Final[int] = 1
+"""The version of the snapshot file layout."""
+
+
+class InvalidCacheSnapshotError(ValueError):
+    """Raised when a cache snapshot file cannot be read."""
+
+    def __init__(self, message: str):
+        """Create a new InvalidCacheSnapshotError."""
+        super().__init__(message)
+
+
+async def export_snapshot(
+    cache: Cache,
+    path: Path | str,
+    *,
+    batch_size: int = 1000,
+    executor: Executor | None = None,
+) -> int:
+    """
+    Export the entries of a cache (or of a child cache namespace) to a snapshot file.
+
+    Snapshots are gzip-compressed JSON lines: a header, followed by one `{"key", "result", "metadata"}` line per entry.
+    Returns the number of exported entries.
+    """
+    header = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_FORMAT_VERSION,
+        "cache_strategy_version": cache.__cache_strategy_version__,
+    }
+    f = await run_blocking(executor, gzip.open, Path(path), "wt", encoding="utf-8")
+    count = 0
+    try:
+        lines = [_encode_line(header)]
+        async for key, entry in cache.iter_entries():
+            lines.append(
+                _encode_line({
+                    "key": key,
+                    "result": entry["result"],
+                    "metadata": entry.get("metadata"),
+                })
+            )
+            count += 1
+            if len(lines) >= batch_size:
+                await run_blocking(executor, f.writelines, lines)
+                lines = []
+        await run_blocking(executor, f.writelines, lines)
+    finally:
+        await run_blocking(executor, f.close)
+
+    _log.info("exported %d cache entries to %s", count, path)
+    return count
+
+
+async def load_snapshot(
+    cache: Cache,
+    path: Path | str,
+    *,
+    batch_size: int = 1000,
+    executor: Executor | None = None,
+) -> int:
+    """
+    Preload a cache (e.g. a fast local cache, before serving requests) from a snapshot file.
+
+    Entries are written with `Cache.set_many`, in batches of `batch_size`. Returns the number of loaded entries.
+    """
+    f = await run_blocking(executor, gzip.open, Path(path), "rt", encoding="utf-8")
+    count = 0
+    try:
+        header = _decode_line(await run_blocking(executor, f.readline))
+        _check_header(header, cache, path)
+
+        while lines := await run_blocking(executor, _read_lines, f, batch_size):
+            records = [_decode_line(line) for line in lines]
+            await cache.set_many(
+                {r["key"]: r["result"] for r in records},
+                {r["key"]: r.get("metadata") for r in records},
+            )
+            count += len(records)
+    except (OSError, EOFError) as e:
+        msg = f"Cache snapshot {path} is corrupted."
+        raise InvalidCacheSnapshotError(msg) from e
+    finally:
+        await run_blocking(executor, f.close)
+
+    _log.info("loaded %d cache entries from %s", count, path)
+    return count
+
+
+def _check_header(header: Any, cache: Cache, path: Path | str) -> None:
+    """Validate the header of a snapshot file."""
+    if not isinstance(header, dict) or header.get("format") != SNAPSHOT_FORMAT:
+        msg = f"{path} is not a cache snapshot."
+        raise InvalidCacheSnapshotError(msg)
+
+    version = header.get("version")
+    if not isinstance(version, int) or version > SNAPSHOT_FORMAT_VERSION:
+        msg = f"Unsupported cache snapshot version {version}."
+        raise InvalidCacheSnapshotError(msg)
+
+    if header.get("cache_strategy_version") != cache.__cache_strategy_version__:
+        _log.warning(
+            "cache snapshot %s was written with cache strategy version %s (current: %s); its entries will not be hit",
+            path,
+            header.get("cache_strategy_version"),
+            cache.__cache_strategy_version__,
+        )
+
+
+def _read_lines(f: IO[str], count: int) -> list[str]:
+    """Read up to `count` lines from a file."""
+    lines = []
+    for line in f:
+        lines.append(line)
+        if len(lines) >= count:
+            break
+    return lines
+
+
+def _encode_line(record: dict[str, Any]) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _decode_line(line: str) -> Any:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as e:
+        msg = "Cache snapshot line is corrupted."
+        raise InvalidCacheSnapshotError(msg) from e
@@ -0,0 +1,523 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""SQLite cache implementation for the `Cache` protocol."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from fnllm.caching.base import (
+    EVICTION_TARGET_RATIO,
+    Cache,
+    CacheStats,
+    EvictionPolicy,
+)
+from fnllm.caching.executor import run_blocking
+from fnllm.caching.serializers import (
+    CacheSerializer,
+    CompactCacheSerializer,
+    InvalidCacheEntryError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+    from concurrent.futures import Executor
+
+_log = logging.getLogger(__name__)
+
+_MAX_QUERY_PARAMETERS = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cache_entries_accessed ON cache_entries (accessed);
+"""
+
+
+@dataclass
+class _PendingWrite:
+    """A write that has not been committed to the database yet."""
+
+    value: Any
+    data: bytes
+    created: float
+
+
+@dataclass
+class _SqliteCacheStore:
+    """The database connection and write buffers shared between a cache and its children."""
+
+    path: Path
+    max_bytes: int | None = None
+    eviction_policy: EvictionPolicy = EvictionPolicy.LRU
+    connection: sqlite3.Connection | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    pending: dict[str, _PendingWrite] = field(default_factory=dict)
+    flushing: dict[str, _PendingWrite] = field(default_factory=dict)
+    accessed: dict[str, tuple[float, int]] = field(default_factory=dict)
+    flush_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    flush_task: asyncio.Task[None] | None = None
+    usage: int | None = None
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def run(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run a function against the connection, serialized across threads."""
+        with self.lock:
+            if self.connection is None:
+                self.connection = _connect(self.path)
+            with self.connection:
+                return fn(self.connection)
+
+    def enforce_quota(
+        self, c: sqlite3.Connection, delta: int, written_since: float
+    ) -> None:
+        """Track the size of the database entries, and evict entries when it exceeds the quota."""
+        if self.max_bytes is None:
+            return
+
+        if self.usage is None:
+            self.usage = _total_size(c)
+        else:
+            self.usage += delta
+        if self.usage <= self.max_bytes:
+            return
+
+        # keep the most valuable entries, up to the eviction target; the entries that were just written have no reads
+        # yet, so they are kept first
+        order = (
+            "hits DESC, accessed DESC"
+            if self.eviction_policy == EvictionPolicy.LFU
+            else "accessed DESC"
+        )
+        evicted = c.execute(
+            f"""
+            DELETE FROM cache_entries WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (
+                        ORDER BY created >= ? DESC, {order}, key ROWS UNBOUNDED PRECEDING
+                    ) AS retained
+                    FROM cache_entries
+                ) WHERE retained > ?
+            )""",  # noqa: S608
+            (written_since, int(self.max_bytes * EVICTION_TARGET_RATIO)),
+        ).rowcount
+        _log.debug("evicted %d cache entries from %s", evicted, self.path)
+        self.evictions += evicted
+        self.usage = _total_size(c)
+
+    def close(self) -> None:
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+
+class SqliteCache(Cache):
+    """
+    A single-file cache backed by SQLite.
+
+    The database runs in WAL mode, so it can be shared by several processes. Writes (and access-time updates) are
+    buffered and committed in batches, either when `batch_size` writes are pending or `flush_interval` seconds after the
+    first pending write; buffered writes are visible to reads immediately. Call `flush()` (or `close()`) to commit them.
+
+    Child caches share the parent's database; their keys are stored with the child's path as a prefix (e.g. `child/key`),
+    so clearing or sweeping a child is a range delete on the primary key.
+
+    With `max_bytes`, the database entries (of the cache and all of its children) are capped at that many bytes: when a
+    flush exceeds the quota, entries are evicted in `eviction_policy` order until the entries are back under
+    `EVICTION_TARGET_RATIO` of the quota.
+    """
+
+    def __init__(
+        self,
+        database_path: Path | str,
+        *,
+        path_prefix: str | None = None,
+        serializer: CacheSerializer | None = None,
+        executor: Executor | None = None,
+        batch_size: int = 100,
+        flush_interval: float = 0.1,
+        max_bytes: int | None = None,
+        eviction_policy: EvictionPolicy = EvictionPolicy.LRU,
+    ):
+        """Create a new SqliteCache."""
+        database_path = Path(database_path)
+        database_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._store = _SqliteCacheStore(
+            path=database_path, max_bytes=max_bytes, eviction_policy=eviction_policy
+        )
+        self._path_prefix = path_prefix or ""
+        self._serializer = serializer or CompactCacheSerializer()
+        self._executor = executor
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+
+    @property
+    def database_path(self) -> Path:
+        """Path of the database file."""
+        return self._store.path
+
+    async def has(self, key: str) -> bool:
+        """Check if the cache has a value."""
+        key = self._keyname(key)
+        if key in self._store.pending or key in self._store.flushing:
+            return True
+        row = await self._run(
+            lambda c: c.execute(
+                "SELECT 1 FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+        )
+        return row is not None
+
+    async def get(self, key: str) -> Any | None:
+        """Retrieve a value from the cache."""
+        key = self._keyname(key)
+        pending = self._store.pending.get(key) or self._store.flushing.get(key)
+        if pending is not None:
+            self._store.hits += 1
+            return pending.value
+
+        row = await self._run(
+            lambda c: c.execute(
+                "SELECT value FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+        )
+        if row is None:
+            self._store.misses += 1
+            return None
+
+        self._store.hits += 1
+        self._record_access(key, time.time())
+        self._schedule_flush()
+        return self._load_result(key, row[0])
+
+    async def set(
+        self, key: str, value: Any, metadata: dict[str, Any] | None = None
+    ) -> None:
+        """Write a value into the cache."""
+        self._buffer_write(key, value, metadata)
+        if len(self._store.pending) >= self._batch_size:
+            await self.flush()
+        else:
+            self._schedule_flush()
+
+    async def has_many(self, keys: Sequence[str]) -> list[bool]:
+        """Check if the cache has several values, with a single query per chunk of keys."""
+        names = [self._keyname(key) for key in keys]
+        stored = await self._run(lambda c: _select_existing(c, "key", names))
+        return [
+            name in stored
+            or name in self._store.pending
+            or name in self._store.flushing
+            for name in names
+        ]
+
+    async def get_many(self, keys: Sequence[str]) -> list[Any | None]:
+        """Retrieve several values from the cache, with a single query per chunk of keys."""
+        names = [self._keyname(key) for key in keys]
+        pending = {
+            name: write.value
+            for name in names
+            if (
+                write := self._store.pending.get(name) or self._store.flushing.get(name)
+            )
+            is not None
+        }
+        stored = await self._run(
+            lambda c: _select_existing(
+                c, "key, value", [n for n in names if n not in pending]
+            )
+        )
+
+        results: list[Any | None] = []
+        now = time.time()
+        for name in names:
+            if name in pending:
+                results.append(pending[name])
+            elif name in stored:
+                results.append(self._load_result(name, stored[name]))
+                self._record_access(name, now)
+            else:
+                results.append(None)
+
+        hits = len(names) - results.count(None)
+        self._store.hits += hits
+        self._store.misses += len(names) - hits
+
+        self._schedule_flush()
+        return results
+
+    async def set_many(
+        self,
+        values: Mapping[str, Any],
+        metadata: Mapping[str, dict[str, Any] | None] | None = None,
+    ) -> None:
+        """Write several values into the cache, committing them as a single batch."""
+        metadata = metadata or {}
+        for key, value in values.items():
+            self._buffer_write(key, value, metadata.get(key))
+        await self.flush()
+
+    async def remove(self, key: str) -> None:
+        """Remove a value from the cache."""
+        key = self._keyname(key)
+        await self.flush()
+        await self._run(
+            lambda c: c.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        )
+        self._store.usage = None
+
+    async def clear(self) -> None:
+        """Clear the cache (including child caches)."""
+        await self.flush()
+        where, params = self._namespace_filter()
+        await self._run(
+            lambda c: c.execute(f"DELETE FROM cache_entries WHERE {where}", params)  # noqa: S608
+        )
+        self._store.usage = None
+
+    async def sweep(self, age: int, *, remove_unreadable: bool = False) -> None:
+        """Sweep the cache (including child caches) for entries that have not been accessed in `age` seconds."""
+        await self.flush()
+        where, params = self._namespace_filter()
+        threshold = time.time() - age
+        await self._run(
+            lambda c: c.execute(
+                f"DELETE FROM cache_entries WHERE accessed < ? AND {where}",  # noqa: S608
+                (threshold, *params),
+            )
+        )
+
+        if remove_unreadable:
+            await self._run(lambda c: self._remove_unreadable(c, where, params))
+        self._store.usage = None
+
+    async def stats(self) -> CacheStats:
+        """Get the size of this cache's namespace (including child caches), and the usage counters of the database."""
+        await self.flush()
+        where, params = self._namespace_filter()
+        entries, size = await self._run(
+            lambda c: c.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE {where}",  # noqa: S608
+                params,
+            ).fetchone()
+        )
+        return CacheStats(
+            entries=entries,
+            size=size,
+            hits=self._store.hits,
+            misses=self._store.misses,
+            evictions=self._store.evictions,
+        )
+
+    async def iter_entries(self) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Iterate over the entries of the cache (including child caches), reading them in pages."""
+        await self.flush()
+        where, params = self._namespace_filter()
+        start = len(self._path_prefix) + 1 if self._path_prefix else 0
+        last_key = ""
+        while True:
+            rows = await self._run(
+                lambda c, after=last_key: c.execute(
+                    f"SELECT key, value FROM cache_entries WHERE {where} AND key > ? ORDER BY key LIMIT ?",  # noqa: S608
+                    (*params, after, _MAX_QUERY_PARAMETERS),
+                ).fetchall()
+            )
+            if not rows:
+                return
+            for key, value in rows:
+                entry = self._load_entry(key, value)
+                if entry is not None:
+                    yield (
+                        key[start:],
+                        {"result": entry["result"], "metadata": entry.get("metadata")},
+                    )
+            last_key = rows[-1][0]
+
+    async def flush(self) -> None:
+        """Commit any buffered writes and access-time updates."""
+        store = self._store
+        async with store.flush_lock:
+            if not store.pending and not store.accessed:
+                return
+
+            store.flushing, store.pending = store.pending, {}
+            accessed, store.accessed = store.accessed, {}
+            writes = [
+                (key, w.data, w.created, w.created, len(w.data))
+                for key, w in store.flushing.items()
+            ]
+            touches = [(t, n, key) for key, (t, n) in accessed.items()]
+
+            def write(c: sqlite3.Connection) -> None:
+                track_usage = store.max_bytes is not None and store.usage is not None
+                replaced = _total_size(c, [w[0] for w in writes]) if track_usage else 0
+                c.executemany(
+                    "INSERT OR REPLACE INTO cache_entries (key, value, created, accessed, size) VALUES (?, ?, ?, ?, ?)",
+                    writes,
+                )
+                c.executemany(
+                    "UPDATE cache_entries SET accessed = MAX(accessed, ?), hits = hits + ? WHERE key = ?",
+                    touches,
+                )
+                store.enforce_quota(
+                    c,
+                    sum(w[4] for w in writes) - replaced,
+                    min((w[2] for w in writes), default=math.inf),
+                )
+
+            try:
+                await self._run(write)
+            except BaseException:
+                # keep the writes for the next flush, unless they have been overwritten since
+                store.pending = {**store.flushing, **store.pending}
+                for key, (t, n) in accessed.items():
+                    newer_t, newer_n = store.accessed.get(key, (0.0, 0))
+                    store.accessed[key] = (max(t, newer_t), n + newer_n)
+                store.usage = None
+                raise
+            finally:
+                store.flushing = {}
+
+    async def close(self) -> None:
+        """Flush buffered writes and close the database connection."""
+        await self.flush()
+        await run_blocking(self._executor, self._store.close)
+
+    def child(self, key: str) -> SqliteCache:
+        """Create a child cache."""
+        child = SqliteCache(
+            self._store.path,
+            path_prefix=self._keyname(key),
+            serializer=self._serializer,
+            executor=self._executor,
+            batch_size=self._batch_size,
+            flush_interval=self._flush_interval,
+        )
+        child._store = self._store
+        return child
+
+    def _buffer_write(
+        self, key: str, value: Any, metadata: dict[str, Any] | None
+    ) -> None:
+        key = self._keyname(key)
+        data = self._serializer.dumps({"result": value, "metadata": metadata})
+        self._store.pending[key] = _PendingWrite(
+            value=value, data=data, created=time.time()
+        )
+        self._store.accessed.pop(key, None)
+
+    def _record_access(self, key: str, accessed: float) -> None:
+        _, hits = self._store.accessed.get(key, (0.0, 0))
+        self._store.accessed[key] = (accessed, hits + 1)
+
+    def _load_result(self, key: str, data: bytes) -> Any | None:
+        entry = self._load_entry(key, data)
+        return entry["result"] if entry is not None else None
+
+    def _load_entry(self, key: str, data: bytes) -> dict[str, Any] | None:
+        try:
+            return self._serializer.loads(data)
+        except (json.JSONDecodeError, InvalidCacheEntryError, UnicodeDecodeError):
+            _log.warning("Cache entry %s is corrupted", key)
+            return None
+
+    def _keyname(self, key: str) -> str:
+        """Get the key name."""
+        return f"{self._path_prefix}/{key}" if self._path_prefix else key
+
+    def _namespace_filter(self) -> tuple[str, tuple[str, ...]]:
+        """Get a primary-key range filter that matches this cache's namespace."""
+        if not self._path_prefix:
+            return "1 = 1", ()
+        # '0' is the character after '/', so this matches every key starting with `{prefix}/`
+        return "key >= ? AND key < ?", (
+            f"{self._path_prefix}/",
+            f"{self._path_prefix}0",
+        )
+
+    def _remove_unreadable(
+        self, c: sqlite3.Connection, where: str, params: tuple[str, ...]
+    ) -> None:
+        unreadable = []
+        for key, value in c.execute(
+            f"SELECT key, value FROM cache_entries WHERE {where}",  # noqa: S608
+            params,
+        ):
+            try:
+                self._serializer.loads(value)
+            except (json.JSONDecodeError, InvalidCacheEntryError, UnicodeDecodeError):
+                _log.warning("Cache entry %s is corrupted", key)
+                unreadable.append((key,))
+        c.executemany("DELETE FROM cache_entries WHERE key = ?", unreadable)
+
+    def _schedule_flush(self) -> None:
+        """Schedule a flush of the buffered writes, if one isn't scheduled already."""
+        store = self._store
+        if store.flush_task is None or store.flush_task.done():
+            store.flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+        try:
+            await self.flush()
+        except sqlite3.Error:
+            _log.exception("failed to flush sqlite cache %s", self._store.path)
+
+    async def _run(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        return await run_blocking(self._executor, self._store.run, fn)
+
+
+def _select_existing(
+    c: sqlite3.Connection, columns: str, keys: list[str]
+) -> dict[str, Any]:
+    """Select the rows matching the given keys, in chunks that fit within SQLite's parameter limit."""
+    result: dict[str, Any] = {}
+    for start in range(0, len(keys), _MAX_QUERY_PARAMETERS):
+        chunk = keys[start : start + _MAX_QUERY_PARAMETERS]
+        placeholders = ", ".join("?" * len(chunk))
+        for row in c.execute(
+            f"SELECT {columns} FROM cache_entries WHERE key IN ({placeholders})",  # noqa: S608
+            chunk,
+        ):
+            result[row[0]] = row[1] if len(row) > 1 else True
+    return result
+
+
+def _total_size(c: sqlite3.Connection, keys: list[str] | None = None) -> int:
+    """Get the total size of the given entries (or of every entry)."""
+    if keys is None:
+        (size,) = c.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()
+        return size
+    return sum(row_size for row_size in _select_existing(c, "key, size", keys).values())
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """Open a connection to the cache database."""
+    connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+    with suppress(sqlite3.OperationalError):
+        connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(_SCHEMA)
+    return connection
@@ -0,0 +1,239 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tiered cache implementation for the `Cache` protocol."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from fnllm.caching.base import Cache, CacheStats
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Coroutine, Mapping, Sequence
+
+_log = logging.getLogger(__name__)
+
+
+class TieredCache(Cache):
+    """
+    A cache composed of an ordered list of cache tiers (e.g. memory -> file -> blob).
+
+    Reads go through the tiers from fastest to slowest; a hit in a lower tier is promoted into every faster tier.
+    Writes are either written through to every tier, or (when `write_behind=True`) written to the fastest tier
+    immediately and flushed to the remaining tiers in the background. Use `flush()` to wait for pending background writes.
+
+    Note that promoted entries do not carry over their metadata, since `Cache.get` only returns the cached result.
+    """
+
+    def __init__(self, tiers: Sequence[Cache], *, write_behind: bool = False):
+        """Create a new TieredCache."""
+        if len(tiers) == 0:
+            msg = "TieredCache requires at least one cache tier."
+            raise ValueError(msg)
+
+        self._tiers = list(tiers)
+        self._write_behind = write_behind
+        self._pending: set[asyncio.Task[None]] = set()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def tiers(self) -> list[Cache]:
+        """The cache tiers, ordered from fastest to slowest."""
+        return self._tiers
+
+    async def has(self, key: str) -> bool:
+        """Check if any tier has a value."""
+        for tier in self._tiers:
+            if await tier.has(key):
+                return True
+        return False
+
+    async def get(self, key: str) -> Any | None:
+        """Retrieve a value from the fastest tier that has it."""
+        for index, tier in enumerate(self._tiers):
+            value = await tier.get(key)
+            if value is not None:
+                if index > 0:
+                    await asyncio.gather(*[
+                        upper.set(key, value) for upper in self._tiers[:index]
+                    ])
+                self._hits += 1
+                return value
+        self._misses += 1
+        return None
+
+    async def has_many(self, keys: Sequence[str]) -> list[bool]:
+        """Check if any tier has several values, querying each tier once for the keys still missing."""
+        results = [False] * len(keys)
+        missing = list(range(len(keys)))
+        for tier in self._tiers:
+            if not missing:
+                break
+            found = await tier.has_many([keys[i] for i in missing])
+            for i, has in zip(missing, found, strict=True):
+                results[i] = has
+            missing = [i for i, has in zip(missing, found, strict=True) if not has]
+        return results
+
+    async def get_many(self, keys: Sequence[str]) -> list[Any | None]:
+        """Retrieve several values, querying each tier once for the keys still missing."""
+        results: list[Any | None] = [None] * len(keys)
+        missing = list(range(len(keys)))
+        for index, tier in enumerate(self._tiers):
+            if not missing:
+                break
+            values = await tier.get_many([keys[i] for i in missing])
+            hits = {
+                keys[i]: value
+                for i, value in zip(missing, values, strict=True)
+                if value is not None
+            }
+            for i, value in zip(missing, values, strict=True):
+                results[i] = value
+            if hits and index > 0:
+                await asyncio.gather(*[
+                    upper.set_many(hits) for upper in self._tiers[:index]
+                ])
+            missing = [
+                i for i, value in zip(missing, values, strict=True) if value is None
+            ]
+        self._hits += len(keys) - len(missing)
+        self._misses += len(missing)
+        return results
+
+    async def remove(self, key: str) -> None:
+        """Remove a value from every tier, once the pending write-behind operations have landed."""
+        # a pending write landing after the removal would bring the entry back in the lower tiers
+        await self.flush()
+        await asyncio.gather(*[_remove(tier, key) for tier in self._tiers])
+
+    async def clear(self) -> None:
+        """Clear every tier, once the pending write-behind operations have landed."""
+        await self.flush()
+        await asyncio.gather(*[tier.clear() for tier in self._tiers])
+
+    async def sweep(self, age: int, *, remove_unreadable: bool = False) -> None:
+        """Sweep every tier that supports sweeping."""
+        for tier in self._tiers:
+            with suppress(NotImplementedError):
+                await tier.sweep(age, remove_unreadable=remove_unreadable)
+
+    async def set(
+        self, key: str, value: Any, metadata: dict[str, Any] | None = None
+    ) -> None:
+        """Write a value into the cache tiers."""
+        if not self._write_behind:
+            await asyncio.gather(*[
+                tier.set(key, value, metadata) for tier in self._tiers
+            ])
+            return
+
+        first, *rest = self._tiers
+        await first.set(key, value, metadata)
+        if rest:
+            self._track(_write_behind(rest, key, value, metadata))
+
+    async def set_many(
+        self,
+        values: Mapping[str, Any],
+        metadata: Mapping[str, dict[str, Any] | None] | None = None,
+    ) -> None:
+        """Write several values into the cache tiers."""
+        if not self._write_behind:
+            await asyncio.gather(*[
+                tier.set_many(values, metadata) for tier in self._tiers
+            ])
+            return
+
+        first, *rest = self._tiers
+        await first.set_many(values, metadata)
+        if rest:
+            self._track(_write_many_behind(rest, dict(values), metadata))
+
+    async def stats(self) -> CacheStats:
+        """
+        Get the size and usage statistics of the cache.
+
+        The size is that of the slowest tier (which holds every entry); reads count as hits when any tier has the
+        entry, and evictions are summed over the tiers.
+        """
+        tier_stats: list[CacheStats] = []
+        for tier in self._tiers:
+            with suppress(NotImplementedError):
+                tier_stats.append(await tier.stats())
+        if not tier_stats:
+            raise NotImplementedError
+
+        return CacheStats(
+            entries=tier_stats[-1].entries,
+            size=tier_stats[-1].size,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=sum(s.evictions for s in tier_stats),
+        )
+
+    async def iter_entries(self) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Iterate over the entries of the slowest tier (which holds every entry)."""
+        async for item in self._tiers[-1].iter_entries():
+            yield item
+
+    async def flush(self) -> None:
+        """Wait for any pending write-behind operations to complete."""
+        while self._pending:
+            await asyncio.gather(*self._pending)
+
+    def _track(self, write: Coroutine[Any, Any, None]) -> None:
+        """Run a write-behind operation in the background."""
+        task = asyncio.create_task(write)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def child(self, key: str) -> TieredCache:
+        """Create a child cache, fanning out across every tier."""
+        child = TieredCache(
+            [tier.child(key) for tier in self._tiers],
+            write_behind=self._write_behind,
+        )
+        # share pending writes so that flushing the parent flushes the children
+        child._pending = self._pending
+        return child
+
+
+async def _remove(tier: Cache, key: str) -> None:
+    """Remove a key from a tier, skipping tiers where it's missing."""
+    if await tier.has(key):
+        await tier.remove(key)
+
+
+async def _write_behind(
+    tiers: list[Cache], key: str, value: Any, metadata: dict[str, Any] | None
+) -> None:
+    """Write a value into the lower cache tiers."""
+    results = await asyncio.gather(
+        *[tier.set(key, value, metadata) for tier in tiers],
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            _log.warning("write-behind failed for cache entry %s: %s", key, result)
+
+
+async def _write_many_behind(
+    tiers: list[Cache],
+    values: dict[str, Any],
+    metadata: Mapping[str, dict[str, Any] | None] | None,
+) -> None:
+    """Write several values into the lower cache tiers."""
+    results = await asyncio.gather(
+        *[tier.set_many(values, metadata) for tier in tiers],
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            _log.warning(
+                "write-behind failed for %d cache entries: %s", len(values), result
+            )
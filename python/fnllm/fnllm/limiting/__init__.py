@@ -2,23 +2,41 @@
 
 """Limiting base package."""
 
+from .adaptive_concurrency import AdaptiveConcurrencyLimiter
 from .base import Limiter
 from .composite import CompositeLimiter
 from .concurrency import ConcurrencyLimiter
+from .coordinator import LimiterCoordinator
+from .fair_share import FairShareLimiter
 from .noop_llm import NoopLimiter
+from .priority import DeadlineExceededError, PriorityLimiter
+from .remote import LimiterOp, LimiterTransport, RemoteLimiter, TcpLimiterTransport
 from .rpm import RPMLimiter
+from .shared_token_bucket import SharedTokenBucket
+from .token_bucket import TokenBucket
 from .tpm import TPMLimiter
 from .types import LimitReconciler, LimitReconciliation, LimitUpdate, Manifest
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
     "CompositeLimiter",
     "ConcurrencyLimiter",
+    "DeadlineExceededError",
+    "FairShareLimiter",
     "LimitReconciler",
     "LimitReconciliation",
     "LimitUpdate",
     "Limiter",
+    "LimiterCoordinator",
+    "LimiterOp",
+    "LimiterTransport",
     "Manifest",
     "NoopLimiter",
+    "PriorityLimiter",
     "RPMLimiter",
+    "RemoteLimiter",
+    "SharedTokenBucket",
     "TPMLimiter",
+    "TcpLimiterTransport",
+    "TokenBucket",
 ]
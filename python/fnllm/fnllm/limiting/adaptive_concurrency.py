@@ -0,0 +1,152 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Adaptive concurrency limiter module."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from .base import Limiter
+
+if TYPE_CHECKING:
+    from fnllm.types.io import LLMOutput
+
+    from .types import LimitUpdate, Manifest
+
+_LATENCY_SMOOTHING = 0.2
+_BASELINE_SMOOTHING = 0.01
+
+
+class AdaptiveConcurrencyLimiter(Limiter):
+    """
+    A concurrency limiter with an AIMD (additive increase, multiplicative decrease) window.
+
+    The window grows by one slot for every window's worth of successful requests (reported through `reconcile`), as
+    long as the request latency stays within `latency_tolerance` times the baseline (lowest recent) latency. It is
+    cut by `decrease_factor` when the LLM signals overload (see `decrease`, e.g. on rate-limit errors). Decreases are
+    applied at most once per latency window (or `retry_after`), so a burst of errors from the same window only counts
+    once.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        """Create a new AdaptiveConcurrencyLimiter."""
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            msg = "AdaptiveConcurrencyLimiter limits must satisfy 1 <= min_limit <= initial_limit <= max_limit."
+            raise ValueError(msg)
+        self._limit = initial_limit
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._started: dict[int, float] = {}
+        self._successes = 0
+        self._latency: float | None = None
+        self._baseline_latency: float | None = None
+        self._next_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency window."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently holding a slot."""
+        return self._in_flight
+
+    async def acquire(self, manifest: Manifest) -> None:
+        """Acquire a concurrency slot."""
+        if manifest.request_tokens <= 0:
+            return
+        if self._in_flight >= self._limit or self._waiters:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            self._wake()
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # the slot was handed over while the acquisition was being cancelled; give it back
+                    self._in_flight -= 1
+                    self._wake()
+                raise
+        else:
+            self._in_flight += 1
+        self._started[id(manifest)] = asyncio.get_running_loop().time()
+
+    async def release(self, manifest: Manifest) -> None:
+        """Release the concurrency slot, and record the request latency."""
+        if manifest.request_tokens <= 0:
+            return
+        started = self._started.pop(id(manifest), None)
+        if started is not None:
+            self._record_latency(asyncio.get_running_loop().time() - started)
+        self._in_flight -= 1
+        self._wake()
+
+    async def reconcile(self, output: LLMOutput[Any, Any, Any]) -> LimitUpdate | None:
+        """Count a successful request, growing the window once a full window of requests succeeded with a healthy latency."""
+        if not self._is_latency_healthy():
+            self._successes = 0
+            return None
+        self._successes += 1
+        if self._successes >= self._limit:
+            self._successes = 0
+            if self._limit < self._max_limit:
+                self._limit += 1
+                self._wake()
+        return None
+
+    def decrease(self, retry_after: float | None = None) -> None:
+        """Cut the window multiplicatively, e.g. when a rate-limit error is received."""
+        now = asyncio.get_running_loop().time()
+        if now < self._next_decrease:
+            return
+        self._limit = max(self._min_limit, int(self._limit * self._decrease_factor))
+        self._successes = 0
+        self._next_decrease = now + max(self._latency or 0, retry_after or 0)
+
+    @classmethod
+    def from_max_concurrency(
+        cls, max_concurrency: int | None
+    ) -> AdaptiveConcurrencyLimiter:
+        """Create a new AdaptiveConcurrencyLimiter, bounded by `max_concurrency` and starting at a quarter of it (at most 32)."""
+        max_limit = max_concurrency or 1_000
+        return cls(initial_limit=max(1, min(max_limit // 4, 32)), max_limit=max_limit)
+
+    def _record_latency(self, latency: float) -> None:
+        if self._latency is None or self._baseline_latency is None:
+            self._latency = self._baseline_latency = latency
+            return
+        self._latency += (latency - self._latency) * _LATENCY_SMOOTHING
+        # the baseline follows the lowest latencies, and slowly drifts up when latencies rise for good
+        self._baseline_latency = min(
+            latency,
+            self._baseline_latency
+            + (latency - self._baseline_latency) * _BASELINE_SMOOTHING,
+        )
+
+    def _is_latency_healthy(self) -> bool:
+        if self._latency is None or self._baseline_latency is None:
+            return True
+        return self._latency <= self._baseline_latency * self._latency_tolerance
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self._limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
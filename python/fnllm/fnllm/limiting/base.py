@@ -5,8 +5,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from asyncio import Semaphore
-from typing import TYPE_CHECKING, Any, ClassVar
+from asyncio import Lock
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -17,9 +17,12 @@ if TYPE_CHECKING:
 
 
 class LimitContext:
-    """A context manager for limiting."""
+    """
+    A context manager for limiting.
 
-    acquire_semaphore: ClassVar[Semaphore] = Semaphore()
+    Acquisitions are serialized per limiter (e.g. per composite limiter of an LLM deployment), so a request waiting
+    on one limiter does not block requests going through other limiters.
+    """
 
     def __init__(self, limiter: Limiter, manifest: Manifest):
         """Create a new LimitContext."""
@@ -28,7 +31,7 @@ class LimitContext:
 
     async def __aenter__(self) -> LimitContext:  # noqa: PYI034 - Self requires python 3.11+
         """Enter the context."""
-        async with LimitContext.acquire_semaphore:
+        async with self._limiter.acquire_lock:
             await self._limiter.acquire(self._manifest)
         return self
 
@@ -45,6 +48,15 @@ class LimitContext:
 class Limiter(ABC):
     """Limiter interface."""
 
+    _acquire_lock: Lock | None = None
+
+    @property
+    def acquire_lock(self) -> Lock:
+        """The lock serializing the acquisitions of this limiter (see `use`)."""
+        if self._acquire_lock is None:
+            self._acquire_lock = Lock()
+        return self._acquire_lock
+
     @abstractmethod
     async def acquire(self, manifest: Manifest) -> None:
         """Acquire a pass through the limiter."""
@@ -0,0 +1,137 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Reference coordinator of the remote limiter protocol."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from .remote import LimiterOp
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class _Bucket:
+    capacity: float
+    time_period: float
+    tokens: float
+    updated: float
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.time_period
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class LimiterCoordinator:
+    """
+    A reference coordinator of global token buckets for `RemoteLimiter` clients, over asyncio.
+
+    Buckets are created by their first lease, with the capacity and time period of the client. A lease reserves its
+    `amount`, letting the bucket go into debt (the client waits for the returned `wait` before using the tokens), and
+    grants up to `prefetch` more tokens if the bucket has them to spare. Returned tokens go back into the bucket.
+
+    The coordinator implements `LimiterTransport`, so it can be used in-process; `start` serves it over TCP.
+    """
+
+    def __init__(self) -> None:
+        """Create a new LimiterCoordinator."""
+        self._buckets: dict[str, _Bucket] = {}
+        self._server: asyncio.Server | None = None
+        self._connections: set[asyncio.StreamWriter] = set()
+
+    @property
+    def address(self) -> tuple[str, int] | None:
+        """The (host, port) the coordinator is serving on, if started."""
+        if self._server is None:
+            return None
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return host, port
+
+    async def send(self, ops: Sequence[LimiterOp]) -> list[dict[str, Any]]:
+        """Apply a batch of operations."""
+        return [self._apply(op) for op in ops]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> tuple[str, int]:
+        """Serve the coordinator over TCP (on a free port by default). Returns the address it is serving on."""
+        self._server = await asyncio.start_server(self._serve, host, port)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        _log.info("limiter coordinator serving on %s:%d", host, port)
+        return host, port
+
+    async def close(self) -> None:
+        """Stop serving the coordinator, closing the client connections."""
+        if self._server is not None:
+            self._server.close()
+            for writer in self._connections:
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def _apply(self, op: LimiterOp) -> dict[str, Any]:
+        now = asyncio.get_running_loop().time()
+        match op["op"]:
+            case "lease":
+                bucket = self._buckets.get(op["bucket"])
+                if bucket is None:
+                    bucket = self._buckets[op["bucket"]] = _Bucket(
+                        op["capacity"], op["time_period"], op["capacity"], now
+                    )
+                bucket.refill(now)
+                bucket.tokens -= min(op["amount"], bucket.capacity)
+                prefetched = min(op.get("prefetch", 0), max(0, bucket.tokens))
+                bucket.tokens -= prefetched
+                return {
+                    "granted": op["amount"] + prefetched,
+                    "wait": max(0, -bucket.tokens / bucket.rate),
+                }
+            case "return":
+                bucket = self._buckets.get(op["bucket"])
+                if bucket is not None:
+                    bucket.refill(now)
+                    bucket.tokens = min(bucket.capacity, bucket.tokens + op["amount"])
+                return {}
+            case "update":
+                bucket = self._buckets.get(op["bucket"])
+                if bucket is not None:
+                    bucket.refill(now)
+                    if op.get("capacity"):
+                        bucket.capacity = op["capacity"]
+                    if op.get("available") is not None:
+                        bucket.tokens = op["available"]
+                    bucket.tokens = min(bucket.tokens, bucket.capacity)
+                return {}
+            case _:
+                msg = f"Unknown limiter operation: {op['op']}"
+                raise ValueError(msg)
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._connections.add(writer)
+        try:
+            while line := await reader.readline():
+                try:
+                    response: dict[str, Any] = {
+                        "results": await self.send(json.loads(line)["ops"])
+                    }
+                except (ValueError, KeyError, TypeError) as error:
+                    response = {"error": str(error)}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
@@ -0,0 +1,73 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Fair share limiter module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .priority import PriorityLimiter, _Waiter
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .base import Limiter
+    from .types import Manifest
+
+
+class FairShareLimiter(PriorityLimiter):
+    """
+    A limiter that shares a delegate limiter between flows (`Manifest.flow`, e.g. the names of child LLMs) by weight.
+
+    Waiting requests are admitted into the delegate in self-clocked weighted fair queuing order: each request is tagged
+    with the virtual time at which its flow would be done with it, given the flow's `weights` share (`default_weight`
+    for unlisted flows), and the request with the lowest tag goes first. A flow's cost is the number of request tokens
+    when `by_tokens` (i.e. sharing the TPM budget), or one per request otherwise. Idle flows do not build up credit, so
+    their unused share goes to the busy flows.
+
+    Priorities and deadlines are honored as with `PriorityLimiter`; the fair share applies within a priority.
+    """
+
+    def __init__(
+        self,
+        delegate: Limiter,
+        *,
+        weights: Mapping[str, float] | None = None,
+        default_weight: float = 1.0,
+        by_tokens: bool = True,
+        aging_interval: float = 10.0,
+    ):
+        """Create a new FairShareLimiter."""
+        super().__init__(delegate, aging_interval=aging_interval)
+        self._weights = dict(weights or {})
+        if default_weight <= 0 or any(w <= 0 for w in self._weights.values()):
+            msg = "FairShareLimiter weights must be positive."
+            raise ValueError(msg)
+        self._default_weight = default_weight
+        self._by_tokens = by_tokens
+        self._virtual_time = 0.0
+        self._finish_tags: dict[str | None, float] = {}
+
+    def _order(self, manifest: Manifest) -> float:
+        cost = (
+            max(1, manifest.request_tokens or manifest.post_request_tokens)
+            if self._by_tokens
+            else 1
+        )
+        weight = self._weights.get(manifest.flow or "", self._default_weight)
+        start = max(self._virtual_time, self._finish_tags.get(manifest.flow, 0.0))
+        finish = start + cost / weight
+        self._finish_tags[manifest.flow] = finish
+        return finish
+
+    def _pop_next(self) -> _Waiter | None:
+        waiter = super()._pop_next()
+        if waiter is not None:
+            self._virtual_time = max(self._virtual_time, waiter.order)
+            # the flows that fell behind the virtual time are idle; forget them
+            self._finish_tags = {
+                flow: tag
+                for flow, tag in self._finish_tags.items()
+                if tag > self._virtual_time
+            }
+        return waiter
@@ -0,0 +1,202 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Priority limiter module."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .base import LimitContext, Limiter
+
+if TYPE_CHECKING:
+    from fnllm.types.io import LLMOutput
+
+    from .types import LimitUpdate, Manifest
+
+
+class DeadlineExceededError(RuntimeError):
+    """The deadline of a request passed before it was admitted by the limiter."""
+
+    def __init__(self) -> None:
+        """Init method definition."""
+        super().__init__("The request deadline passed before it was admitted.")
+
+
+@dataclass(order=True)
+class _Waiter:
+    deadline: float
+    order: float
+    sequence: int
+    enqueued_at: float = field(compare=False)
+    manifest: Manifest = field(compare=False)
+    future: asyncio.Future[None] = field(compare=False, repr=False)
+    timer: asyncio.TimerHandle | None = field(default=None, compare=False, repr=False)
+
+
+class _PriorityLimitContext(LimitContext):
+    """A limit context that leaves the ordering of the acquisitions to the priority limiter."""
+
+    async def __aenter__(self) -> _PriorityLimitContext:  # noqa: PYI034 - Self requires python 3.11+
+        """Enter the context."""
+        await self._limiter.acquire(self._manifest)
+        return self
+
+
+class PriorityLimiter(Limiter):
+    """
+    A limiter that admits requests into a delegate limiter by priority.
+
+    Requests are admitted into the delegate (e.g. the composite limiter of an LLM deployment) one at a time, so when
+    capacity frees up, the waiting request with the highest `Manifest.priority` gets it first (earliest
+    `Manifest.deadline` first, then FIFO within a priority). To protect requests from starvation, the effective priority
+    of a waiting request grows by one for every `aging_interval` seconds it waited, so the longest waiting request of a
+    priority also overtakes the newer requests with earlier deadlines. Requests still waiting for their turn at their
+    deadline fail with a `DeadlineExceededError`.
+    """
+
+    def __init__(self, delegate: Limiter, *, aging_interval: float = 10.0):
+        """Create a new PriorityLimiter."""
+        if aging_interval <= 0:
+            msg = "PriorityLimiter aging_interval must be positive."
+            raise ValueError(msg)
+        self._delegate = delegate
+        self._aging_interval = aging_interval
+        self._queues: dict[int, list[_Waiter]] = {}
+        # the waiters of each priority in arrival order, to age them by their longest waiting request
+        self._arrivals: dict[int, deque[_Waiter]] = {}
+        self._sequence = itertools.count()
+        self._admitting = False
+
+    @property
+    def waiters(self) -> int:
+        """The number of requests waiting to be admitted."""
+        return sum(
+            1 for queue in self._queues.values() for w in queue if not w.future.done()
+        )
+
+    def use(self, manifest: Manifest) -> LimitContext:
+        """Limit for a given amount, admitting requests by priority."""
+        return _PriorityLimitContext(self, manifest)
+
+    async def acquire(self, manifest: Manifest) -> None:
+        """Wait for the turn of the request, then acquire it from the delegate limiter."""
+        if manifest.deadline is not None and time.time() >= manifest.deadline:
+            raise DeadlineExceededError
+
+        if not self._admitting and not self._queues:
+            self._admitting = True
+        else:
+            await self._wait_for_turn(manifest)
+
+        try:
+            async with self._delegate.acquire_lock:
+                await self._delegate.acquire(manifest)
+        finally:
+            self._admitting = False
+            self._wake()
+
+    async def release(self, manifest: Manifest) -> None:
+        """Release the request from the delegate limiter."""
+        await self._delegate.release(manifest)
+
+    async def reconcile(self, output: LLMOutput[Any, Any, Any]) -> LimitUpdate | None:
+        """Reconcile the delegate limiter."""
+        return await self._delegate.reconcile(output)
+
+    async def _wait_for_turn(self, manifest: Manifest) -> None:
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            deadline=math.inf if manifest.deadline is None else manifest.deadline,
+            order=self._order(manifest),
+            sequence=next(self._sequence),
+            enqueued_at=loop.time(),
+            manifest=manifest,
+            future=loop.create_future(),
+        )
+        if manifest.deadline is not None:
+            waiter.timer = loop.call_later(
+                manifest.deadline - time.time(), self._expire, waiter
+            )
+        heapq.heappush(self._queues.setdefault(manifest.priority, []), waiter)
+        self._arrivals.setdefault(manifest.priority, deque()).append(waiter)
+        self._wake()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # the turn was handed over while the acquisition was being cancelled; pass it on
+                self._admitting = False
+                self._wake()
+            else:
+                waiter.future.cancel()
+            raise
+        finally:
+            if waiter.timer is not None:
+                waiter.timer.cancel()
+
+    def _order(self, manifest: Manifest) -> float:
+        """The order of a request among the waiting requests with the same priority and deadline (FIFO by default)."""
+        return 0.0
+
+    def _expire(self, waiter: _Waiter) -> None:
+        if not waiter.future.done():
+            waiter.future.set_exception(DeadlineExceededError())
+
+    def _wake(self) -> None:
+        """Hand the turn to the waiting request with the highest effective priority, if no request is being admitted."""
+        if self._admitting:
+            return
+        waiter = self._pop_next()
+        if waiter is not None:
+            self._admitting = True
+            waiter.future.set_result(None)
+
+    def _pop_next(self) -> _Waiter | None:
+        now = asyncio.get_running_loop().time()
+        best: _Waiter | None = None
+        best_key: tuple[int, float, float, int] | None = None
+        for priority, queue in list(self._queues.items()):
+            arrivals = self._arrivals[priority]
+            while queue and queue[0].future.done():
+                heapq.heappop(queue)
+            while arrivals and arrivals[0].future.done():
+                arrivals.popleft()
+            if not queue:
+                del self._queues[priority]
+                del self._arrivals[priority]
+                continue
+            # the head of the queue, unless the longest waiting request aged past it
+            for waiter in (queue[0], arrivals[0]):
+                aging = int((now - waiter.enqueued_at) / self._aging_interval)
+                # highest effective priority first, then earliest deadline, then lowest order, then longest waiting
+                key = (
+                    priority + aging,
+                    -waiter.deadline,
+                    -waiter.order,
+                    -waiter.sequence,
+                )
+                if best_key is None or key > best_key:
+                    best, best_key = waiter, key
+
+        if best is None:
+            return None
+        priority = best.manifest.priority
+        queue, arrivals = self._queues[priority], self._arrivals[priority]
+        if queue[0] is best:
+            heapq.heappop(queue)
+        else:
+            queue.remove(best)
+            heapq.heapify(queue)
+        if arrivals[0] is best:
+            arrivals.popleft()
+        if not queue:
+            del self._queues[priority]
+            del self._arrivals[priority]
+        return best
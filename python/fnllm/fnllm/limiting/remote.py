@@ -0,0 +1,352 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Remote (distributed) limiter module."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Literal, Protocol
+
+from typing_extensions import NotRequired, TypedDict
+
+from .base import Limiter
+from .token_bucket import TokenBucket
+from .types import LimitUpdate
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from fnllm.types.io import LLMOutput
+
+    from .types import LimitReconciler, Manifest
+
+_log = logging.getLogger(__name__)
+
+_COORDINATOR_ERRORS = (OSError, asyncio.TimeoutError)
+"""The errors of an unreachable coordinator (connection failures and timeouts)."""
+
+
+class LimiterOp(TypedDict):
+    """An operation of the remote limiter protocol, on a named token bucket of the coordinator."""
+
+    op: Literal["lease", "return", "update"]
+    """The operation: lease tokens (result: `granted` tokens, usable after `wait` seconds), return unused leased tokens, or update the bucket limits."""
+
+    bucket: str
+    """The name of the token bucket."""
+
+    amount: NotRequired[float]
+    """The number of tokens to lease or return."""
+
+    prefetch: NotRequired[float]
+    """The number of extra tokens to lease, if the bucket has them to spare."""
+
+    capacity: NotRequired[float | None]
+    """The bucket capacity (used to create the bucket on lease, or as the new capacity on update)."""
+
+    time_period: NotRequired[float]
+    """The time (in seconds) to refill the bucket (used to create the bucket on lease)."""
+
+    available: NotRequired[float | None]
+    """The new number of available tokens, on update."""
+
+
+class LimiterTransport(Protocol):
+    """The transport of the remote limiter protocol: sends a batch of operations, and returns their results in order."""
+
+    async def send(self, ops: Sequence[LimiterOp]) -> list[dict[str, Any]]:
+        """Send a batch of operations to the coordinator."""
+        ...
+
+
+class TcpLimiterTransport:
+    """A transport of the remote limiter protocol, sending newline-delimited JSON messages over TCP."""
+
+    def __init__(self, host: str, port: int):
+        """Create a new TcpLimiterTransport. The connection is opened on first use, and reopened after failures."""
+        self._host = host
+        self._port = port
+        self._streams: tuple[asyncio.StreamReader, asyncio.StreamWriter] | None = None
+        self._lock = asyncio.Lock()
+
+    async def send(self, ops: Sequence[LimiterOp]) -> list[dict[str, Any]]:
+        """Send a batch of operations to the coordinator."""
+        async with self._lock:
+            try:
+                if self._streams is None:
+                    self._streams = await asyncio.open_connection(
+                        self._host, self._port
+                    )
+                reader, writer = self._streams
+                writer.write(json.dumps({"ops": ops}).encode() + b"\n")
+                await writer.drain()
+                line = await reader.readline()
+            except BaseException:
+                await self.close()
+                raise
+            if not line:
+                await self.close()
+                msg = "The limiter coordinator closed the connection."
+                raise ConnectionError(msg)
+
+        response = json.loads(line)
+        if "error" in response:
+            msg = (
+                f"The limiter coordinator rejected the operations: {response['error']}"
+            )
+            raise RuntimeError(msg)
+        return response["results"]
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._streams is not None:
+            _, writer = self._streams
+            self._streams = None
+            writer.close()
+
+
+class RemoteLimiter(Limiter):
+    """
+    A limiter sharing global RPM/TPM budgets through a coordinator (e.g. `LimiterCoordinator`).
+
+    Tokens are leased from the `{key}:rpm` and `{key}:tpm` token buckets of the coordinator. Each lease prefetches up
+    to `prefetch` (a fraction of the bucket capacity) extra tokens, so most acquisitions are served from the local lease
+    without a round-trip; unused leased tokens are returned to the coordinator after `lease_ttl` seconds. The
+    operations of concurrent acquisitions (and of the RPM and TPM buckets) are batched into a single message, and
+    batches are sent one at a time.
+
+    Reconciliations (e.g. from rate-limit response headers) update the limits of the coordinator buckets.
+
+    When the coordinator is unreachable (connection errors, or no response within `timeout` seconds), acquisitions fall
+    back to local token buckets at the same limits, and the coordinator is retried after `retry_interval` seconds,
+    doubling after each failure up to `max_retry_interval`. The local buckets only limit this process: while the
+    coordinator is down, the global limits are exceeded by the number of fallen back processes.
+    """
+
+    def __init__(
+        self,
+        transport: LimiterTransport,
+        *,
+        key: str,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        rpm_reconciler: LimitReconciler | None = None,
+        tpm_reconciler: LimitReconciler | None = None,
+        prefetch: float = 0.05,
+        lease_ttl: float = 5.0,
+        timeout: float = 10.0,
+        retry_interval: float = 1.0,
+        max_retry_interval: float = 30.0,
+    ):
+        """Create a new RemoteLimiter."""
+        self._transport = transport
+        self._capacities: dict[str, float] = {}
+        self._reconcilers: dict[str, LimitReconciler] = {}
+        self._rpm_bucket = f"{key}:rpm" if requests_per_minute is not None else None
+        self._tpm_bucket = f"{key}:tpm" if tokens_per_minute is not None else None
+        for bucket, capacity, reconciler in (
+            (self._rpm_bucket, requests_per_minute, rpm_reconciler),
+            (self._tpm_bucket, tokens_per_minute, tpm_reconciler),
+        ):
+            if bucket is not None and capacity is not None:
+                self._capacities[bucket] = capacity
+                if reconciler is not None:
+                    self._reconcilers[bucket] = reconciler
+        self._prefetch = prefetch
+        self._lease_ttl = lease_ttl
+        self._timeout = timeout
+        self._retry_interval = retry_interval
+        self._max_retry_interval = max_retry_interval
+        self._retry_delay = retry_interval
+        self._retry_at: float | None = None
+        self._local_buckets: dict[str, TokenBucket] = {}
+
+        self._leased: dict[str, float] = defaultdict(float)
+        self._return_timer: asyncio.TimerHandle | None = None
+        self._pending: list[tuple[list[LimiterOp], asyncio.Future[list[Any]]]] = []
+        self._send_lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def leased(self) -> dict[str, float]:
+        """The number of unused leased tokens, by bucket."""
+        return dict(self._leased)
+
+    @property
+    def is_local(self) -> bool:
+        """Whether the limiter has fallen back to local token buckets, as the coordinator is unreachable."""
+        return self._retry_at is not None
+
+    async def acquire(self, manifest: Manifest) -> None:
+        """Acquire the request (and its tokens), from the local leases or from the coordinator."""
+        costs: dict[str, float] = {}
+        if self._rpm_bucket is not None and manifest.request_tokens > 0:
+            costs[self._rpm_bucket] = 1
+        tokens = manifest.request_tokens + manifest.post_request_tokens
+        if self._tpm_bucket is not None and tokens > 0:
+            costs[self._tpm_bucket] = min(tokens, self._capacities[self._tpm_bucket])
+
+        retry_at = self._retry_at
+        if retry_at is not None and asyncio.get_running_loop().time() < retry_at:
+            await self._acquire_local(costs)
+            return
+
+        ops: list[LimiterOp] = []
+        for bucket, cost in costs.items():
+            if self._leased[bucket] >= cost:
+                self._leased[bucket] -= cost
+                continue
+            capacity = self._capacities[bucket]
+            ops.append({
+                "op": "lease",
+                "bucket": bucket,
+                "amount": cost - self._leased[bucket],
+                "prefetch": capacity * self._prefetch,
+                "capacity": capacity,
+                "time_period": 60,
+            })
+            self._leased[bucket] = 0
+        if not ops:
+            return
+
+        try:
+            results = await self._send(ops)
+        except _COORDINATOR_ERRORS:
+            self._coordinator_down()
+            await self._acquire_local({op["bucket"]: op["amount"] for op in ops})
+            return
+        self._coordinator_up()
+
+        wait = 0.0
+        for op, result in zip(ops, results, strict=True):
+            self._leased[op["bucket"]] += result["granted"] - op["amount"]
+            wait = max(wait, result["wait"])
+        self._schedule_return()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def release(self, manifest: Manifest) -> None:
+        """Do nothing."""
+
+    async def reconcile(self, output: LLMOutput[Any, Any, Any]) -> LimitUpdate | None:
+        """Update the limits of the coordinator buckets from the reconcilers."""
+        ops: list[LimiterOp] = []
+        update = None
+        for bucket, reconciler in self._reconcilers.items():
+            reconciliation = reconciler(output)
+            if reconciliation.limit is not None:
+                self._capacities[bucket] = reconciliation.limit
+            local_bucket = self._local_buckets.get(bucket)
+            if local_bucket is not None:
+                await local_bucket.reconcile(
+                    capacity=reconciliation.limit, available=reconciliation.remaining
+                )
+            ops.append({
+                "op": "update",
+                "bucket": bucket,
+                "capacity": reconciliation.limit,
+                "available": reconciliation.remaining,
+            })
+            update = LimitUpdate(
+                old_value=self._leased[bucket], new_value=reconciliation.remaining or 0
+            )
+        if ops and not self.is_local:
+            try:
+                await self._send(ops)
+            except _COORDINATOR_ERRORS:
+                self._coordinator_down()
+        return update
+
+    async def _send(self, ops: list[LimiterOp]) -> list[Any]:
+        """Send operations in the next batch."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((ops, future))
+        self._spawn(self._flush())
+        return await future
+
+    async def _flush(self) -> None:
+        async with self._send_lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return
+            try:
+                results = await asyncio.wait_for(
+                    self._transport.send([op for ops, _ in batch for op in ops]),
+                    self._timeout,
+                )
+            except Exception as error:  # noqa: BLE001 - the error is forwarded to the callers
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                return
+
+        start = 0
+        for ops, future in batch:
+            if not future.done():
+                future.set_result(results[start : start + len(ops)])
+            else:
+                # the caller was cancelled; keep its tokens for the next acquisitions
+                for op, result in zip(
+                    ops, results[start : start + len(ops)], strict=True
+                ):
+                    if op["op"] == "lease":
+                        self._leased[op["bucket"]] += result["granted"]
+            start += len(ops)
+
+    async def _acquire_local(self, costs: dict[str, float]) -> None:
+        """Acquire tokens from the local fallback buckets."""
+        for bucket, cost in costs.items():
+            local_bucket = self._local_buckets.get(bucket)
+            if local_bucket is None:
+                local_bucket = self._local_buckets[bucket] = TokenBucket(
+                    self._capacities[bucket], 60
+                )
+            await local_bucket.acquire(cost)
+
+    def _coordinator_down(self) -> None:
+        """Fall back to the local buckets, and schedule the next attempt to reach the coordinator."""
+        if self._retry_at is None:
+            _log.warning(
+                "limiter coordinator unreachable, falling back to local limits",
+                exc_info=True,
+            )
+        else:
+            self._retry_delay = min(self._retry_delay * 2, self._max_retry_interval)
+        self._retry_at = asyncio.get_running_loop().time() + self._retry_delay
+
+    def _coordinator_up(self) -> None:
+        if self._retry_at is not None:
+            _log.info("limiter coordinator reachable again")
+            self._retry_at = None
+            self._retry_delay = self._retry_interval
+
+    def _schedule_return(self) -> None:
+        if self._return_timer is None:
+            self._return_timer = asyncio.get_running_loop().call_later(
+                self._lease_ttl, self._return_leases
+            )
+
+    def _return_leases(self) -> None:
+        self._return_timer = None
+        ops: list[LimiterOp] = [
+            {"op": "return", "bucket": bucket, "amount": amount}
+            for bucket, amount in self._leased.items()
+            if amount > 0
+        ]
+        self._leased.clear()
+        if ops:
+            self._spawn(self._return(ops))
+
+    async def _return(self, ops: list[LimiterOp]) -> None:
+        try:
+            await self._send(ops)
+        except (*_COORDINATOR_ERRORS, RuntimeError):
+            _log.exception("failed to return leased tokens to the limiter coordinator")
+
+    def _spawn(self, coroutine: Any) -> None:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
@@ -6,13 +6,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from aiolimiter import AsyncLimiter
-
 from .base import Limiter
+from .token_bucket import TokenBucket
 from .types import LimitUpdate
-from .update_limiter import update_limiter
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from fnllm.types.io import LLMOutput
 
     from .types import LimitReconciler, Manifest
@@ -23,7 +23,7 @@ class RPMLimiter(Limiter):
 
     def __init__(
         self,
-        limiter: AsyncLimiter,
+        limiter: TokenBucket,
         reconciler: LimitReconciler | None = None,
         *,
         rps: bool,
@@ -54,7 +54,10 @@ class RPMLimiter(Limiter):
                     # remaining requests to a rate.
                     reconciliation.remaining = _rpm_to_rps(reconciliation.remaining)
                     reconciliation.limit = _rpm_to_rps(reconciliation.limit)
-                old = update_limiter(self._limiter, reconciliation)
+                old = await self._limiter.reconcile(
+                    capacity=reconciliation.limit,
+                    available=reconciliation.remaining,
+                )
                 return LimitUpdate(
                     old_value=old, new_value=reconciliation.remaining or 0
                 )
@@ -66,18 +69,19 @@ class RPMLimiter(Limiter):
         requests_per_minute: int,
         burst_mode: bool = True,
         reconciler: LimitReconciler | None = None,
+        token_bucket: Callable[[float, float], TokenBucket] = TokenBucket,
     ) -> RPMLimiter:
-        """Create a new RPMLimiter."""
+        """Create a new RPMLimiter. `token_bucket` creates the bucket from its capacity and time period."""
         if burst_mode:
             return cls(
-                AsyncLimiter(requests_per_minute, time_period=60),
+                token_bucket(requests_per_minute, 60),
                 reconciler=reconciler,
                 rps=False,
             )
 
         rps = _rpm_to_rps(requests_per_minute)
         return cls(
-            AsyncLimiter(rps, 1),
+            token_bucket(rps, 1),
             reconciler=reconciler,
             rps=True,
         )
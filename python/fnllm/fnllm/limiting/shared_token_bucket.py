@@ -0,0 +1,214 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Token bucket shared between processes, through a SQLite database."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from fnllm.caching.executor import run_blocking
+
+from .token_bucket import TokenBucket
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS token_buckets (
+    name TEXT PRIMARY KEY,
+    capacity REAL NOT NULL,
+    time_period REAL NOT NULL,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    A token bucket shared between the processes of a host, through a SQLite database file.
+
+    The bucket state lives in the `token_buckets` table of the database at `path`, under `name`, so processes using the
+    same path and name split a single budget. Each acquisition reserves its tokens in one transaction, letting the
+    bucket go into debt, then waits for the refill to repay the debt: acquisitions are granted in FIFO order across
+    processes, without polling the database.
+
+    The first process creates the bucket with its `capacity` and `time_period`; updates (e.g. `reconcile` from
+    rate-limit response headers) apply to every process.
+
+    Database transactions wait for the other processes to release the database, so `acquire` and `reconcile` run them
+    in `executor` (or the shared I/O pool). `available`, `has_capacity` and `update` block the calling thread.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        capacity: float,
+        time_period: float = 60,
+        *,
+        name: str = "default",
+        executor: Executor | None = None,
+    ):
+        """Create a new SharedTokenBucket, or attach to an existing one."""
+        super().__init__(capacity, time_period)
+        self._path = Path(path)
+        self._name = name
+        self._executor = executor
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._sleeping = 0
+        self._tasks: set[asyncio.Task[Any]] = set()
+
+    @property
+    def name(self) -> str:
+        """The name of the bucket in the database."""
+        return self._name
+
+    @property
+    def available(self) -> float:
+        """The number of tokens currently in the bucket (blocking database read)."""
+        return max(0, self._run(self._load))
+
+    @property
+    def waiters(self) -> int:
+        """The number of pending acquisitions of this process."""
+        return self._sleeping
+
+    def has_capacity(self, amount: float = 1) -> bool:
+        """Check whether `amount` tokens could be acquired without waiting (blocking database read)."""
+        return self.available >= min(amount, self._capacity)
+
+    async def acquire(self, amount: float = 1) -> None:
+        """
+        Acquire `amount` tokens, waiting for them to become available.
+
+        Acquisitions larger than the bucket capacity wait for a full bucket.
+        """
+        amount = min(amount, self._capacity)
+        tokens = await run_blocking(self._executor, self._run, self._take, amount)
+        if tokens >= 0:
+            return
+
+        self._sleeping += 1
+        try:
+            await asyncio.sleep(-tokens / self.rate)
+        except asyncio.CancelledError:
+            # give the reserved tokens back to the other acquisitions, without blocking the event loop
+            task = asyncio.create_task(
+                run_blocking(self._executor, self._run, self._take, -amount)
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            raise
+        finally:
+            self._sleeping -= 1
+
+    def update(
+        self,
+        *,
+        capacity: float | None = None,
+        time_period: float | None = None,
+        available: float | None = None,
+    ) -> None:
+        """Update the capacity, the time period, and/or the number of available tokens of the shared bucket (blocking)."""
+        self._run(self._update, capacity, time_period, available)
+
+    async def reconcile(
+        self, *, capacity: float | None = None, available: float | None = None
+    ) -> float:
+        """Update the capacity and/or the number of available tokens of the shared bucket. Returns the number of tokens available before the update."""
+        return await run_blocking(
+            self._executor, self._run, self._update, capacity, None, available
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _update(
+        self,
+        c: sqlite3.Connection,
+        capacity: float | None,
+        time_period: float | None,
+        available: float | None,
+    ) -> float:
+        """Update the bucket. Returns the tokens available before the update."""
+        tokens = self._load(c)
+        old = max(0, tokens)
+        if capacity is not None and capacity > 0:
+            self._capacity = capacity
+        if time_period is not None and time_period > 0:
+            self._time_period = time_period
+        if available is not None:
+            # keep the debt of the sleeping acquisitions, whose reserved tokens are not among the available ones
+            tokens = max(0, available) + min(0, tokens)
+        self._store(c, min(tokens, self._capacity))
+        return old
+
+    def _take(self, c: sqlite3.Connection, amount: float) -> float:
+        """Take tokens from the bucket, possibly going into debt. Returns the tokens left."""
+        tokens = min(self._load(c) - amount, self._capacity)
+        self._store(c, tokens)
+        return tokens
+
+    def _load(self, c: sqlite3.Connection) -> float:
+        """Load the bucket settings, and get its refilled tokens (a new bucket is full)."""
+        now = time.time()
+        row = c.execute(
+            "SELECT capacity, time_period, tokens, updated FROM token_buckets WHERE name = ?",
+            (self._name,),
+        ).fetchone()
+        if row is None:
+            return self._capacity
+        self._capacity, self._time_period, tokens, updated = row
+        return min(self._capacity, tokens + max(0, now - updated) * self.rate)
+
+    def _store(self, c: sqlite3.Connection, tokens: float) -> None:
+        c.execute(
+            """
+            INSERT INTO token_buckets (name, capacity, time_period, tokens, updated) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (name) DO UPDATE SET
+                capacity = excluded.capacity,
+                time_period = excluded.time_period,
+                tokens = excluded.tokens,
+                updated = excluded.updated
+            """,
+            (self._name, self._capacity, self._time_period, tokens, time.time()),
+        )
+
+    def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a function in an immediate transaction, serialized across the threads and processes."""
+        with self._lock:
+            if self._connection is None:
+                self._connection = _connect(self._path)
+            c = self._connection
+            c.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(c, *args)
+            except BaseException:
+                c.execute("ROLLBACK")
+                raise
+            c.execute("COMMIT")
+            return result
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """Open a connection to the coordination database."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(
+        path, check_same_thread=False, timeout=30, isolation_level=None
+    )
+    with suppress(sqlite3.OperationalError):
+        connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(_SCHEMA)
+    return connection
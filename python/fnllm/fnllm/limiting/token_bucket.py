@@ -0,0 +1,153 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Token bucket module."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+
+
+@dataclass
+class _Waiter:
+    amount: float
+    future: asyncio.Future[None] = field(repr=False)
+
+
+class TokenBucket:
+    """
+    An async token bucket.
+
+    The bucket holds up to `capacity` tokens, and refills at `capacity / time_period` tokens per second. Acquisitions
+    are granted in FIFO order: an acquisition never overtakes an earlier one, even if there would be enough tokens for
+    it, so large acquisitions cannot be starved by small ones. Only the waiters at the head of the queue are woken up
+    when tokens become available, so thousands of waiters do not cause thundering herds.
+
+    The capacity and the available tokens can be updated at runtime (e.g. from rate-limit response headers).
+    """
+
+    def __init__(self, capacity: float, time_period: float = 60):
+        """Create a new TokenBucket, initially full."""
+        if capacity <= 0 or time_period <= 0:
+            msg = "TokenBucket capacity and time_period must be positive."
+            raise ValueError(msg)
+        self._capacity = capacity
+        self._time_period = time_period
+        self._tokens = capacity
+        self._last_refill: float | None = None
+        self._waiters: deque[_Waiter] = deque()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def capacity(self) -> float:
+        """The maximum number of tokens in the bucket."""
+        return self._capacity
+
+    @property
+    def time_period(self) -> float:
+        """The time (in seconds) it takes to refill an empty bucket."""
+        return self._time_period
+
+    @property
+    def rate(self) -> float:
+        """The refill rate, in tokens per second."""
+        return self._capacity / self._time_period
+
+    @property
+    def available(self) -> float:
+        """The number of tokens currently in the bucket."""
+        self._refill()
+        return self._tokens
+
+    @property
+    def waiters(self) -> int:
+        """The number of pending acquisitions."""
+        return sum(1 for w in self._waiters if not w.future.done())
+
+    def has_capacity(self, amount: float = 1) -> bool:
+        """Check whether `amount` tokens could be acquired without waiting."""
+        return not self._waiters and self.available >= min(amount, self._capacity)
+
+    async def acquire(self, amount: float = 1) -> None:
+        """
+        Acquire `amount` tokens, waiting for them to become available.
+
+        Acquisitions larger than the bucket capacity wait for a full bucket.
+        """
+        if self.has_capacity(amount):
+            self._tokens -= min(amount, self._capacity)
+            return
+
+        waiter = _Waiter(amount, asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        self._wake()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # the tokens were granted while the acquisition was being cancelled; give them back
+                self._tokens += min(waiter.amount, self._capacity)
+            else:
+                waiter.future.cancel()
+            self._wake()
+            raise
+
+    def update(
+        self,
+        *,
+        capacity: float | None = None,
+        time_period: float | None = None,
+        available: float | None = None,
+    ) -> None:
+        """Update the capacity, the time period, and/or the number of available tokens of the bucket."""
+        self._refill()
+        if capacity is not None and capacity > 0:
+            self._capacity = capacity
+        if time_period is not None and time_period > 0:
+            self._time_period = time_period
+        if available is not None:
+            self._tokens = available
+        self._tokens = max(0, min(self._tokens, self._capacity))
+        self._wake()
+
+    async def reconcile(
+        self, *, capacity: float | None = None, available: float | None = None
+    ) -> float:
+        """Update the capacity and/or the number of available tokens of the bucket (e.g. from rate-limit response headers). Returns the number of tokens available before the update."""
+        old = self.available
+        self.update(capacity=capacity, available=available)
+        return old
+
+    def _refill(self) -> None:
+        try:
+            now = asyncio.get_running_loop().time()
+        except RuntimeError:
+            return
+        if self._last_refill is not None:
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._last_refill) * self.rate
+            )
+        self._last_refill = now
+
+    def _wake(self) -> None:
+        """Grant the tokens of the waiters at the head of the queue, and schedule a wakeup for the next one."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        self._refill()
+        while self._waiters:
+            waiter = self._waiters[0]
+            if waiter.future.done():
+                self._waiters.popleft()
+                continue
+            amount = min(waiter.amount, self._capacity)
+            if self._tokens < amount:
+                loop = asyncio.get_running_loop()
+                delay = (amount - self._tokens) / self.rate
+                self._timer = loop.call_later(delay, self._wake)
+                return
+            self._tokens -= amount
+            self._waiters.popleft()
+            waiter.future.set_result(None)
@@ -6,14 +6,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from aiolimiter import AsyncLimiter
-
 from fnllm.limiting.base import Limiter
 
+from .token_bucket import TokenBucket
 from .types import LimitReconciler, LimitUpdate
-from .update_limiter import update_limiter
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from fnllm.types.io import LLMOutput
 
     from .types import LimitReconciler, Manifest
@@ -24,7 +24,7 @@ class TPMLimiter(Limiter):
 
     def __init__(
         self,
-        limiter: AsyncLimiter,
+        limiter: TokenBucket,
         tokens_per_minute: int,
         reconciler: LimitReconciler | None = None,
     ) -> None:
@@ -46,7 +46,9 @@ class TPMLimiter(Limiter):
         """Limit for a given amount (default = 1)."""
         if self._reconciler is not None:
             reconciliation = self._reconciler(output)
-            old = update_limiter(self._limiter, reconciliation)
+            old = await self._limiter.reconcile(
+                capacity=reconciliation.limit, available=reconciliation.remaining
+            )
             return LimitUpdate(old_value=old, new_value=reconciliation.remaining or 0)
 
         return None
@@ -57,10 +59,11 @@ class TPMLimiter(Limiter):
         tokens_per_minute: int,
         *,
         reconciler: LimitReconciler | None = None,
+        token_bucket: Callable[[float, float], TokenBucket] = TokenBucket,
     ) -> TPMLimiter:
-        """Create a new RpmLimiter."""
+        """Create a new RpmLimiter. `token_bucket` creates the bucket from its capacity and time period."""
         return cls(
-            AsyncLimiter(tokens_per_minute),
+            token_bucket(tokens_per_minute, 60),
             tokens_per_minute,
             reconciler=reconciler,
         )
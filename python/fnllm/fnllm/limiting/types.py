@@ -36,6 +36,15 @@ class Manifest:
     post_request_tokens: int = 0
     """The number of tokens to acquire or release after the request is complete."""
 
+    priority: int = 0
+    """The scheduling priority of the request (higher is admitted first, see `PriorityLimiter`)."""
+
+    deadline: float | None = None
+    """The time (as a `time.time()` timestamp) by which the request must be admitted (see `PriorityLimiter`)."""
+
+    flow: str | None = None
+    """The flow the request belongs to, e.g. the name of a child LLM (see `FairShareLimiter`)."""
+
 
 @dataclass
 class LimitUpdate:
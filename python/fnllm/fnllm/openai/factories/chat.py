@@ -7,6 +7,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from fnllm.base.services.cached import Cached
+from fnllm.base.services.streaming_cached import StreamingCached
 from fnllm.base.services.variable_injector import VariableInjector
 from fnllm.events.base import LLMEvents
 from fnllm.openai.llm.openai_chat_llm import OpenAIChatLLMImpl
@@ -16,6 +17,9 @@ from fnllm.openai.services.openai_history_extractor import (
     OpenAIHistoryExtractor,
 )
 from fnllm.openai.services.openai_json import create_json_handler
+from fnllm.openai.services.openai_streaming_chat_cache_adapter import (
+    OpenAIStreamingChatCacheAdapter,
+)
 from fnllm.openai.services.openai_text_chat_cache_adapter import (
     OpenAITextChatCacheAdapter,
 )
@@ -26,14 +30,18 @@ from fnllm.openai.services.openai_usage_extractor import (
 
 from .client import create_openai_client
 from .utils import (
+    create_adaptive_concurrency_limiter,
     create_backoff_limiter,
+    create_content_store,
     create_limiter,
     create_rate_limiter,
     create_retryer,
 )
 
 if TYPE_CHECKING:
+    from fnllm.base.services.semantic_cache import SemanticCache
     from fnllm.caching.base import Cache
+    from fnllm.limiting.adaptive_concurrency import AdaptiveConcurrencyLimiter
     from fnllm.limiting.base import Limiter
     from fnllm.openai.config import OpenAIConfig
     from fnllm.openai.services.openai_retryable_error_handler import (
@@ -53,25 +61,30 @@ def create_openai_chat_llm(
     client: OpenAIClient | None = None,
     cache: Cache | None = None,
     events: LLMEvents | None = None,
+    semantic_cache: SemanticCache | None = None,
 ) -> OpenAIChatLLM:
-    """Create an OpenAI chat LLM."""
+    """Create an OpenAI chat LLM. A `semantic_cache` serves near-duplicate prompts from the `cache`."""
     client = client or create_openai_client(config)
     events = events or LLMEvents()
 
     backoff_limiter = create_backoff_limiter()
-    limiter = create_limiter(config, backoff_limiter)
+    concurrency_limiter = create_adaptive_concurrency_limiter(config)
+    limiter = create_limiter(config, backoff_limiter, concurrency_limiter)
 
     text_chat_llm = _create_openai_text_chat_llm(
         client=client,
         config=config,
         cache=cache,
+        semantic_cache=semantic_cache,
         events=events,
         limiter=limiter,
         backoff_limiter=backoff_limiter,
+        concurrency_limiter=concurrency_limiter,
     )
     streaming_chat_llm = _create_openai_streaming_chat_llm(
         client=client,
         config=config,
+        cache=cache,
         events=events,
         limiter=limiter,
     )
@@ -89,6 +102,8 @@ def _create_openai_text_chat_llm(
     backoff_limiter: OpenAIBackoffLimiter | None,
     cache: Cache | None,
     events: LLMEvents,
+    semantic_cache: SemanticCache | None = None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> OpenAITextChatLLM:
     operation = "chat"
     events = events or LLMEvents()
@@ -96,7 +111,7 @@ def _create_openai_text_chat_llm(
         client,
         model=config.model,
         model_parameters=config.chat_parameters,
-        cached=_create_cached_chat_handler(config, cache, events),
+        cached=_create_cached_chat_handler(config, cache, events, semantic_cache),
         events=events,
         json_receiver=create_json_handler(
             config.json_strategy, config.max_json_retries
@@ -109,6 +124,7 @@ def _create_openai_text_chat_llm(
             operation=operation,
             events=events,
             backoff_limiter=backoff_limiter,
+            concurrency_limiter=concurrency_limiter,
         ),
         rate_limiter=create_rate_limiter(config=config, limiter=limiter, events=events),
         special_token_behavior=config.special_token_behavior,
@@ -123,12 +139,14 @@ def _create_openai_streaming_chat_llm(
     config: OpenAIConfig,
     limiter: Limiter | None,
     events: LLMEvents,
+    cache: Cache | None = None,
 ) -> OpenAIStreamingChatLLM:
     """Create an OpenAI streaming chat LLM."""
     return OpenAIStreamingChatLLMImpl(
         client,
         model=config.model,
         model_parameters=config.chat_parameters,
+        cached=_create_cached_streaming_chat_handler(config, cache, events),
         events=events,
         emit_usage=config.track_stream_usage,
         variable_injector=VariableInjector(),
@@ -141,9 +159,10 @@ def _create_cached_chat_handler(
     config: OpenAIConfig,
     cache: Cache | None,
     events: LLMEvents,
+    semantic_cache: SemanticCache | None = None,
 ) -> Cached | None:
     """Create a cache handler."""
-    if not cache:
+    if cache is None:
         return None
     return Cached(
         cache=cache,
@@ -154,4 +173,29 @@ def _create_cached_chat_handler(
             global_parameters=config.chat_parameters,
             special_token_behavior=config.special_token_behavior,
         ),
+        metadata_policy=config.cache_metadata_policy,
+        content_store=create_content_store(config, cache),
+        semantic_cache=semantic_cache,
+    )
+
+
+def _create_cached_streaming_chat_handler(
+    config: OpenAIConfig,
+    cache: Cache | None,
+    events: LLMEvents,
+) -> StreamingCached | None:
+    """Create a streaming cache handler."""
+    if cache is None:
+        return None
+    return StreamingCached(
+        cache=cache,
+        events=events,
+        cache_adapter=OpenAIStreamingChatCacheAdapter(
+            cache,
+            model=config.model,
+            global_parameters=config.chat_parameters,
+            special_token_behavior=config.special_token_behavior,
+        ),
+        metadata_policy=config.cache_metadata_policy,
+        content_store=create_content_store(config, cache),
     )
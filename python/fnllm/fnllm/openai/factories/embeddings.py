@@ -19,7 +19,9 @@ from fnllm.openai.services.openai_usage_extractor import (
 
 from .client import create_openai_client
 from .utils import (
+    create_adaptive_concurrency_limiter,
     create_backoff_limiter,
+    create_content_store,
     create_limiter,
     create_rate_limiter,
     create_retryer,
@@ -43,7 +45,8 @@ def create_openai_embeddings_llm(
     client = client or create_openai_client(config)
     events = events or LLMEvents()
     backoff_limiter = create_backoff_limiter()
-    limiter = create_limiter(config, backoff_limiter)
+    concurrency_limiter = create_adaptive_concurrency_limiter(config)
+    limiter = create_limiter(config, backoff_limiter, concurrency_limiter)
     return OpenAIEmbeddingsLLMImpl(
         client,
         model=config.model,
@@ -58,6 +61,7 @@ def create_openai_embeddings_llm(
             operation=operation,
             events=events,
             backoff_limiter=backoff_limiter,
+            concurrency_limiter=concurrency_limiter,
         ),
     )
 
@@ -68,7 +72,7 @@ def _create_cached_embeddings_handler(
     events: LLMEvents,
 ) -> Cached | None:
     """Create a cache handler."""
-    if not cache:
+    if cache is None:
         return None
     return Cached(
         cache=cache,
@@ -78,4 +82,6 @@ def _create_cached_embeddings_handler(
             model=config.model,
             global_parameters=config.embeddings_parameters,
         ),
+        metadata_policy=config.cache_metadata_policy,
+        content_store=create_content_store(config, cache),
     )
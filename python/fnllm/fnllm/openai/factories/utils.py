@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import tiktoken
@@ -11,9 +12,16 @@ import tiktoken
 from fnllm.base.config.retry_strategy import RetryStrategy
 from fnllm.base.services.rate_limiter import RateLimiter
 from fnllm.base.services.retryer import Retryer
+from fnllm.caching.content import CONTENT_STORE_NAMESPACE, ContentStore
+from fnllm.limiting.adaptive_concurrency import AdaptiveConcurrencyLimiter
 from fnllm.limiting.composite import CompositeLimiter
 from fnllm.limiting.concurrency import ConcurrencyLimiter
+from fnllm.limiting.fair_share import FairShareLimiter
+from fnllm.limiting.priority import PriorityLimiter
+from fnllm.limiting.remote import RemoteLimiter, TcpLimiterTransport
 from fnllm.limiting.rpm import RPMLimiter
+from fnllm.limiting.shared_token_bucket import SharedTokenBucket
+from fnllm.limiting.token_bucket import TokenBucket
 from fnllm.limiting.tpm import TPMLimiter
 from fnllm.limiting.types import LimitReconciliation
 from fnllm.openai.services.openai_retryable_error_handler import (
@@ -24,8 +32,11 @@ from fnllm.openai.services.openai_retryable_error_handler import (
 from fnllm.openai.services.openai_token_estimator import OpenAITokenEstimator
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from httpx import Headers
 
+    from fnllm.caching.base import Cache
     from fnllm.events.base import LLMEvents
     from fnllm.limiting.base import Limiter
     from fnllm.openai.config import OpenAIConfig
@@ -63,9 +74,19 @@ def create_backoff_limiter() -> OpenAIBackoffLimiter:
     return OpenAIBackoffLimiter()
 
 
+def create_adaptive_concurrency_limiter(
+    config: OpenAIConfig,
+) -> AdaptiveConcurrencyLimiter | None:
+    """Create an adaptive concurrency limiter, if enabled in the configuration."""
+    if not config.adaptive_concurrency:
+        return None
+    return AdaptiveConcurrencyLimiter.from_max_concurrency(config.max_concurrency)
+
+
 def create_limiter(
     config: OpenAIConfig,
     backoff_limiter: OpenAIBackoffLimiter | None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> Limiter | None:
     """Create an LLM limiter based on the incoming configuration."""
     limiters = []
@@ -76,10 +97,16 @@ def create_limiter(
     rpm = config.requests_per_minute
     tpm = config.tokens_per_minute
 
-    if config.max_concurrency:
+    if concurrency_limiter is not None:
+        limiters.append(concurrency_limiter)
+    elif config.max_concurrency:
         limiters.append(ConcurrencyLimiter.from_max_concurrency(config.max_concurrency))
 
-    if rpm is not None:
+    remote_limiter = _create_remote_limiter(config)
+    if remote_limiter is not None:
+        limiters.append(remote_limiter)
+
+    if rpm is not None and remote_limiter is None:
         # If RPM is set to 0, enable dynamic RPM
         reconciler = None
         if rpm == "auto":
@@ -91,10 +118,11 @@ def create_limiter(
                 rpm,
                 burst_mode=config.requests_burst_mode,
                 reconciler=reconciler,
+                token_bucket=_token_bucket_factory(config, "rpm"),
             )
         )
 
-    if tpm is not None:
+    if tpm is not None and remote_limiter is None:
         # If RPM is set to 0, enable dynamic RPM
         reconciler = None
         if tpm == "auto":
@@ -105,14 +133,61 @@ def create_limiter(
             TPMLimiter.from_tpm(
                 tpm,
                 reconciler=reconciler,
+                token_bucket=_token_bucket_factory(config, "tpm"),
             )
         )
 
     if len(limiters) == 0:
         return None
-    if len(limiters) == 1:
-        return limiters[0]
-    return CompositeLimiter(limiters)
+    limiter = limiters[0] if len(limiters) == 1 else CompositeLimiter(limiters)
+    if config.fair_share_weights is not None:
+        # share the TPM budget if there is one, the requests otherwise
+        return FairShareLimiter(
+            limiter,
+            weights=config.fair_share_weights,
+            by_tokens=tpm is not None,
+            aging_interval=config.priority_aging_interval,
+        )
+    if config.priority_scheduling:
+        return PriorityLimiter(limiter, aging_interval=config.priority_aging_interval)
+    return limiter
+
+
+def _token_bucket_factory(
+    config: OpenAIConfig, kind: str
+) -> Callable[[float, float], TokenBucket]:
+    """Get the factory of the RPM/TPM token buckets: shared between processes if configured, local otherwise."""
+    if config.shared_limits_path is None:
+        return TokenBucket
+    return partial(
+        SharedTokenBucket,
+        config.shared_limits_path,
+        name=f"{_shared_limits_key(config)}:{kind}",
+    )
+
+
+def _create_remote_limiter(config: OpenAIConfig) -> RemoteLimiter | None:
+    """Create a limiter of the RPM/TPM limits shared through a remote coordinator, if configured."""
+    rpm = config.requests_per_minute
+    tpm = config.tokens_per_minute
+    if config.remote_limits_address is None or (rpm is None and tpm is None):
+        return None
+    host, _, port = config.remote_limits_address.rpartition(":")
+    return RemoteLimiter(
+        TcpLimiterTransport(host, int(port)),
+        key=_shared_limits_key(config),
+        # "auto" limits start at 1, and are reconciled from the response headers
+        requests_per_minute=1 if rpm == "auto" else rpm,
+        tokens_per_minute=1 if tpm == "auto" else tpm,
+        rpm_reconciler=_rpm_reconciler if rpm == "auto" else None,
+        tpm_reconciler=_tpm_reconciler if tpm == "auto" else None,
+    )
+
+
+def _shared_limits_key(config: OpenAIConfig) -> str:
+    return (
+        config.shared_limits_key or getattr(config, "deployment", None) or config.model
+    )
 
 
 def create_rate_limiter(
@@ -139,6 +214,7 @@ def create_retryer(
     operation: str,
     events: LLMEvents,
     backoff_limiter: OpenAIBackoffLimiter | None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> Retryer[Any, Any, Any, Any] | None:
     """Wraps the LLM with retry logic."""
     if config.retry_strategy is RetryStrategy.NATIVE:
@@ -146,7 +222,7 @@ def create_retryer(
     handler = None
     if backoff_limiter is not None:
         handler = OpenAIRetryableErrorHandler(
-            backoff_limiter, config.rate_limit_behavior
+            backoff_limiter, config.rate_limit_behavior, concurrency_limiter
         )
     return Retryer(
         tag=operation,
@@ -157,3 +233,10 @@ def create_retryer(
         retryable_errors=OPENAI_RETRYABLE_ERRORS,
         retryable_error_handler=handler,
     )
+
+
+def create_content_store(config: OpenAIConfig, cache: Cache) -> ContentStore | None:
+    """Create the content store of the cache metadata, if enabled."""
+    if not config.cache_content_store:
+        return None
+    return ContentStore(cache.child(CONTENT_STORE_NAMESPACE))
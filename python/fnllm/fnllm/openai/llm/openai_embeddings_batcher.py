@@ -4,15 +4,19 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, TypeAlias
+from typing import TYPE_CHECKING, Any, TypeAlias, cast
 
 from numpy import average
 
-from fnllm.utils.batch import Batcher, CallBatch
+from fnllm.caching.base import CacheMetadataPolicy
+from fnllm.utils.batch import Batcher, BatchResponseInvalidError, CallBatch
 
 if TYPE_CHECKING:
+    from fnllm.caching.base import Cache
     from fnllm.openai.services.openai_text_service import OpenAITextService
     from fnllm.openai.types import OpenAIEmbeddingsLLM
+    from fnllm.openai.types.aliases import OpenAIEmbeddingModelName
+    from fnllm.openai.types.embeddings.parameters import OpenAIEmbeddingsParameters
 
 EmbeddingInput: TypeAlias = str
 EmbeddingOutput: TypeAlias = list[float]
@@ -24,7 +28,13 @@ class CannotSplitBatchError(ValueError):
 
 
 class OpenAIEmbeddingBatcher(Batcher[EmbeddingInput, EmbeddingOutput]):
-    """A utility class to batch embeddings."""
+    """
+    A utility class to batch embeddings.
+
+    When a `cache` is provided, embeddings are cached per text (keyed on the model, the embeddings parameters and the
+    text), so only the texts of a batch that have not been embedded before are sent to the LLM. Caching requires the
+    `model`. The `metadata_policy` controls how much metadata is written along with the cached embeddings.
+    """
 
     def __init__(
         self,
@@ -33,13 +43,26 @@ class OpenAIEmbeddingBatcher(Batcher[EmbeddingInput, EmbeddingOutput]):
         text_service: OpenAITextService,
         max_batch_size: int,
         max_batch_tokens: int,
+        cache: Cache | None = None,
+        model: str | OpenAIEmbeddingModelName | None = None,
+        model_parameters: OpenAIEmbeddingsParameters | None = None,
+        metadata_policy: CacheMetadataPolicy = CacheMetadataPolicy.FULL,
     ) -> None:
+        if cache is not None and model is None:
+            # the cache keys must identify the model, or embeddings of different models would collide
+            msg = "A model is required to cache embeddings."
+            raise ValueError(msg)
+
         super().__init__(
             max_batch_size=max_batch_size,
             max_batch_cost=max_batch_tokens,
         )
         self._llm = llm
         self._text_service = text_service
+        self._cache = cache
+        self._model = model
+        self._model_parameters = model_parameters or {}
+        self._metadata_policy = metadata_policy
 
     def child(self, name: str) -> OpenAIEmbeddingBatcher:
         """Create a child batcher."""
@@ -48,6 +71,10 @@ class OpenAIEmbeddingBatcher(Batcher[EmbeddingInput, EmbeddingOutput]):
             text_service=self._text_service,
             max_batch_size=self.max_batch_size,
             max_batch_tokens=self.max_batch_cost,
+            cache=self._cache.child(name) if self._cache else None,
+            model=self._model,
+            model_parameters=self._model_parameters,
+            metadata_policy=self._metadata_policy,
         )
 
     def is_reasoning_model(self) -> bool:
@@ -56,6 +83,49 @@ class OpenAIEmbeddingBatcher(Batcher[EmbeddingInput, EmbeddingOutput]):
 
     async def _invoke(
         self, batch: CallBatch[EmbeddingInput, EmbeddingOutput]
+    ) -> list[EmbeddingOutput]:
+        if self._cache is None:
+            return await self._embed(batch)
+
+        # Look up every text of the batch, and only embed the texts that are not cached
+        cache_data = [self._get_cache_input_data(c.input) for c in batch.calls]
+        keys = [self._cache.create_key(d, prefix="embedding") for d in cache_data]
+        results: list[EmbeddingOutput | None] = await self._cache.get_many(keys)
+        missing = [i for i, r in enumerate(results) if r is None]
+        if not missing:
+            return cast(list[EmbeddingOutput], results)
+
+        embeddings = await self._embed(
+            CallBatch(calls=[batch.calls[i] for i in missing])
+        )
+        if len(embeddings) != len(missing):
+            raise BatchResponseInvalidError(len(missing), len(embeddings))
+        for i, embedding in zip(missing, embeddings, strict=True):
+            results[i] = embedding
+
+        await self._cache.set_many(
+            {
+                keys[i]: embedding
+                for i, embedding in zip(missing, embeddings, strict=True)
+            },
+            {keys[i]: self._get_metadata(keys[i], cache_data[i]) for i in missing},
+        )
+        return cast(list[EmbeddingOutput], results)
+
+    def _get_metadata(self, key: str, data: dict[str, Any]) -> dict[str, Any] | None:
+        """Get the metadata of a cached embedding, according to the metadata policy."""
+        if self._metadata_policy == CacheMetadataPolicy.NONE:
+            return None
+        if self._metadata_policy == CacheMetadataPolicy.HASHED:
+            return {"key": key}
+        return {"input": data, "key": key}
+
+    def _get_cache_input_data(self, text: EmbeddingInput) -> dict[str, Any]:
+        parameters = {"model": self._model, **self._model_parameters}
+        return {"input": text, "parameters": parameters}
+
+    async def _embed(
+        self, batch: CallBatch[EmbeddingInput, EmbeddingOutput]
     ) -> list[EmbeddingOutput]:
         # Submit the batch
         if batch.cost <= self.max_batch_cost:
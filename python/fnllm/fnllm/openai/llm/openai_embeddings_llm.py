@@ -84,17 +84,17 @@ class OpenAIEmbeddingsLLMImpl(
 
     def child(self, name: str) -> OpenAIEmbeddingsLLMImpl:
         """Create a child LLM."""
-        if not self._cached:
+        if not self._cached and not self._rate_limiter:
             return self
         return OpenAIEmbeddingsLLMImpl(
             self._client,
             self._model,
-            cached=self._cached.child(name),
+            cached=self._cached.child(name) if self._cached else None,
             usage_extractor=cast(
                 OpenAIUsageExtractor[OpenAIEmbeddingsOutput], self._usage_extractor
             ),
             variable_injector=self._variable_injector,
-            rate_limiter=self._rate_limiter,
+            rate_limiter=self._rate_limiter.child(name) if self._rate_limiter else None,
             retryer=self._retryer,
             model_parameters=self._global_model_parameters,
             events=self._events,
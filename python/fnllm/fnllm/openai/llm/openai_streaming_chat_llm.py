@@ -26,6 +26,7 @@ from fnllm.types import LLMMetrics, LLMUsageMetrics
 if TYPE_CHECKING:
     from fnllm.base.services.rate_limiter import RateLimiter
     from fnllm.base.services.retryer import Retryer
+    from fnllm.base.services.streaming_cached import StreamingCached
     from fnllm.base.services.variable_injector import VariableInjector
     from fnllm.events.base import LLMEvents
     from fnllm.openai.types.aliases import OpenAIChatModelName
@@ -66,6 +67,13 @@ class OpenAIStreamingChatLLMImpl(
             OpenAIChatParameters,
         ]
         | None = None,
+        cached: StreamingCached[
+            OpenAIChatCompletionInput,
+            OpenAIStreamingChatOutput,
+            OpenAIChatHistoryEntry,
+            OpenAIChatParameters,
+        ]
+        | None = None,
         emit_usage: bool = False,
         model_parameters: OpenAIChatParameters | None = None,
         events: LLMEvents | None = None,
@@ -77,10 +85,12 @@ class OpenAIStreamingChatLLMImpl(
             variable_injector=variable_injector,
             rate_limiter=rate_limiter,
             retryer=retryer,
+            cached=cached,
         )
 
         self._client = client
         self._model = model
+        self._cached = cached
         self._emit_usage = emit_usage
         self._global_model_parameters = model_parameters or {}
         self._special_token_behavior = (
@@ -89,7 +99,20 @@ class OpenAIStreamingChatLLMImpl(
 
     def child(self, name: str) -> OpenAIStreamingChatLLMImpl:
         """Create a child LLM."""
-        return self
+        if self._cached is None and self._rate_limiter is None:
+            return self
+        return OpenAIStreamingChatLLMImpl(
+            self._client,
+            self._model,
+            variable_injector=self._variable_injector,
+            rate_limiter=self._rate_limiter.child(name) if self._rate_limiter else None,
+            retryer=self._retryer,
+            cached=self._cached.child(name) if self._cached else None,
+            emit_usage=self._emit_usage,
+            model_parameters=self._global_model_parameters,
+            events=self._events,
+            special_token_behavior=self._special_token_behavior,
+        )
 
     def is_reasoning_model(self) -> bool:
         """Return whether the LLM uses a reasoning model."""
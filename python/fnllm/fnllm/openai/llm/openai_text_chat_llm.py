@@ -124,12 +124,12 @@ class OpenAITextChatLLMImpl(
 
     def child(self, name: str) -> Any:
         """Create a child LLM."""
-        if self._cached is None:
+        if self._cached is None and self._rate_limiter is None:
             return self
         return OpenAITextChatLLMImpl(
             self._client,
             self._model,
-            cached=self._cached.child(name),
+            cached=self._cached.child(name) if self._cached else None,
             json_receiver=self._json_receiver,
             events=self.events,
             usage_extractor=cast(
@@ -137,7 +137,7 @@ class OpenAITextChatLLMImpl(
             ),
             history_extractor=cast(OpenAIHistoryExtractor, self._history_extractor),
             variable_injector=self._variable_injector,
-            rate_limiter=self._rate_limiter,
+            rate_limiter=self._rate_limiter.child(name) if self._rate_limiter else None,
             retryer=self._retryer,
             model_parameters=self._global_model_parameters,
             json_strategy=self._json_strategy,
@@ -42,10 +42,20 @@ class OpenAIEmbeddingsCacheAdapter(
         self, prompt: OpenAIEmbeddingsInput, kwargs: LLMInput[Any, Any, Any]
     ) -> str:
         """Build a cache key from the prompt and kwargs."""
+        return self.build_cache_key_from_data(
+            prompt, kwargs, self.get_cache_input_data(prompt, kwargs)
+        )
+
+    def build_cache_key_from_data(
+        self,
+        prompt: OpenAIEmbeddingsInput,
+        kwargs: LLMInput[Any, Any, Any],
+        data: dict[str, Any],
+    ) -> str:
+        """Build a cache key from the cache input data."""
         name = kwargs.get("name")
         return self._cache.create_key(
-            self.get_cache_input_data(prompt, kwargs),
-            prefix=f"embeddings_{name}" if name else "embeddings",
+            data, prefix=f"embeddings_{name}" if name else "embeddings"
         )
 
     def get_cache_input_data(
@@ -21,6 +21,7 @@ from fnllm.openai.config import OpenAIRateLimitBehavior
 from fnllm.openai.errors import OpenAINoChoicesAvailableError
 
 if TYPE_CHECKING:
+    from fnllm.limiting.adaptive_concurrency import AdaptiveConcurrencyLimiter
     from fnllm.limiting.types import Manifest
 
 OPENAI_RETRYABLE_ERRORS: Final[list[type[Exception]]] = [
@@ -68,20 +69,34 @@ class OpenAIBackoffLimiter(Limiter):
 
 
 class OpenAIRetryableErrorHandler:
-    """A base class to rate limit the LLM."""
+    """
+    A base class to rate limit the LLM.
+
+    When a `concurrency_limiter` is provided, its window is cut on rate-limit errors (and retry-after responses).
+    """
 
     def __init__(
-        self, limiter: OpenAIBackoffLimiter, strategy: OpenAIRateLimitBehavior
+        self,
+        limiter: OpenAIBackoffLimiter,
+        strategy: OpenAIRateLimitBehavior,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
     ) -> None:
         """Create a new OpenAIRetryableErrorHandler."""
         self._limiter = limiter
         self._strategy = strategy
+        self._concurrency_limiter = concurrency_limiter
 
     async def __call__(self, error: BaseException) -> None:
         """Handle the rate limit error."""
         match error:
             case APIStatusError():
                 retry_after = error.response.headers.get("retry-after", None)
+                if self._concurrency_limiter is not None and (
+                    isinstance(error, RateLimitError) or retry_after is not None
+                ):
+                    self._concurrency_limiter.decrease(
+                        float(retry_after) if retry_after is not None else None
+                    )
                 if retry_after is not None:
                     await self._handle_retry_after(float(retry_after))
             case _:
@@ -0,0 +1,122 @@
+# Copyright (c) 2025 Microsoft Corporation.
+"""OpenAI streaming chat cache adapter."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from fnllm.base.services.streaming_cached import StreamingCacheAdapter
+from fnllm.openai.config import OpenAISpecialTokenBehavior
+from fnllm.openai.types.chat.io import (
+    OpenAIChatCompletionInput,
+    OpenAIStreamingChatOutput,
+)
+from fnllm.openai.utils import build_chat_messages
+from fnllm.types.metrics import LLMUsageMetrics
+
+from .openai_text_chat_cache_adapter import OpenAITextChatCacheAdapter
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from fnllm.caching import Cache
+    from fnllm.openai.types.aliases import OpenAIChatModelName
+    from fnllm.openai.types.chat.parameters import OpenAIChatParameters
+    from fnllm.types.io import LLMInput
+
+
+class OpenAIStreamingChatCacheAdapter(
+    StreamingCacheAdapter[OpenAIChatCompletionInput, OpenAIStreamingChatOutput]
+):
+    """Cache adapter for OpenAI streaming chat LLM. Streams are cached as their sequence of chunks and usage."""
+
+    def __init__(
+        self,
+        cache: Cache,
+        model: str | OpenAIChatModelName,
+        global_parameters: OpenAIChatParameters | None = None,
+        special_token_behavior: OpenAISpecialTokenBehavior | None = None,
+    ) -> None:
+        """Create a new OpenAIStreamingChatCacheAdapter."""
+        self._cache = cache
+        self._special_token_behavior = (
+            special_token_behavior or OpenAISpecialTokenBehavior.KEEP
+        )
+        self._text_chat_adapter = OpenAITextChatCacheAdapter(
+            cache, model, global_parameters, special_token_behavior
+        )
+
+    def build_cache_key(
+        self, prompt: OpenAIChatCompletionInput, kwargs: LLMInput[Any, Any, Any]
+    ) -> str:
+        """Build a cache key from the prompt and kwargs."""
+        return self.build_cache_key_from_data(
+            prompt, kwargs, self.get_cache_input_data(prompt, kwargs)
+        )
+
+    def build_cache_key_from_data(
+        self,
+        prompt: OpenAIChatCompletionInput,
+        kwargs: LLMInput[Any, Any, Any],
+        data: dict[str, Any],
+    ) -> str:
+        """Build a cache key from the cache input data."""
+        name = kwargs.get("name")
+        return self._cache.create_key(
+            data, prefix=f"chat_stream_{name}" if name else "chat_stream"
+        )
+
+    def get_cache_input_data(
+        self, prompt: OpenAIChatCompletionInput, kwargs: LLMInput[Any, Any, Any]
+    ) -> dict[str, Any]:
+        """Get the cache metadata from the prompt and kwargs."""
+        return self._text_chat_adapter.get_cache_input_data(prompt, kwargs)
+
+    def wrap_output(
+        self,
+        prompt: OpenAIChatCompletionInput,
+        kwargs: LLMInput[Any, Any, Any],
+        cached_result: dict[str, Any],
+    ) -> OpenAIStreamingChatOutput:
+        """Replay a cached stream."""
+        history = kwargs.get("history", [])
+        _, prompt_message = build_chat_messages(
+            prompt, history, self._special_token_behavior
+        )
+        usage = cached_result.get("usage")
+        return OpenAIStreamingChatOutput(
+            raw_input=prompt_message,
+            usage=LLMUsageMetrics.model_validate(usage) if usage else None,
+            content=_replay(cached_result["chunks"]),
+            close=_noop,
+        )
+
+    def record_output(
+        self,
+        output: OpenAIStreamingChatOutput,
+        on_complete: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> OpenAIStreamingChatOutput:
+        """Record the chunks of a stream, and dump them (with the usage) once the stream completes."""
+        content = output.content
+
+        async def record() -> AsyncIterator[str | None]:
+            chunks: list[str | None] = []
+            async for chunk in content:
+                chunks.append(chunk)
+                yield chunk
+            await on_complete({
+                "chunks": chunks,
+                "usage": output.usage.model_dump() if output.usage else None,
+            })
+
+        output.content = record()
+        return output
+
+
+async def _replay(chunks: list[str | None]) -> AsyncIterator[str | None]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _noop() -> None:
+    pass
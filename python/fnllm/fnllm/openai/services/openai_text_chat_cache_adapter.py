@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING, Any
 
 from fnllm.base.services.cached import CacheAdapter
@@ -43,12 +44,20 @@ class OpenAITextChatCacheAdapter(
         self, prompt: OpenAIChatCompletionInput, kwargs: LLMInput[Any, Any, Any]
     ) -> str:
         """Build a cache key from the prompt and kwargs."""
-        name = kwargs.get("name")
-        return self._cache.create_key(
-            self.get_cache_input_data(prompt, kwargs),
-            prefix=f"chat_{name}" if name else "chat",
+        return self.build_cache_key_from_data(
+            prompt, kwargs, self.get_cache_input_data(prompt, kwargs)
         )
 
+    def build_cache_key_from_data(
+        self,
+        prompt: OpenAIChatCompletionInput,
+        kwargs: LLMInput[Any, Any, Any],
+        data: dict[str, Any],
+    ) -> str:
+        """Build a cache key from the cache input data."""
+        name = kwargs.get("name")
+        return self._cache.create_key(data, prefix=f"chat_{name}" if name else "chat")
+
     def get_cache_input_data(
         self, prompt: OpenAIChatCompletionInput, kwargs: LLMInput[Any, Any, Any]
     ) -> dict[str, Any]:
@@ -59,6 +68,32 @@ class OpenAITextChatCacheAdapter(
         parameters = self._build_completion_parameters(local_model_parameters)
         return {"messages": messages, "parameters": parameters}
 
+    def get_semantic_cache_input(
+        self,
+        prompt: OpenAIChatCompletionInput,
+        kwargs: LLMInput[Any, Any, Any],
+        data: dict[str, Any],
+    ) -> tuple[str, str] | None:
+        """Get the normalized message contents, scoped to the parameters and to the rest of the messages."""
+        lines = []
+        structure = []
+        for message in data["messages"]:
+            content = message.get("content")
+            if not isinstance(content, str):
+                content = json.dumps(content, sort_keys=True)
+            lines.append(f"{message.get('role')}: {_normalize_text(content)}")
+            structure.append({k: v for k, v in message.items() if k != "content"})
+
+        scope = self._cache.create_key(
+            {
+                "name": kwargs.get("name"),
+                "parameters": data["parameters"],
+                "messages": structure,
+            },
+            prefix="semantic",
+        )
+        return scope, "\n".join(lines)
+
     def _build_completion_parameters(
         self, local_parameters: OpenAIChatParameters | None
     ) -> OpenAIChatParameters:
@@ -93,3 +128,8 @@ class OpenAITextChatCacheAdapter(
     def dump_raw_model(self, output: OpenAIChatOutput) -> dict[str, Any]:
         """Get the model to validate the cached result."""
         return OpenAIChatCompletionModel.model_dump(output.raw_model)
+
+
+def _normalize_text(text: str) -> str:
+    """Normalize whitespace and case, so trivially different prompts embed identically."""
+    return " ".join(text.split()).casefold()
@@ -51,9 +51,18 @@ class LLMInput(TypedDict, Generic[TJsonModel, THistoryEntry, TModelParameters]):
     bust_cache: NotRequired[bool]
     """Bust the cache (if any) for this LLM invocation. (e.g. ignore existing cache entries during read, but write cache results)"""
 
+    semantic_cache: NotRequired[bool]
+    """Whether to serve near-duplicate requests from the semantic cache (if any) for this LLM invocation. Defaults to True."""
+
     cache_metadata: NotRequired[dict[str, Any]]
     """Metadata to use when writing to the cache. This is for diagnostic/debugging purposes."""
 
+    priority: NotRequired[int]
+    """The scheduling priority of the LLM invocation, when priority scheduling is enabled (higher goes first). Defaults to 0."""
+
+    deadline: NotRequired[float]
+    """The time (as a `time.time()` timestamp) by which the LLM invocation must be admitted by the priority scheduler, if enabled."""
+
 
 class LLMOutput(BaseModel, Generic[TOutput, TJsonModel, THistoryEntry]):
     """The output of an LLM invocation."""
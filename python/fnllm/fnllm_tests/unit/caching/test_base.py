@@ -49,3 +49,14 @@ def test_create_key_with_prefix(cache: Cache, data: str, prefix: str):
     data_hash = _hash(json.dumps(data, sort_keys=True))
 
     assert key == f"{prefix}_{data_hash}_v{cache.__cache_strategy_version__}"
+
+
+def test_create_key_is_stable_for_nested_data(cache: Cache):
+    data = {
+        "messages": [{"role": "user", "content": "héllo"}, {"content": "b", "n": 1.5}],
+        "parameters": {"model": "gpt-4o", "temperature": 0},
+    }
+    key = cache.create_key(data, prefix="chat")
+    data_hash = _hash(json.dumps(data, sort_keys=True))
+
+    assert key == f"chat_{data_hash}_v{cache.__cache_strategy_version__}"
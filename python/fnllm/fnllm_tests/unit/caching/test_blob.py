@@ -2,11 +2,13 @@
 
 """Tests for the caching.blob."""
 
+import asyncio
 import logging
 from typing import Any
 from unittest.mock import patch
 
 import pytest
+from fnllm.caching.base import EvictionPolicy
 from fnllm.caching.blob import (
     BlobCache,
     InvalidBlobCacheArgumentsError,
@@ -14,6 +16,8 @@ from fnllm.caching.blob import (
     validate_blob_container_name,
 )
 
+from fnllm_tests.unit.conftest import WELL_KNOWN_AZURITE_CONNECTION_STRING
+
 logging.getLogger("azure.core.pipeline.policies.http_logging_policy").setLevel("ERROR")
 
 
@@ -131,6 +135,76 @@ async def test_children(blob_cache: BlobCache):
     assert await blob_cache.get("child/test") == "child_value"
 
 
+def test_raises_on_unsupported_eviction_policy():
+    with pytest.raises(InvalidBlobCacheArgumentsError):
+        BlobCache(
+            connection_string=WELL_KNOWN_AZURITE_CONNECTION_STRING,
+            container_name="container",
+            eviction_policy=EvictionPolicy.LFU,
+        )
+
+
+async def test_stats(blob_cache: BlobCache):
+    await blob_cache.set("key", "value")
+    await blob_cache.child("child").set("key", "value")
+    await blob_cache.get("key")
+    await blob_cache.get("missing")
+
+    stats = await blob_cache.stats()
+    assert stats.entries == 2
+    assert stats.hit_ratio == pytest.approx(0.5)
+    assert (await blob_cache.child("child").stats()).entries == 1
+
+
+async def test_quota(blob_cache: BlobCache):
+    cache = BlobCache(
+        connection_string=WELL_KNOWN_AZURITE_CONNECTION_STRING,
+        container_name=blob_cache.container_name,
+        max_bytes=1000,
+    )
+    for i in range(5):
+        await cache.set(f"key{i}", "x" * 200)
+
+    stats = await cache.stats()
+    assert stats.size <= 1000
+    assert stats.evictions > 0
+    assert await cache.has("key0") is False
+    assert await cache.has("key4") is True
+
+
+async def test_clear_is_scoped_to_prefix(blob_cache: BlobCache):
+    child = blob_cache.child("child")
+    await blob_cache.set("key", "value")
+    await child.set("key", "value")
+    await child.child("grandchild").set("key", "value")
+
+    await child.clear()
+    assert await child.has("key") is False
+    assert await child.child("grandchild").has("key") is False
+    assert await blob_cache.has("key") is True
+
+
+async def test_sweep(blob_cache: BlobCache):
+    await blob_cache.set("key", "value")
+    await blob_cache.child("child").set("key", "value")
+
+    await blob_cache.sweep(60)
+    assert await blob_cache.has("key") is True
+
+    await asyncio.sleep(1.1)
+    await blob_cache.sweep(1)
+    assert _is_container_empty(blob_cache) is True
+
+
+async def test_sweep_remove_unreadable(blob_cache: BlobCache):
+    await blob_cache.set("key", "value")
+    blob_cache.blob_client("bad").upload_blob(b"not json")
+
+    await blob_cache.sweep(60, remove_unreadable=True)
+    assert await blob_cache.has("bad") is False
+    assert await blob_cache.has("key") is True
+
+
 def _is_container_empty(cache: BlobCache) -> bool:
     blobs = list(cache.container_client.list_blobs())
     return len(blobs) == 0
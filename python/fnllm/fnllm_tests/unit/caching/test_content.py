@@ -0,0 +1,59 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tests for the caching.content."""
+
+from fnllm.caching.content import CONTENT_REF, ContentStore
+from fnllm.caching.memory import MemoryCache
+
+
+async def test_compact_and_expand():
+    cache = MemoryCache()
+    store = ContentStore(cache, min_size=10)
+    prompt = "You are a helpful assistant."
+    value = {
+        "messages": [
+            {"role": "system", "content": prompt},
+            {"role": "user", "content": "Hi"},
+        ],
+        "parameters": {"model": "model", "n": 1},
+    }
+
+    compacted = await store.compact(value)
+    assert compacted["messages"][0]["content"] == {
+        CONTENT_REF: cache.create_key(prompt, prefix="content")
+    }
+    assert compacted["messages"][1] == {"role": "user", "content": "Hi"}
+    assert compacted["parameters"] == value["parameters"]
+    assert len(cache) == 1
+
+    assert await store.expand(compacted) == value
+
+
+async def test_compact_stores_contents_once():
+    cache = MemoryCache()
+    store = ContentStore(cache, min_size=10)
+    prompt = "You are a helpful assistant."
+
+    first = await store.compact([prompt, prompt])
+    second = await ContentStore(cache, min_size=10).compact({"content": prompt})
+    assert first == [second["content"], second["content"]]
+    assert len(cache) == 1
+
+
+async def test_compact_restores_removed_contents():
+    cache = MemoryCache()
+    store = ContentStore(cache, min_size=10)
+    prompt = "You are a helpful assistant."
+
+    compacted = await store.compact({"content": prompt})
+    await cache.clear()
+
+    # the content is written again for the new referrer
+    assert await store.compact({"content": prompt}) == compacted
+    assert await store.expand(compacted) == {"content": prompt}
+
+
+async def test_expand_missing_content():
+    store = ContentStore(MemoryCache())
+    ref = {CONTENT_REF: "missing"}
+    assert await store.expand({"content": ref}) == {"content": ref}
@@ -6,10 +6,13 @@ import asyncio
 import json
 import os
 import pathlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
-from fnllm.caching.file import FileCache
+from fnllm.caching.base import EVICTION_TARGET_RATIO, EvictionPolicy
+from fnllm.caching.file import LAYOUT_FILE_NAME, FileCache
 
 
 @pytest.fixture
@@ -143,5 +146,219 @@ async def test_sweep(file_cache: FileCache):
     assert await file_cache.has("key") is False
 
 
+async def test_get_does_not_rewrite_entry(file_cache: FileCache):
+    await file_cache.set("key", {"a": 1})
+    path = file_cache.root_path / "key"
+    content = path.read_bytes()
+
+    # age the entry, reading it should bump its modification time
+    os.utime(path, (0, 0))
+    assert await file_cache.get("key") == {"a": 1}
+    assert path.read_bytes() == content
+    assert path.stat().st_mtime > 0
+
+    # recently accessed entries survive a sweep
+    await file_cache.sweep(60)
+    assert await file_cache.has("key") is True
+
+
+async def test_sweep_remove_unreadable(file_cache: FileCache):
+    (file_cache.root_path / "json_error").write_text("not json")
+    await file_cache.set("key", "value")
+
+    await file_cache.sweep(60, remove_unreadable=True)
+    assert await file_cache.has("json_error") is False
+    assert await file_cache.has("key") is True
+
+
+async def test_runs_io_in_executor(tmp_path: pathlib.Path):
+    thread_names: set[str] = set()
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            def record():
+                thread_names.add(threading.current_thread().name)
+                return fn(*args, **kwargs)
+
+            return super().submit(record)
+
+    with RecordingExecutor(max_workers=2, thread_name_prefix="test-io") as executor:
+        cache = FileCache(tmp_path, executor=executor)
+        await cache.set("key", "value")
+        assert await cache.child("child").get("key") is None
+        assert await cache.get("key") == "value"
+
+    assert thread_names
+    assert all(name.startswith("test-io") for name in thread_names)
+
+
+async def test_sharded_layout(tmp_path: pathlib.Path):
+    cache = FileCache(tmp_path, shard_depth=2)
+    await cache.set("key", "value")
+
+    path = cache.entry_path("key")
+    assert path.exists()
+    assert path.relative_to(tmp_path).parts[2] == "key"
+    assert await cache.has("key") is True
+    assert await cache.get("key") == "value"
+
+    child = cache.child("child")
+    await child.set("test", "child_value")
+    assert await cache.get("child/test") == "child_value"
+
+    await cache.remove("key")
+    assert await cache.has("key") is False
+
+    await cache.clear()
+    assert [p.name for p in tmp_path.iterdir()] == [LAYOUT_FILE_NAME]
+
+
+async def test_sharded_layout_keeps_hex_named_children(tmp_path: pathlib.Path):
+    cache = FileCache(tmp_path, shard_depth=1)
+    await cache.set("key", "value")
+    await cache.child("ab").set("key", "child_value")
+
+    entries = {key: entry["result"] async for key, entry in cache.iter_entries()}
+    assert entries == {"key": "value", "ab/key": "child_value"}
+    assert (await cache.child("ab").stats()).entries == 1
+
+
+async def test_shard_depth_change_migrates_entries(tmp_path: pathlib.Path):
+    flat = FileCache(tmp_path)
+    await flat.set("key1", "value1")
+    await flat.set("key2", "value2")
+    await flat.child("child").set("key3", "value3")
+
+    sharded = FileCache(tmp_path, shard_depth=2)
+    assert await sharded.get_many(["key1", "key2"]) == ["value1", "value2"]
+    assert sharded.entry_path("key1").exists()
+    assert not (tmp_path / "key1").exists()
+    assert await sharded.get("child/key3") == "value3"
+
+    # and back to the flat layout, without leaving empty shard directories
+    flat = FileCache(tmp_path)
+    assert await flat.get_many(["key1", "key2"]) == ["value1", "value2"]
+    assert sorted(p.name for p in tmp_path.iterdir() if p.is_dir()) == ["child"]
+    assert not (tmp_path / LAYOUT_FILE_NAME).exists()
+
+
+async def test_index(file_cache: FileCache):
+    await file_cache.set("key1", "value1")
+    await file_cache.set("key2", {"a": "b" * 100})
+    await file_cache.child("child").set("key3", "value3")
+
+    index = await file_cache.index()
+    assert set(index) == {"key1", "key2"}
+    assert index["key2"].size == (file_cache.root_path / "key2").stat().st_size
+    assert await file_cache.disk_usage() == sum(e.size for e in index.values())
+
+    await file_cache.remove("key1")
+    assert set(await file_cache.index()) == {"key2"}
+
+
+async def test_index_rebuilt_for_legacy_entries(file_cache: FileCache):
+    (file_cache.root_path / "legacy").write_text(json.dumps({"result": "value"}))
+    os.utime(file_cache.root_path / "legacy", (0, 0))
+    assert set(await file_cache.index()) == {"legacy"}
+
+    await file_cache.sweep(60)
+    assert await file_cache.has("legacy") is False
+
+
+async def test_index_seeded_on_upgrade(file_cache: FileCache):
+    for i in range(3):
+        path = file_cache.root_path / f"old{i}"
+        path.write_text(json.dumps({"result": i}))
+        os.utime(path, (0, 0))
+
+    # the first write creates the journal, which must include the legacy entries
+    await file_cache.set("new", "value")
+    assert (await file_cache.stats()).entries == 4
+
+    await file_cache.sweep(60)
+    assert set(await file_cache.index()) == {"new"}
+    assert not any((file_cache.root_path / f"old{i}").exists() for i in range(3))
+
+
+async def test_sweep_does_not_open_entries(file_cache: FileCache):
+    await file_cache.set("key", "value")
+    await file_cache.set("stale", "value")
+    os.utime(file_cache.root_path / "stale", (0, 0))
+
+    def fail(*args, **kwargs):
+        raise AssertionError
+
+    file_cache._serializer.loads = fail  # type: ignore
+    await file_cache.sweep(60)
+    assert await file_cache.has("key") is True
+    assert await file_cache.has("stale") is True  # indexed access time is recent
+
+    index = await file_cache.index()
+    index_entry = index["stale"]
+    assert index_entry.accessed >= index_entry.created
+
+
+async def test_batch_operations(file_cache: FileCache):
+    await file_cache.set_many(
+        {"key1": "value1", "key2": {"a": 1}}, {"key1": {"meta": True}}
+    )
+    assert set(await file_cache.index()) == {"key1", "key2"}
+    assert await file_cache.get_many(["key2", "missing", "key1"]) == [
+        {"a": 1},
+        None,
+        "value1",
+    ]
+    assert await file_cache.has_many(["key1", "missing"]) == [True, False]
+
+    # namespaced keys fall back to the per-key implementation
+    await file_cache.child("child").set("key3", "value3")
+    assert await file_cache.get_many(["key1", "child/key3"]) == ["value1", "value3"]
+
+
+async def test_quota_evicts_least_recently_used(tmp_path: pathlib.Path):
+    cache = FileCache(tmp_path, max_bytes=1300)
+    value = "x" * 200
+    for i in range(4):
+        await cache.set(f"key{i}", value)
+        os.utime(cache.entry_path(f"key{i}"), (i, i))
+    await cache.get("key0")
+
+    await cache.set("key4", value)
+    usage = await cache.disk_usage()
+    assert usage <= 1300 * EVICTION_TARGET_RATIO
+    assert await cache.has("key0") is True
+    assert await cache.has("key4") is True
+    assert await cache.has("key1") is False
+    assert (await cache.stats()).evictions > 0
+
+
+async def test_quota_evicts_least_frequently_used(tmp_path: pathlib.Path):
+    cache = FileCache(tmp_path, max_bytes=1300, eviction_policy=EvictionPolicy.LFU)
+    value = "x" * 200
+    for i in range(4):
+        await cache.set(f"key{i}", value)
+    for _ in range(3):
+        await cache.get("key0")
+    await cache.get("key3")
+
+    await cache.set("key4", value)
+    assert await cache.has("key0") is True
+    assert await cache.has("key1") is False
+    assert await cache.has("key4") is True
+
+
+async def test_stats(file_cache: FileCache):
+    await file_cache.set("key", "value")
+    await file_cache.child("child").set("key", "value")
+    await file_cache.get("key")
+    await file_cache.get("missing")
+
+    stats = await file_cache.stats()
+    assert stats.entries == 1
+    assert stats.size == await file_cache.disk_usage()
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert stats.hit_ratio == pytest.approx(0.5)
+
+
 def _is_dir_empty(path: pathlib.Path) -> bool:
     return not any(os.scandir(path))
@@ -0,0 +1,175 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tests for the caching.memory."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from fnllm.caching.base import EvictionPolicy
+from fnllm.caching.memory import MemoryCache
+
+
+@pytest.mark.parametrize(
+    argnames=("key_value"),
+    argvalues=[
+        (("str key", "str value")),
+        (("int key", 10)),
+        (("float key", 10.5)),
+        (("object key", {"a": 1, "b": 2})),
+    ],
+)
+async def test_default_operations(
+    memory_cache: MemoryCache, key_value: tuple[str, Any]
+):
+    key, value = key_value
+
+    # key, value is not there
+    assert await memory_cache.has(key) is False
+    assert await memory_cache.get(key) is None
+
+    # adding key, value
+    await memory_cache.set(key, value)
+    assert await memory_cache.has(key) is True
+    assert await memory_cache.get(key) == value
+    assert type(await memory_cache.get(key)) is type(value)
+
+    # removing key, value
+    await memory_cache.remove(key)
+    assert await memory_cache.has(key) is False
+    assert await memory_cache.get(key) is None
+
+
+async def test_replace_value(memory_cache: MemoryCache):
+    await memory_cache.set("key", "value")
+    await memory_cache.set("key", "other value")
+    assert await memory_cache.get("key") == "other value"
+    assert len(memory_cache) == 1
+
+
+async def test_children(memory_cache: MemoryCache):
+    await memory_cache.set("test", "value")
+    await memory_cache.set("test2", "value2")
+
+    child = memory_cache.child("child")
+    await child.set("test", "child_value")
+
+    # previous values should still be there
+    assert await memory_cache.get("test") == "value"
+    assert await memory_cache.get("test2") == "value2"
+
+    # child values are different
+    assert await child.get("test") == "child_value"
+    assert await child.has("test2") is False
+
+    # access child value through parent
+    assert await memory_cache.get("child/test") == "child_value"
+
+
+async def test_clear(memory_cache: MemoryCache):
+    child = memory_cache.child("child")
+    await memory_cache.set("key1", "value1")
+    await child.set("key1", "value1")
+
+    # clearing the child only clears its namespace
+    await child.clear()
+    assert await child.has("key1") is False
+    assert await memory_cache.has("key1") is True
+
+    await child.set("key1", "value1")
+    await memory_cache.clear()
+    assert len(memory_cache) == 0
+    assert memory_cache.size == 0
+
+
+async def test_evicts_by_entry_count():
+    cache = MemoryCache(max_entries=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+
+    # touching "a" makes "b" the least-recently-used entry
+    assert await cache.get("a") == 1
+    await cache.set("c", 3)
+
+    assert await cache.has("a") is True
+    assert await cache.has("b") is False
+    assert await cache.has("c") is True
+    assert cache.evictions == 1
+
+
+async def test_evicts_by_byte_size():
+    cache = MemoryCache(max_bytes=100)
+    await cache.set("a", "x" * 30)
+    await cache.set("b", "x" * 30)
+    await cache.set("c", "x" * 30)
+
+    assert cache.size <= 100
+    assert await cache.has("a") is False
+    assert await cache.has("c") is True
+
+    # entries larger than the whole cache are not retained
+    await cache.set("d", "x" * 200)
+    assert await cache.has("d") is False
+    assert cache.size <= 100
+
+
+async def test_counters(memory_cache: MemoryCache):
+    await memory_cache.set("key", "value")
+    await memory_cache.get("key")
+    await memory_cache.get("key")
+    await memory_cache.get("missing")
+
+    assert memory_cache.hits == 2
+    assert memory_cache.misses == 1
+    assert memory_cache.evictions == 0
+
+
+async def test_batch_operations(memory_cache: MemoryCache):
+    await memory_cache.set_many({"key1": "value1", "key2": "value2"})
+    assert await memory_cache.get_many(["key2", "missing", "key1"]) == [
+        "value2",
+        None,
+        "value1",
+    ]
+    assert await memory_cache.has_many(["key1", "missing"]) == [True, False]
+    assert memory_cache.hits == 2
+    assert memory_cache.misses == 1
+
+
+async def test_sweep(memory_cache: MemoryCache):
+    await memory_cache.set("key", "value")
+    await asyncio.sleep(1.1)
+    await memory_cache.set("fresh", "value")
+
+    await memory_cache.sweep(1)
+    assert await memory_cache.has("key") is False
+    assert await memory_cache.has("fresh") is True
+
+
+async def test_evicts_least_frequently_used():
+    cache = MemoryCache(max_entries=2, eviction_policy=EvictionPolicy.LFU)
+    await cache.set("frequent", "value")
+    await cache.set("rare", "value")
+    await cache.get("frequent")
+    await cache.get("frequent")
+    await cache.get("rare")
+
+    await cache.set("new", "value")
+    assert await cache.has("frequent") is True
+    assert await cache.has("rare") is False
+    assert await cache.has("new") is True
+
+
+async def test_stats(memory_cache: MemoryCache):
+    await memory_cache.set("key", "value")
+    await memory_cache.child("child").set("key", "value")
+    await memory_cache.get("key")
+    await memory_cache.get("missing")
+
+    stats = await memory_cache.stats()
+    assert stats.entries == 2
+    assert stats.size == memory_cache.size
+    assert stats.hit_ratio == pytest.approx(0.5)
+
+    child_stats = await memory_cache.child("child").stats()
+    assert child_stats.entries == 1
@@ -0,0 +1,85 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tests for the caching.serializers."""
+
+import json
+import random
+
+import pytest
+from fnllm.caching.file import FileCache
+from fnllm.caching.serializers import (
+    CompactCacheSerializer,
+    InvalidCacheEntryError,
+    JsonCacheSerializer,
+)
+
+
+def _embedding_entry(values: list[float]) -> dict:
+    return {
+        "result": {"data": [{"embedding": values, "index": 0}], "model": "ada"},
+        "metadata": {"key": "abc", "input": {"input": ["text"]}},
+    }
+
+
+def test_json_default_matches_historical_format():
+    entry = {"result": "value", "metadata": None}
+    data = JsonCacheSerializer().dumps(entry)
+    assert data.decode() == json.dumps(entry, indent=2, ensure_ascii=False)
+
+
+def test_json_compact():
+    entry = {"result": [1, 2, 3], "metadata": None}
+    data = JsonCacheSerializer(indent=None).dumps(entry)
+    assert b" " not in data
+    assert JsonCacheSerializer().loads(data) == entry
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_compact_roundtrip(compress: bool):
+    # single-precision values are packed losslessly as float32, others as float64
+    single = [float(i) / 4 for i in range(32)]
+    double = [random.random() for _ in range(32)]
+    entry = _embedding_entry(single)
+    entry["metadata"]["double"] = double
+    entry["metadata"]["short"] = [0.1, 0.2]
+
+    serializer = CompactCacheSerializer(compress=compress)
+    data = serializer.dumps(entry)
+    assert serializer.loads(data) == entry
+
+
+def test_compact_is_smaller_for_embeddings():
+    values = [random.random() for _ in range(1536)]
+    entry = _embedding_entry(values)
+
+    json_size = len(JsonCacheSerializer().dumps(entry))
+    compact_size = len(CompactCacheSerializer().dumps(entry))
+    assert compact_size < json_size / 2
+
+
+def test_serializers_read_each_other():
+    entry = _embedding_entry([0.5] * 16)
+    json_data = JsonCacheSerializer().dumps(entry)
+    compact_data = CompactCacheSerializer(compress=True).dumps(entry)
+
+    assert CompactCacheSerializer().loads(json_data) == entry
+    assert JsonCacheSerializer().loads(compact_data) == entry
+
+
+def test_compact_corrupted():
+    data = CompactCacheSerializer(compress=True).dumps({"result": "value"})
+    with pytest.raises(InvalidCacheEntryError):
+        CompactCacheSerializer().loads(data[:10])
+
+
+async def test_file_cache_reads_legacy_entries(tmp_path):
+    legacy = FileCache(tmp_path)
+    await legacy.set("key", {"a": 1})
+
+    compact = FileCache(tmp_path, serializer=CompactCacheSerializer(compress=True))
+    assert await compact.get("key") == {"a": 1}
+
+    await compact.set("key2", [0.25] * 64)
+    assert await compact.get("key2") == [0.25] * 64
+    assert await compact.child("child").get("key") is None
+    assert (tmp_path / "key2").read_bytes().startswith(b"FNLC")
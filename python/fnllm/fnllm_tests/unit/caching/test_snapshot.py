@@ -0,0 +1,91 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tests for the caching.snapshot."""
+
+import gzip
+import pathlib
+
+import pytest
+from fnllm.caching.base import Cache
+from fnllm.caching.file import FileCache
+from fnllm.caching.memory import MemoryCache
+from fnllm.caching.snapshot import (
+    InvalidCacheSnapshotError,
+    export_snapshot,
+    load_snapshot,
+)
+from fnllm.caching.sqlite import SqliteCache
+from fnllm.caching.tiered import TieredCache
+
+
+async def _fill(cache: Cache) -> None:
+    await cache.set("key1", "value1", {"input": "a"})
+    await cache.set("key2", {"embedding": [0.5] * 16})
+    await cache.child("child").set("key3", "value3")
+
+
+@pytest.mark.parametrize("backend", ["memory", "file", "sqlite", "tiered"])
+async def test_iter_entries(tmp_path: pathlib.Path, backend: str):
+    cache: Cache
+    if backend == "memory":
+        cache = MemoryCache()
+    elif backend == "file":
+        cache = FileCache(tmp_path, shard_depth=1)
+    elif backend == "sqlite":
+        cache = SqliteCache(tmp_path / "cache.db")
+    else:
+        cache = TieredCache([MemoryCache(), FileCache(tmp_path)])
+    await _fill(cache)
+
+    entries = {key: entry async for key, entry in cache.iter_entries()}
+    assert entries == {
+        "key1": {"result": "value1", "metadata": {"input": "a"}},
+        "key2": {"result": {"embedding": [0.5] * 16}, "metadata": None},
+        "child/key3": {"result": "value3", "metadata": None},
+    }
+
+    child_entries = [key async for key, _ in cache.child("child").iter_entries()]
+    assert child_entries == ["key3"]
+
+    if isinstance(cache, SqliteCache):
+        await cache.close()
+
+
+async def test_snapshot_roundtrip(tmp_path: pathlib.Path, sqlite_cache: SqliteCache):
+    await _fill(sqlite_cache)
+    path = tmp_path / "snapshot.jsonl.gz"
+    assert await export_snapshot(sqlite_cache, path) == 3
+
+    local = MemoryCache()
+    assert await load_snapshot(local, path, batch_size=2) == 3
+    assert await local.get("key1") == "value1"
+    assert await local.child("child").get("key3") == "value3"
+    assert {key async for key, _ in local.iter_entries()} == {
+        "key1",
+        "key2",
+        "child/key3",
+    }
+
+
+async def test_snapshot_of_child_namespace(tmp_path: pathlib.Path):
+    source = MemoryCache()
+    await _fill(source)
+    path = tmp_path / "snapshot.jsonl.gz"
+    assert await export_snapshot(source.child("child"), path) == 1
+
+    target = MemoryCache()
+    await load_snapshot(target.child("child"), path)
+    assert await target.child("child").get("key3") == "value3"
+    assert len(target) == 1
+
+
+async def test_load_invalid_snapshot(tmp_path: pathlib.Path):
+    path = tmp_path / "snapshot.jsonl.gz"
+    with gzip.open(path, "wt") as f:
+        f.write('{"format": "something-else"}\n')
+    with pytest.raises(InvalidCacheSnapshotError):
+        await load_snapshot(MemoryCache(), path)
+
+    path.write_bytes(b"not gzip")
+    with pytest.raises(InvalidCacheSnapshotError):
+        await load_snapshot(MemoryCache(), path)
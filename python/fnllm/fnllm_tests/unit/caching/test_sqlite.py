@@ -0,0 +1,253 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tests for the caching.sqlite."""
+
+import asyncio
+import pathlib
+import sqlite3
+from typing import Any
+
+import pytest
+from fnllm.caching.base import EVICTION_TARGET_RATIO, EvictionPolicy
+from fnllm.caching.sqlite import SqliteCache
+
+
+@pytest.mark.parametrize(
+    argnames=("key_value"),
+    argvalues=[
+        (("str key", "str value")),
+        (("int key", 10)),
+        (("float key", 10.5)),
+        (("object key", {"a": 1, "b": 2})),
+    ],
+)
+async def test_default_operations(
+    sqlite_cache: SqliteCache, key_value: tuple[str, Any]
+):
+    key, value = key_value
+
+    # key, value is not there
+    assert await sqlite_cache.has(key) is False
+    assert await sqlite_cache.get(key) is None
+
+    # adding key, value
+    await sqlite_cache.set(key, value)
+    assert await sqlite_cache.has(key) is True
+    assert await sqlite_cache.get(key) == value
+
+    # values are still there once committed
+    await sqlite_cache.flush()
+    assert await sqlite_cache.get(key) == value
+    assert type(await sqlite_cache.get(key)) is type(value)
+
+    # removing key, value
+    await sqlite_cache.remove(key)
+    assert await sqlite_cache.has(key) is False
+    assert await sqlite_cache.get(key) is None
+
+
+async def test_batched_writes(tmp_path: pathlib.Path):
+    cache = SqliteCache(tmp_path / "cache.db", batch_size=3, flush_interval=60)
+    assert await cache.get("missing") is None
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert _count_rows(cache) == 0
+
+    # reaching the batch size commits every pending write
+    await cache.set("c", 3)
+    assert _count_rows(cache) == 3
+    await cache.close()
+
+
+async def test_flush_interval(tmp_path: pathlib.Path):
+    cache = SqliteCache(tmp_path / "cache.db", flush_interval=0.01)
+    await cache.set("a", 1)
+    await asyncio.sleep(0.2)
+    assert _count_rows(cache) == 1
+    await cache.close()
+
+
+async def test_failed_flush_keeps_writes(tmp_path: pathlib.Path):
+    cache = SqliteCache(tmp_path / "cache.db", flush_interval=60)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+
+    run = cache._store.run
+
+    def locked(fn):
+        cache._store.run = run
+        msg = "database is locked"
+        raise sqlite3.OperationalError(msg)
+
+    cache._store.run = locked  # type: ignore
+    with pytest.raises(sqlite3.OperationalError):
+        await cache.flush()
+
+    # the failed writes are still visible, and don't overwrite newer ones
+    await cache.set("b", 3)
+    assert await cache.get("a") == 1
+
+    await cache.flush()
+    assert _count_rows(cache) == 2
+    assert await cache.get("b") == 3
+    await cache.close()
+
+
+async def test_persists_across_instances(tmp_path: pathlib.Path):
+    cache = SqliteCache(tmp_path / "cache.db")
+    await cache.set("key", "value")
+    await cache.close()
+
+    reopened = SqliteCache(tmp_path / "cache.db")
+    assert await reopened.get("key") == "value"
+    await reopened.close()
+
+
+async def test_children(sqlite_cache: SqliteCache):
+    await sqlite_cache.set("test", "value")
+    await sqlite_cache.set("test2", "value2")
+
+    child = sqlite_cache.child("child")
+    await child.set("test", "child_value")
+
+    # previous values should still be there
+    assert await sqlite_cache.get("test") == "value"
+    assert await sqlite_cache.get("test2") == "value2"
+
+    # child values are different
+    assert await child.get("test") == "child_value"
+    assert await child.has("test2") is False
+
+    # access child value through parent
+    assert await sqlite_cache.get("child/test") == "child_value"
+
+
+async def test_clear(sqlite_cache: SqliteCache):
+    child = sqlite_cache.child("child")
+    sibling = sqlite_cache.child("child0")
+    await sqlite_cache.set("key", "value")
+    await child.set("key", "value")
+    await sibling.set("key", "value")
+
+    # clearing the child only clears its namespace
+    await child.clear()
+    assert await child.has("key") is False
+    assert await sibling.has("key") is True
+    assert await sqlite_cache.has("key") is True
+
+    await sqlite_cache.clear()
+    assert _count_rows(sqlite_cache) == 0
+
+
+async def test_sweep(sqlite_cache: SqliteCache):
+    await sqlite_cache.set("old", "value")
+    await sqlite_cache.flush()
+    await asyncio.sleep(1.1)
+    await sqlite_cache.set("fresh", "value")
+
+    await sqlite_cache.sweep(1)
+    assert await sqlite_cache.has("old") is False
+    assert await sqlite_cache.has("fresh") is True
+
+
+async def test_sweep_keeps_accessed_entries(sqlite_cache: SqliteCache):
+    await sqlite_cache.set("key", "value")
+    await sqlite_cache.flush()
+    await asyncio.sleep(1.1)
+    assert await sqlite_cache.get("key") == "value"
+
+    await sqlite_cache.sweep(1)
+    assert await sqlite_cache.has("key") is True
+
+
+async def test_sweep_remove_unreadable(sqlite_cache: SqliteCache):
+    await sqlite_cache.set("key", "value")
+    await sqlite_cache.flush()
+    with sqlite3.connect(sqlite_cache.database_path) as c:
+        c.execute(
+            "INSERT INTO cache_entries (key, value, created, accessed, size) "
+            "VALUES ('bad', X'00', 0, 1e12, 1)",
+        )
+    c.close()
+
+    assert await sqlite_cache.get("bad") is None
+    await sqlite_cache.sweep(60, remove_unreadable=True)
+    assert await sqlite_cache.has("bad") is False
+    assert await sqlite_cache.has("key") is True
+
+
+async def test_batch_operations(sqlite_cache: SqliteCache):
+    await sqlite_cache.set("pending", "value0")
+    await sqlite_cache.set_many({"key1": "value1", "key2": {"a": 1}})
+    assert _count_rows(sqlite_cache) == 3
+
+    keys = ["key2", "missing", "key1", "pending"]
+    assert await sqlite_cache.get_many(keys) == [{"a": 1}, None, "value1", "value0"]
+    assert await sqlite_cache.has_many(keys) == [True, False, True, True]
+
+    child = sqlite_cache.child("child")
+    await child.set_many({"key1": "child_value"})
+    assert await child.get_many(["key1", "key2"]) == ["child_value", None]
+
+
+async def test_batch_get_many_keys(sqlite_cache: SqliteCache):
+    values = {f"key{i}": i for i in range(1200)}
+    await sqlite_cache.set_many(values)
+    assert await sqlite_cache.get_many(list(values)) == list(values.values())
+
+
+async def test_quota(tmp_path):
+    cache = SqliteCache(tmp_path / "cache.db", max_bytes=1000, batch_size=1)
+    value = "x" * 200
+    for i in range(4):
+        await cache.set(f"key{i}", value)
+    await cache.get("key0")
+    await cache.flush()
+
+    await cache.set("key4", value)
+    stats = await cache.stats()
+    assert stats.size <= 1000 * EVICTION_TARGET_RATIO
+    assert stats.evictions > 0
+    assert await cache.has("key0") is True
+    assert await cache.has("key4") is True
+    assert await cache.has("key1") is False
+    await cache.close()
+
+
+async def test_quota_lfu(tmp_path):
+    cache = SqliteCache(
+        tmp_path / "cache.db",
+        max_bytes=1000,
+        batch_size=1,
+        eviction_policy=EvictionPolicy.LFU,
+    )
+    value = "x" * 200
+    for i in range(4):
+        await cache.set(f"key{i}", value)
+    for _ in range(3):
+        await cache.get("key1")
+    await cache.flush()
+
+    await cache.set("key4", value)
+    assert await cache.has("key1") is True
+    assert await cache.has("key0") is False
+    await cache.close()
+
+
+async def test_stats(sqlite_cache: SqliteCache):
+    await sqlite_cache.set("key", "value")
+    await sqlite_cache.child("child").set("key", "value")
+    await sqlite_cache.get("key")
+    await sqlite_cache.get("missing")
+
+    stats = await sqlite_cache.stats()
+    assert stats.entries == 2
+    assert stats.hit_ratio == pytest.approx(0.5)
+    assert (await sqlite_cache.child("child").stats()).entries == 1
+
+
+def _count_rows(cache: SqliteCache) -> int:
+    with sqlite3.connect(cache.database_path) as c:
+        (count,) = c.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+    c.close()
+    return count
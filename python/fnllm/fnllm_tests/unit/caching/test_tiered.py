@@ -0,0 +1,144 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tests for the caching.tiered."""
+
+import asyncio
+
+import pytest
+from fnllm.caching.file import FileCache
+from fnllm.caching.memory import MemoryCache
+from fnllm.caching.tiered import TieredCache
+
+
+@pytest.fixture
+def memory_tier() -> MemoryCache:
+    return MemoryCache()
+
+
+@pytest.fixture
+def tiered_cache(memory_tier: MemoryCache, file_cache: FileCache) -> TieredCache:
+    return TieredCache([memory_tier, file_cache])
+
+
+def test_requires_tiers():
+    with pytest.raises(ValueError, match="at least one"):
+        TieredCache([])
+
+
+async def test_write_through(
+    tiered_cache: TieredCache, memory_tier: MemoryCache, file_cache: FileCache
+):
+    await tiered_cache.set("key", "value")
+    assert await memory_tier.get("key") == "value"
+    assert await file_cache.get("key") == "value"
+    assert await tiered_cache.has("key") is True
+
+    await tiered_cache.remove("key")
+    assert await memory_tier.has("key") is False
+    assert await file_cache.has("key") is False
+    assert await tiered_cache.get("key") is None
+
+
+async def test_promotes_hits_to_upper_tiers(
+    tiered_cache: TieredCache, memory_tier: MemoryCache, file_cache: FileCache
+):
+    await file_cache.set("key", {"a": 1})
+    assert await memory_tier.has("key") is False
+
+    assert await tiered_cache.get("key") == {"a": 1}
+    assert await memory_tier.get("key") == {"a": 1}
+
+
+async def test_remove_only_present_in_some_tiers(
+    tiered_cache: TieredCache, memory_tier: MemoryCache
+):
+    await memory_tier.set("key", "value")
+    await tiered_cache.remove("key")
+    assert await tiered_cache.has("key") is False
+
+
+async def test_write_behind(memory_tier: MemoryCache, file_cache: FileCache):
+    cache = TieredCache([memory_tier, file_cache], write_behind=True)
+    await cache.set("key", "value")
+    assert await memory_tier.get("key") == "value"
+
+    await cache.flush()
+    assert await file_cache.get("key") == "value"
+
+
+async def test_remove_waits_for_write_behind(memory_tier: MemoryCache):
+    class SlowTier(MemoryCache):
+        async def set(self, key, value, metadata=None):
+            await asyncio.sleep(0.05)
+            await super().set(key, value, metadata)
+
+    lower = SlowTier()
+    cache = TieredCache([memory_tier, lower], write_behind=True)
+    await cache.set("key", "value")
+    await cache.remove("key")
+
+    # the pending write doesn't bring the removed entry back
+    await cache.flush()
+    assert await lower.has("key") is False
+    assert await cache.has("key") is False
+
+
+async def test_children(
+    tiered_cache: TieredCache, memory_tier: MemoryCache, file_cache: FileCache
+):
+    child = tiered_cache.child("child")
+    await child.set("test", "child_value")
+
+    assert await memory_tier.child("child").get("test") == "child_value"
+    assert await file_cache.child("child").get("test") == "child_value"
+    assert await tiered_cache.get("child/test") == "child_value"
+
+    await tiered_cache.clear()
+    assert await child.has("test") is False
+
+
+async def test_sweep_skips_unsupported_tiers(memory_tier: MemoryCache):
+    class NoSweepCache(MemoryCache):
+        async def sweep(self, age: int, *, remove_unreadable: bool = False) -> None:
+            raise NotImplementedError
+
+    cache = TieredCache([memory_tier, NoSweepCache()])
+    await cache.set("key", "value")
+    await cache.sweep(0)
+
+
+async def test_batch_operations(
+    tiered_cache: TieredCache, memory_tier: MemoryCache, file_cache: FileCache
+):
+    await file_cache.set("lower", "lower_value")
+    await tiered_cache.set_many({"key1": "value1"})
+    assert await memory_tier.get("key1") == "value1"
+    assert await file_cache.get("key1") == "value1"
+
+    assert await tiered_cache.get_many(["key1", "lower", "missing"]) == [
+        "value1",
+        "lower_value",
+        None,
+    ]
+    assert await memory_tier.get("lower") == "lower_value"
+    assert await tiered_cache.has_many(["lower", "missing"]) == [True, False]
+
+
+async def test_batch_write_behind(memory_tier: MemoryCache, file_cache: FileCache):
+    cache = TieredCache([memory_tier, file_cache], write_behind=True)
+    await cache.set_many({"key1": "value1", "key2": "value2"})
+    assert await memory_tier.get("key1") == "value1"
+
+    await cache.flush()
+    assert await file_cache.get_many(["key1", "key2"]) == ["value1", "value2"]
+
+
+async def test_stats(tiered_cache: TieredCache, file_cache: FileCache):
+    await file_cache.set("lower", "value")
+    await tiered_cache.set("key", "value")
+    await tiered_cache.get("lower")
+    await tiered_cache.get_many(["key", "missing"])
+
+    stats = await tiered_cache.stats()
+    assert stats.entries == 2
+    assert (stats.hits, stats.misses) == (2, 1)
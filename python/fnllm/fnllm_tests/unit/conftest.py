@@ -9,6 +9,8 @@ from typing import Any
 import pytest
 from fnllm.caching.blob import BlobCache
 from fnllm.caching.file import FileCache
+from fnllm.caching.memory import MemoryCache
+from fnllm.caching.sqlite import SqliteCache
 
 # cspell:disable-next-line well-known-key
 WELL_KNOWN_AZURITE_CONNECTION_STRING = "DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;AccountKey=Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw==;BlobEndpoint=http://127.0.0.1:10000/devstoreaccount1"
@@ -19,6 +21,18 @@ def file_cache(tmp_path: pathlib.Path) -> FileCache:
     return FileCache(tmp_path)
 
 
+@pytest.fixture
+def memory_cache() -> MemoryCache:
+    return MemoryCache()
+
+
+@pytest.fixture
+async def sqlite_cache(tmp_path: pathlib.Path):
+    cache = SqliteCache(tmp_path / "cache.db")
+    yield cache
+    await cache.close()
+
+
 @pytest.fixture
 def blob_cache() -> Generator[BlobCache, Any, Any]:
     cache = BlobCache(
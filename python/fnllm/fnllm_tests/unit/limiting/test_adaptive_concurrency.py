@@ -0,0 +1,106 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tests for limiting.adaptive_concurrency."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from fnllm.limiting.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from fnllm.limiting.types import Manifest
+
+
+async def test_acquire_waits_for_a_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+    first, second, third = (Manifest(request_tokens=1) for _ in range(3))
+    await limiter.acquire(first)
+    await limiter.acquire(second)
+
+    waiting = asyncio.create_task(limiter.acquire(third))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+    assert limiter.in_flight == 2
+
+    await limiter.release(first)
+    await asyncio.wait_for(waiting, timeout=0.1)
+    assert limiter.in_flight == 2
+
+
+async def test_not_acquired_without_request_tokens():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    async with limiter.use(Manifest(request_tokens=0, post_request_tokens=10)):
+        assert limiter.in_flight == 0
+
+
+async def test_reconcile_increases_limit_after_a_window_of_successes():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3)
+    for _ in range(2):
+        await limiter.reconcile(Mock())
+    assert limiter.limit == 3
+
+    # bounded by max_limit
+    for _ in range(3):
+        await limiter.reconcile(Mock())
+    assert limiter.limit == 3
+
+
+async def test_reconcile_does_not_increase_limit_when_latency_degrades():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=3)
+    limiter._record_latency(1.0)
+    for _ in range(10):
+        limiter._record_latency(10.0)
+    for _ in range(3):
+        await limiter.reconcile(Mock())
+    assert limiter.limit == 1
+
+
+async def test_increase_wakes_waiters():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=2)
+    await limiter.acquire(Manifest(request_tokens=1))
+    waiting = asyncio.create_task(limiter.acquire(Manifest(request_tokens=1)))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    await limiter.reconcile(Mock())
+    await asyncio.wait_for(waiting, timeout=0.1)
+    assert limiter.in_flight == 2
+
+
+async def test_decrease_is_multiplicative_with_cooldown():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=3, max_limit=8)
+    limiter.decrease(retry_after=0.05)
+    assert limiter.limit == 4
+
+    # errors within the cooldown only count once
+    limiter.decrease()
+    assert limiter.limit == 4
+
+    await asyncio.sleep(0.06)
+    limiter.decrease()
+    assert limiter.limit == 3
+
+
+async def test_cancelled_waiter_does_not_leak_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    holder = Manifest(request_tokens=1)
+    await limiter.acquire(holder)
+    cancelled = asyncio.create_task(limiter.acquire(Manifest(request_tokens=1)))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    await limiter.release(holder)
+    assert limiter.in_flight == 0
+    await asyncio.wait_for(limiter.acquire(Manifest(request_tokens=1)), timeout=0.1)
+
+
+def test_from_max_concurrency():
+    assert AdaptiveConcurrencyLimiter.from_max_concurrency(400).limit == 32
+    assert AdaptiveConcurrencyLimiter.from_max_concurrency(8).limit == 2
+    assert AdaptiveConcurrencyLimiter.from_max_concurrency(None).limit == 32
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError, match="min_limit"):
+        AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=2)
@@ -0,0 +1,43 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tests for limiting.base."""
+
+import asyncio
+
+from fnllm.limiting.rpm import RPMLimiter
+from fnllm.limiting.token_bucket import TokenBucket
+from fnllm.limiting.types import Manifest
+
+
+async def test_blocked_limiter_does_not_block_other_limiters():
+    blocked = RPMLimiter(TokenBucket(1, time_period=60), rps=False)
+    free = RPMLimiter(TokenBucket(100, time_period=60), rps=False)
+    manifest = Manifest(request_tokens=1)
+
+    async with blocked.use(manifest):
+        pass
+    waiting = asyncio.create_task(blocked.use(manifest).__aenter__())
+    await asyncio.sleep(0)
+
+    async def use_free():
+        async with free.use(manifest):
+            pass
+
+    await asyncio.wait_for(use_free(), timeout=0.1)
+    assert not waiting.done()
+    waiting.cancel()
+
+
+async def test_acquisitions_are_serialized_per_limiter():
+    limiter = RPMLimiter(TokenBucket(1, time_period=60), rps=False)
+    manifest = Manifest(request_tokens=1)
+
+    async with limiter.use(manifest):
+        pass
+    waiting = asyncio.create_task(limiter.use(manifest).__aenter__())
+    await asyncio.sleep(0)
+    assert limiter.acquire_lock.locked()
+
+    waiting.cancel()
+    await asyncio.gather(waiting, return_exceptions=True)
+    assert not limiter.acquire_lock.locked()
@@ -0,0 +1,84 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tests for limiting.fair_share."""
+
+import asyncio
+
+import pytest
+from fnllm.limiting.concurrency import ConcurrencyLimiter
+from fnllm.limiting.fair_share import FairShareLimiter
+from fnllm.limiting.types import Manifest
+
+
+async def _admission_order(
+    limiter: FairShareLimiter, manifests: list[Manifest]
+) -> list[str | None]:
+    order = []
+
+    async def run(manifest: Manifest):
+        async with limiter.use(manifest):
+            order.append(manifest.flow)
+
+    holder = Manifest(request_tokens=1)
+    await limiter.acquire(holder)
+    # the first request waits in the delegate limiter, the next ones wait for their turn
+    tasks = [asyncio.create_task(run(Manifest(request_tokens=1, flow="first")))]
+    await asyncio.sleep(0)
+    for manifest in manifests:
+        tasks.append(asyncio.create_task(run(manifest)))
+        await asyncio.sleep(0)
+    await limiter.release(holder)
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+    return order[1:]
+
+
+async def test_flows_share_equally():
+    limiter = FairShareLimiter(ConcurrencyLimiter.from_max_concurrency(1))
+    # a chatty flow queued its requests first
+    manifests = [Manifest(request_tokens=10, flow="bulk") for _ in range(4)]
+    manifests += [Manifest(request_tokens=10, flow="chat") for _ in range(2)]
+
+    order = await _admission_order(limiter, manifests)
+    assert order == ["bulk", "chat", "bulk", "chat", "bulk", "bulk"]
+
+
+async def test_flows_share_by_weight():
+    limiter = FairShareLimiter(
+        ConcurrencyLimiter.from_max_concurrency(1), weights={"chat": 2}
+    )
+    manifests = [Manifest(request_tokens=10, flow="bulk") for _ in range(3)]
+    manifests += [Manifest(request_tokens=10, flow="chat") for _ in range(4)]
+
+    order = await _admission_order(limiter, manifests)
+    assert order == ["chat", "bulk", "chat", "chat", "bulk", "chat", "bulk"]
+
+
+async def test_flows_share_by_tokens():
+    limiter = FairShareLimiter(ConcurrencyLimiter.from_max_concurrency(1))
+    manifests = [Manifest(request_tokens=100, flow="large") for _ in range(2)]
+    manifests += [Manifest(request_tokens=10, flow="small") for _ in range(3)]
+
+    order = await _admission_order(limiter, manifests)
+    assert order == ["small", "small", "small", "large", "large"]
+
+    limiter = FairShareLimiter(
+        ConcurrencyLimiter.from_max_concurrency(1), by_tokens=False
+    )
+    order = await _admission_order(limiter, manifests)
+    assert order == ["large", "small", "large", "small", "small"]
+
+
+async def test_priority_before_fair_share():
+    limiter = FairShareLimiter(ConcurrencyLimiter.from_max_concurrency(1))
+    manifests = [Manifest(request_tokens=10, flow="chat") for _ in range(2)]
+    manifests += [Manifest(request_tokens=10, flow="bulk", priority=1)]
+
+    order = await _admission_order(limiter, manifests)
+    assert order == ["bulk", "chat", "chat"]
+
+
+def test_invalid_weights():
+    with pytest.raises(ValueError, match="positive"):
+        FairShareLimiter(
+            ConcurrencyLimiter.from_max_concurrency(1), weights={"chat": 0}
+        )
@@ -0,0 +1,152 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tests for limiting.priority."""
+
+import asyncio
+import time
+
+import pytest
+from fnllm.limiting.concurrency import ConcurrencyLimiter
+from fnllm.limiting.priority import DeadlineExceededError, PriorityLimiter
+from fnllm.limiting.types import Manifest
+
+
+def _manifest(priority: int = 0, deadline: float | None = None) -> Manifest:
+    return Manifest(request_tokens=1, priority=priority, deadline=deadline)
+
+
+async def _admission_order(
+    limiter: PriorityLimiter, manifests: dict[str, Manifest], delay: float = 0
+) -> list[str]:
+    order = []
+
+    async def run(name: str, manifest: Manifest):
+        async with limiter.use(manifest):
+            order.append(name)
+
+    holder = _manifest()
+    await limiter.acquire(holder)
+    # the first request waits in the delegate limiter, the next ones wait for their turn
+    tasks = [asyncio.create_task(run("first", _manifest()))]
+    await asyncio.sleep(0)
+    for name, manifest in manifests.items():
+        tasks.append(asyncio.create_task(run(name, manifest)))
+        await asyncio.sleep(delay)
+    await limiter.release(holder)
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+    return order
+
+
+async def test_higher_priority_admitted_first():
+    limiter = PriorityLimiter(ConcurrencyLimiter.from_max_concurrency(1))
+    order = await _admission_order(
+        limiter,
+        {"low": _manifest(0), "high": _manifest(5), "low2": _manifest(0)},
+    )
+    assert order == ["first", "high", "low", "low2"]
+
+
+async def test_earlier_deadline_admitted_first_within_priority():
+    limiter = PriorityLimiter(ConcurrencyLimiter.from_max_concurrency(1))
+    now = time.time()
+    order = await _admission_order(
+        limiter,
+        {
+            "none": _manifest(),
+            "late": _manifest(deadline=now + 60),
+            "soon": _manifest(deadline=now + 30),
+        },
+    )
+    assert order == ["first", "soon", "late", "none"]
+
+
+async def test_waiting_requests_age():
+    limiter = PriorityLimiter(
+        ConcurrencyLimiter.from_max_concurrency(1), aging_interval=0.05
+    )
+    order = await _admission_order(
+        limiter, {"low": _manifest(0), "high": _manifest(1)}, delay=0.12
+    )
+    # the low-priority request waited for two aging intervals
+    assert order == ["first", "low", "high"]
+
+
+async def test_longest_waiting_request_ages_past_earlier_deadlines():
+    limiter = PriorityLimiter(
+        ConcurrencyLimiter.from_max_concurrency(1), aging_interval=0.05
+    )
+
+    async def run(manifest: Manifest):
+        async with limiter.use(manifest):
+            await asyncio.sleep(0.01)
+
+    holder = _manifest()
+    await limiter.acquire(holder)
+    first = asyncio.create_task(run(_manifest()))
+    await asyncio.sleep(0)
+    old = asyncio.create_task(run(_manifest()))
+    await asyncio.sleep(0)
+
+    # a stream of fresh requests, each with an earlier deadline than the previous ones
+    stream = []
+    deadline = time.time() + 60
+    for i in range(0, 200, 2):
+        if old.done():
+            break
+        stream += [
+            asyncio.create_task(run(_manifest(deadline=deadline - (i + j) / 1000)))
+            for j in range(2)
+        ]
+        await asyncio.sleep(0 if i == 0 else 0.01)
+        if i == 0:
+            await limiter.release(holder)
+
+    assert old.done()
+    for task in stream:
+        task.cancel()
+    await asyncio.gather(first, *stream, return_exceptions=True)
+
+
+async def test_deadline_exceeded():
+    limiter = PriorityLimiter(ConcurrencyLimiter.from_max_concurrency(1))
+    with pytest.raises(DeadlineExceededError):
+        await limiter.acquire(_manifest(deadline=time.time() - 1))
+
+    holder = _manifest()
+    await limiter.acquire(holder)
+    first = asyncio.create_task(limiter.acquire(_manifest()))
+    await asyncio.sleep(0)
+    with pytest.raises(DeadlineExceededError):
+        await asyncio.wait_for(
+            limiter.acquire(_manifest(deadline=time.time() + 0.05)), timeout=1
+        )
+    assert limiter.waiters == 0
+
+    await limiter.release(holder)
+    await asyncio.wait_for(first, timeout=0.1)
+
+
+async def test_cancelled_waiter_does_not_block_queue():
+    limiter = PriorityLimiter(ConcurrencyLimiter.from_max_concurrency(1))
+    holder = _manifest()
+    await limiter.acquire(holder)
+    first = _manifest()
+    first_task = asyncio.create_task(limiter.acquire(first))
+    await asyncio.sleep(0)
+
+    cancelled = asyncio.create_task(limiter.acquire(_manifest(5)))
+    waiting = asyncio.create_task(limiter.acquire(_manifest()))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await limiter.release(holder)
+    await asyncio.wait_for(first_task, timeout=0.1)
+    await limiter.release(first)
+
+    await asyncio.wait_for(waiting, timeout=0.1)
+    assert cancelled.cancelled()
+    assert limiter.waiters == 0
+
+
+def test_invalid_aging_interval():
+    with pytest.raises(ValueError, match="positive"):
+        PriorityLimiter(ConcurrencyLimiter.from_max_concurrency(1), aging_interval=0)
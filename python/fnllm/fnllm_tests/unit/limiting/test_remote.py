@@ -0,0 +1,215 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tests for limiting.remote and limiting.coordinator."""
+
+import asyncio
+from collections.abc import Sequence
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from fnllm.limiting.coordinator import LimiterCoordinator
+from fnllm.limiting.remote import LimiterOp, RemoteLimiter, TcpLimiterTransport
+from fnllm.limiting.types import LimitReconciliation, Manifest
+
+
+class CountingTransport:
+    def __init__(self, coordinator: LimiterCoordinator):
+        self.coordinator = coordinator
+        self.batches: list[list[LimiterOp]] = []
+
+    async def send(self, ops: Sequence[LimiterOp]) -> list[dict[str, Any]]:
+        self.batches.append(list(ops))
+        return await self.coordinator.send(ops)
+
+
+async def test_leases_are_prefetched():
+    transport = CountingTransport(LimiterCoordinator())
+    limiter = RemoteLimiter(
+        transport,
+        key="deployment",
+        requests_per_minute=100,
+        tokens_per_minute=10_000,
+        prefetch=0.1,
+    )
+
+    await limiter.acquire(Manifest(request_tokens=100))
+    assert len(transport.batches) == 1
+    assert limiter.leased == {"deployment:rpm": 10, "deployment:tpm": 1_000}
+
+    # served from the leases, without a round-trip
+    for _ in range(5):
+        await limiter.acquire(Manifest(request_tokens=100))
+    assert len(transport.batches) == 1
+    assert limiter.leased == {"deployment:rpm": 5, "deployment:tpm": 500}
+
+
+async def test_concurrent_acquisitions_are_batched():
+    transport = CountingTransport(LimiterCoordinator())
+    limiter = RemoteLimiter(
+        transport, key="deployment", tokens_per_minute=10_000, prefetch=0
+    )
+
+    await asyncio.gather(*[
+        limiter.acquire(Manifest(request_tokens=100)) for _ in range(10)
+    ])
+    assert len(transport.batches) == 1
+    assert len(transport.batches[0]) == 10
+
+
+async def test_unused_leases_are_returned():
+    coordinator = LimiterCoordinator()
+    limiter = RemoteLimiter(
+        coordinator, key="deployment", tokens_per_minute=1_000, lease_ttl=0.05
+    )
+    await limiter.acquire(Manifest(request_tokens=100))
+    assert limiter.leased["deployment:tpm"] == 50
+
+    await asyncio.sleep(0.1)
+    assert limiter.leased == {}
+    assert coordinator._buckets["deployment:tpm"].tokens == pytest.approx(900, abs=5)
+
+
+async def test_reconcile_updates_coordinator():
+    coordinator = LimiterCoordinator()
+    limiter = RemoteLimiter(
+        coordinator,
+        key="deployment",
+        tokens_per_minute=1,
+        tpm_reconciler=lambda _: LimitReconciliation(limit=6_000, remaining=3_000),
+    )
+    await limiter.acquire(Manifest(request_tokens=1))
+    await limiter.reconcile(Mock())
+
+    bucket = coordinator._buckets["deployment:tpm"]
+    assert bucket.capacity == 6_000
+    assert bucket.tokens == pytest.approx(3_000, abs=5)
+
+
+async def test_limiters_share_the_budget_over_tcp():
+    coordinator = LimiterCoordinator()
+    host, port = await coordinator.start()
+    try:
+        limiters = [
+            RemoteLimiter(
+                TcpLimiterTransport(host, port),
+                key="deployment",
+                tokens_per_minute=600,
+                prefetch=0,
+            )
+            for _ in range(2)
+        ]
+        await limiters[0].acquire(Manifest(request_tokens=600))
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        # the bucket refills at 10 tokens/s
+        await limiters[1].acquire(Manifest(request_tokens=3))
+        assert loop.time() - start == pytest.approx(0.3, abs=0.1)
+    finally:
+        await coordinator.close()
+
+
+async def test_coordinator_rejects_invalid_operations():
+    coordinator = LimiterCoordinator()
+    host, port = await coordinator.start()
+    try:
+        transport = TcpLimiterTransport(host, port)
+        with pytest.raises(RuntimeError, match="rejected"):
+            await transport.send([{"op": "unknown", "bucket": "b"}])  # type: ignore
+        # the connection is still usable
+        assert await transport.send([{"op": "return", "bucket": "b", "amount": 1}]) == [
+            {}
+        ]
+        await transport.close()
+    finally:
+        await coordinator.close()
+
+
+class FailingTransport(CountingTransport):
+    def __init__(self, coordinator: LimiterCoordinator, failures: int):
+        super().__init__(coordinator)
+        self.failures = failures
+
+    async def send(self, ops: Sequence[LimiterOp]) -> list[dict[str, Any]]:
+        if self.failures > 0:
+            self.failures -= 1
+            msg = "coordinator down"
+            raise ConnectionRefusedError(msg)
+        return await super().send(ops)
+
+
+async def test_falls_back_to_local_limits_when_coordinator_is_down():
+    transport = FailingTransport(LimiterCoordinator(), failures=2)
+    limiter = RemoteLimiter(
+        transport,
+        key="deployment",
+        tokens_per_minute=600,
+        prefetch=0,
+        retry_interval=0.1,
+    )
+
+    # the first acquisition fails over to the local bucket
+    await limiter.acquire(Manifest(request_tokens=600))
+    assert limiter.is_local
+
+    # the local bucket enforces the limit, without reaching the coordinator
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await limiter.acquire(Manifest(request_tokens=3))
+    assert loop.time() - start == pytest.approx(0.3, abs=0.1)
+    assert transport.failures == 1
+
+    # the coordinator is retried after the retry interval, with a growing interval
+    await limiter.acquire(Manifest(request_tokens=1))
+    assert transport.failures == 0
+    assert limiter.is_local
+    await asyncio.sleep(0.25)
+    await limiter.acquire(Manifest(request_tokens=1))
+    assert not limiter.is_local
+    assert len(transport.batches) == 1
+
+
+async def test_falls_back_when_coordinator_is_unreachable_over_tcp():
+    coordinator = LimiterCoordinator()
+    host, port = await coordinator.start()
+    await coordinator.close()
+
+    limiter = RemoteLimiter(
+        TcpLimiterTransport(host, port), key="deployment", requests_per_minute=100
+    )
+    await asyncio.wait_for(limiter.acquire(Manifest(request_tokens=1)), timeout=1)
+    assert limiter.is_local
+
+
+async def test_falls_back_when_coordinator_times_out():
+    class HangingTransport:
+        async def send(self, ops: Sequence[LimiterOp]) -> list[dict[str, Any]]:
+            await asyncio.sleep(10)
+            return []
+
+    limiter = RemoteLimiter(
+        HangingTransport(), key="deployment", requests_per_minute=100, timeout=0.05
+    )
+    await asyncio.wait_for(limiter.acquire(Manifest(request_tokens=1)), timeout=1)
+    assert limiter.is_local
+
+
+async def test_failed_returns_are_logged(caplog: pytest.LogCaptureFixture):
+    class HangingReturnTransport(CountingTransport):
+        async def send(self, ops: Sequence[LimiterOp]) -> list[dict[str, Any]]:
+            if any(op["op"] == "return" for op in ops):
+                await asyncio.sleep(10)
+            return await super().send(ops)
+
+    limiter = RemoteLimiter(
+        HangingReturnTransport(LimiterCoordinator()),
+        key="deployment",
+        tokens_per_minute=1_000,
+        lease_ttl=0.05,
+        timeout=0.05,
+    )
+    await limiter.acquire(Manifest(request_tokens=100))
+    await asyncio.sleep(0.2)
+    await asyncio.gather(*limiter._tasks)
+    assert "failed to return leased tokens" in caplog.text
@@ -4,13 +4,13 @@
 
 from unittest.mock import Mock
 
-from aiolimiter import AsyncLimiter
 from fnllm.limiting.rpm import RPMLimiter
+from fnllm.limiting.token_bucket import TokenBucket
 from fnllm.limiting.types import Manifest
 
 
 async def test_rpm_only_acquired_with_request_tokens():
-    async_limiter = Mock(spec=AsyncLimiter)
+    async_limiter = Mock(spec=TokenBucket)
     rpm_limiter = RPMLimiter(async_limiter, rps=False)
 
     async with rpm_limiter.use(Manifest(request_tokens=10)):
@@ -18,7 +18,7 @@ async def test_rpm_only_acquired_with_request_tokens():
 
 
 async def test_rpm_not_acquired_without_request_tokens():
-    async_limiter = Mock(spec=AsyncLimiter)
+    async_limiter = Mock(spec=TokenBucket)
     rpm_limiter = RPMLimiter(async_limiter, rps=False)
 
     async with rpm_limiter.use(Manifest(request_tokens=0, post_request_tokens=10)):
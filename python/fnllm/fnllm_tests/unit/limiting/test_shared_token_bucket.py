@@ -0,0 +1,139 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tests for limiting.shared_token_bucket."""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from fnllm.limiting.shared_token_bucket import SharedTokenBucket
+
+
+async def test_buckets_share_the_budget(tmp_path: Path):
+    path = tmp_path / "limits.db"
+    first = SharedTokenBucket(path, 10, time_period=60)
+    second = SharedTokenBucket(path, 10, time_period=60)
+
+    await first.acquire(6)
+    assert second.available == pytest.approx(4, abs=0.1)
+    assert not second.has_capacity(5)
+
+    # buckets with other names are independent
+    other = SharedTokenBucket(path, 10, time_period=60, name="other")
+    assert other.available == pytest.approx(10)
+
+
+async def test_acquire_waits_for_refill(tmp_path: Path):
+    path = tmp_path / "limits.db"
+    first = SharedTokenBucket(path, 10, time_period=1)
+    second = SharedTokenBucket(path, 10, time_period=1)
+    await first.acquire(10)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await asyncio.gather(second.acquire(3), first.acquire(2))
+    # both acquisitions waited for the refill of the shared bucket
+    assert loop.time() - start == pytest.approx(0.5, abs=0.1)
+
+
+async def test_cancelled_acquire_gives_tokens_back(tmp_path: Path):
+    bucket = SharedTokenBucket(tmp_path / "limits.db", 10, time_period=60)
+    await bucket.acquire(10)
+
+    waiting = asyncio.create_task(bucket.acquire(5))
+    await asyncio.sleep(0.05)
+    assert bucket.waiters == 1
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    assert bucket.waiters == 0
+    await asyncio.gather(*bucket._tasks)
+    assert bucket.available < 1
+
+
+def test_update_is_shared(tmp_path: Path):
+    path = tmp_path / "limits.db"
+    first = SharedTokenBucket(path, 10, time_period=60)
+    second = SharedTokenBucket(path, 10, time_period=60)
+
+    first.update(capacity=100, available=50)
+    assert second.available == pytest.approx(50, abs=0.1)
+    assert second.capacity == 100
+
+
+async def test_reconcile_keeps_reserved_tokens(tmp_path: Path):
+    bucket = SharedTokenBucket(tmp_path / "limits.db", 10, time_period=1)
+    await bucket.acquire(10)
+    sleeping = asyncio.create_task(bucket.acquire(5))
+    await asyncio.sleep(0.05)
+    assert bucket.waiters == 1
+
+    # the sleeping acquisition reserved the tokens that became available
+    await bucket.reconcile(available=5)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await bucket.acquire(5)
+    assert loop.time() - start >= 0.3
+    await sleeping
+
+
+async def test_reconcile_runs_in_executor(tmp_path: Path):
+    thread_names: set[str] = set()
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            def record():
+                thread_names.add(threading.current_thread().name)
+                return fn(*args, **kwargs)
+
+            return super().submit(record)
+
+    with RecordingExecutor(max_workers=1, thread_name_prefix="test-io") as executor:
+        path = tmp_path / "limits.db"
+        bucket = SharedTokenBucket(path, 10, time_period=60, executor=executor)
+        await bucket.acquire(4)
+        old = await bucket.reconcile(capacity=100, available=50)
+
+    assert old == pytest.approx(6, abs=0.1)
+    assert thread_names == {"test-io_0"}
+    other = SharedTokenBucket(path, 10, time_period=60)
+    assert other.available == pytest.approx(50, abs=0.1)
+    assert other.capacity == 100
+
+
+def _acquire_in_process(path: Path, count: int, barrier, elapsed) -> None:
+    async def acquire():
+        bucket = SharedTokenBucket(path, 20, time_period=1)
+        # connect before the barrier, so both processes acquire at once
+        bucket.has_capacity()
+        barrier.wait()
+        start = time.perf_counter()
+        for _ in range(count):
+            await bucket.acquire()
+        elapsed.put(time.perf_counter() - start)
+
+    asyncio.run(acquire())
+
+
+def test_processes_share_the_budget(tmp_path: Path):
+    path = tmp_path / "limits.db"
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(2)
+    elapsed = context.Queue()
+    processes = [
+        context.Process(target=_acquire_in_process, args=(path, 15, barrier, elapsed))
+        for _ in range(2)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=30)
+        assert process.exitcode == 0
+
+    # 30 tokens from a single bucket of 20, refilled at 20 tokens/s
+    assert max(elapsed.get(), elapsed.get()) == pytest.approx(0.5, abs=0.2)
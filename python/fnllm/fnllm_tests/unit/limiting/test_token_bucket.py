@@ -0,0 +1,109 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tests for limiting.token_bucket."""
+
+import asyncio
+
+import pytest
+from fnllm.limiting.token_bucket import TokenBucket
+
+
+async def test_acquire_within_capacity():
+    bucket = TokenBucket(10, time_period=60)
+    await bucket.acquire(4)
+    await bucket.acquire(6)
+    assert bucket.available < 1
+    assert not bucket.has_capacity()
+
+
+async def test_acquire_waits_for_refill():
+    bucket = TokenBucket(10, time_period=1)
+    await bucket.acquire(10)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await bucket.acquire(5)
+    assert loop.time() - start == pytest.approx(0.5, abs=0.1)
+
+
+async def test_acquire_larger_than_capacity_waits_for_full_bucket():
+    bucket = TokenBucket(10, time_period=0.1)
+    await bucket.acquire(5)
+    await asyncio.wait_for(bucket.acquire(100), timeout=1)
+    assert bucket.available < 1
+
+
+async def test_fifo_order():
+    bucket = TokenBucket(10, time_period=0.5)
+    await bucket.acquire(10)
+
+    order = []
+
+    async def acquire(name: str, amount: float):
+        await bucket.acquire(amount)
+        order.append(name)
+
+    tasks = [asyncio.create_task(acquire("large", 8))]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(acquire(f"small{i}", 1)) for i in range(3)]
+    await asyncio.gather(*tasks)
+
+    # the small acquisitions do not overtake the large one
+    assert order == ["large", "small0", "small1", "small2"]
+
+
+async def test_many_waiters():
+    bucket = TokenBucket(1000, time_period=0.2)
+    await bucket.acquire(1000)
+
+    await asyncio.wait_for(
+        asyncio.gather(*[bucket.acquire() for _ in range(2000)]), timeout=2
+    )
+    assert bucket.waiters == 0
+
+
+async def test_cancelled_waiter_does_not_block_queue():
+    bucket = TokenBucket(10, time_period=0.2)
+    await bucket.acquire(10)
+
+    cancelled = asyncio.create_task(bucket.acquire(10))
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(bucket.acquire(1))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    await asyncio.wait_for(waiting, timeout=0.1)
+    assert bucket.waiters == 0
+
+
+async def test_update_available_wakes_waiters():
+    bucket = TokenBucket(10, time_period=60)
+    await bucket.acquire(10)
+
+    waiting = asyncio.create_task(bucket.acquire(5))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    bucket.update(available=5)
+    await asyncio.wait_for(waiting, timeout=0.1)
+
+
+async def test_update_capacity():
+    bucket = TokenBucket(10, time_period=60)
+    bucket.update(capacity=100)
+    assert bucket.capacity == 100
+    assert bucket.rate == pytest.approx(100 / 60)
+    assert bucket.available == pytest.approx(10, abs=0.1)
+
+    # shrinking the capacity caps the available tokens
+    bucket.update(capacity=5)
+    assert bucket.available == pytest.approx(5)
+
+    # acquisitions are capped to the new capacity
+    await asyncio.wait_for(bucket.acquire(50), timeout=0.1)
+    assert bucket.available == pytest.approx(0, abs=0.1)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="positive"):
+        TokenBucket(0)
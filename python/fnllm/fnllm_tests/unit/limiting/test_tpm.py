@@ -4,13 +4,13 @@
 
 from unittest.mock import Mock
 
-from aiolimiter import AsyncLimiter
+from fnllm.limiting.token_bucket import TokenBucket
 from fnllm.limiting.tpm import TPMLimiter
 from fnllm.limiting.types import Manifest
 
 
 async def test_tpm_acquired_with_sum_of_request_and_post_request_tokens():
-    async_limiter = Mock(spec=AsyncLimiter)
+    async_limiter = Mock(spec=TokenBucket)
     tpm_limiter = TPMLimiter(async_limiter, 100)
 
     async with tpm_limiter.use(Manifest(request_tokens=10, post_request_tokens=20)):
@@ -18,7 +18,7 @@ async def test_tpm_acquired_with_sum_of_request_and_post_request_tokens():
 
 
 async def test_tpm_only_acquired_with_non_zero_tokens_sum():
-    async_limiter = Mock(spec=AsyncLimiter)
+    async_limiter = Mock(spec=TokenBucket)
     tpm_limiter = TPMLimiter(async_limiter, 100)
 
     async with tpm_limiter.use(Manifest()):
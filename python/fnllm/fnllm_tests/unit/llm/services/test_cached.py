@@ -2,9 +2,14 @@
 
 """Tests for the Cached Decorator."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
+import pytest
 from fnllm.base.services.cached import Cached
+from fnllm.caching.base import CacheMetadataPolicy
+from fnllm.caching.content import CONTENT_STORE_NAMESPACE, ContentStore
+from fnllm.caching.memory import MemoryCache
 from fnllm.types.io import LLMOutput
 
 
@@ -107,3 +112,203 @@ async def test_cache_bust() -> None:
 
     result = await decorated("test", name="test", bust_cache=True)
     assert result.output == "abcdef"
+
+
+def _coalescing_decorator(delegate: AsyncMock) -> Cached:
+    cache = MemoryCache()
+    events = Mock()
+    events.on_cache_hit = AsyncMock(return_value=None)
+    events.on_cache_miss = AsyncMock(return_value=None)
+
+    adapter = Mock()
+    adapter.build_cache_key_from_data = lambda prompt, _, __: f"key-{prompt}"
+    adapter.get_cache_input_data = lambda prompt, _: {"prompt": prompt}
+    adapter.wrap_output = lambda _, __, x: x
+    adapter.dump_raw_model = lambda x: x
+    return Cached(cache=cache, events=events, cache_adapter=adapter)
+
+
+async def test_concurrent_requests_are_coalesced() -> None:
+    """Test that concurrent identical requests share a single LLM call."""
+    release = asyncio.Event()
+
+    async def invoke(prompt: str, **_kwargs) -> LLMOutput:
+        await release.wait()
+        return LLMOutput(output=f"output-{prompt}")
+
+    delegate = AsyncMock(side_effect=invoke)
+    decorated = _coalescing_decorator(delegate).decorate(delegate)
+
+    tasks = [asyncio.create_task(decorated("a")) for _ in range(5)]
+    tasks.append(asyncio.create_task(decorated("b")))
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert delegate.call_count == 2
+    assert [r.output for r in results] == ["output-a"] * 5 + ["output-b"]
+    assert [r.cache_hit for r in results] == [None] + [True] * 4 + [None]
+
+
+async def test_coalesced_requests_share_errors() -> None:
+    """Test that an error in a coalesced request is raised to every waiter."""
+    release = asyncio.Event()
+
+    async def invoke(_prompt: str, **_kwargs) -> LLMOutput:
+        await release.wait()
+        msg = "failure"
+        raise ValueError(msg)
+
+    delegate = AsyncMock(side_effect=invoke)
+    decorator = _coalescing_decorator(delegate)
+    decorated = decorator.decorate(delegate)
+
+    tasks = [asyncio.create_task(decorated("a")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert delegate.call_count == 1
+    assert all(isinstance(r, ValueError) for r in results)
+    assert decorator._inflight == {}
+
+
+async def test_coalesced_request_cancellation() -> None:
+    """Test that waiters take over the request when the inflight request is cancelled."""
+    release = asyncio.Event()
+
+    async def invoke(prompt: str, **_kwargs) -> LLMOutput:
+        await release.wait()
+        return LLMOutput(output=f"output-{prompt}")
+
+    delegate = AsyncMock(side_effect=invoke)
+    decorated = _coalescing_decorator(delegate).decorate(delegate)
+
+    first = asyncio.create_task(decorated("a"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(decorated("a"))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    result = await second
+    assert result.output == "output-a"
+    assert delegate.call_count == 2
+
+
+async def test_cache_input_data_is_built_once() -> None:
+    """Test that the cache input data is only built once per request."""
+    delegate = AsyncMock(return_value=LLMOutput(output="abcdef"))
+    cache = MemoryCache()
+    events = Mock()
+    events.on_cache_miss = AsyncMock(return_value=None)
+
+    adapter = Mock()
+    adapter.get_cache_input_data = Mock(return_value={"prompt": "test"})
+    adapter.build_cache_key_from_data = Mock(return_value="key")
+    adapter.dump_raw_model = lambda x: x
+
+    decorated = Cached(cache=cache, events=events, cache_adapter=adapter).decorate(
+        delegate
+    )
+    await decorated("test")
+
+    adapter.get_cache_input_data.assert_called_once()
+    adapter.build_cache_key_from_data.assert_called_once()
+    adapter.build_cache_key.assert_not_called()
+    assert await cache.get("key") == "abcdef"
+
+
+async def test_cache_metadata_content_dedup() -> None:
+    """Test that large metadata strings are stored once."""
+    cache = MemoryCache()
+    events = Mock()
+    events.on_cache_miss = AsyncMock(return_value=None)
+    system_prompt = "You are a helpful assistant. " * 100
+
+    adapter = Mock()
+    adapter.get_cache_input_data = lambda prompt, _: {
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
+    }
+    adapter.build_cache_key_from_data = lambda prompt, _, __: f"key_{prompt}"
+    adapter.dump_raw_model = lambda output: {"output": output}
+
+    decorator = Cached(
+        cache=cache,
+        events=events,
+        cache_adapter=adapter,
+        content_store=ContentStore(cache.child(CONTENT_STORE_NAMESPACE)),
+    )
+    decorated = decorator.decorate(
+        AsyncMock(side_effect=lambda prompt, **_: LLMOutput(output=prompt))
+    )
+    await decorated("a")
+    await decorated("b")
+
+    prefix = f"{CONTENT_STORE_NAMESPACE}/"
+    entries = {key: entry async for key, entry in cache.iter_entries()}
+    content_keys = [key for key in entries if key.startswith(prefix)]
+    assert len(content_keys) == 1
+    assert entries[content_keys[0]]["result"] == system_prompt
+
+    messages = entries["key_a"]["metadata"]["input"]["messages"]
+    assert messages[0]["content"] == {"$content": content_keys[0][len(prefix) :]}
+    assert messages[1]["content"] == "a"
+
+    # the stored metadata is read back through the content store
+    metadata = await ContentStore(cache.child(CONTENT_STORE_NAMESPACE)).expand(
+        entries["key_a"]["metadata"]
+    )
+    assert metadata["input"]["messages"][0]["content"] == system_prompt
+
+    # without a content store, the metadata is written as is
+    cache = MemoryCache()
+    decorator = Cached(cache=cache, events=events, cache_adapter=adapter)
+    decorated = decorator.decorate(
+        AsyncMock(side_effect=lambda prompt, **_: LLMOutput(output=prompt))
+    )
+    await decorated("a")
+    entries = {key: entry async for key, entry in cache.iter_entries()}
+    assert list(entries) == ["key_a"]
+    messages = entries["key_a"]["metadata"]["input"]["messages"]
+    assert messages[0]["content"] == system_prompt
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected"),
+    [
+        (
+            CacheMetadataPolicy.FULL,
+            {"input": {"prompt": "a"}, "key": "key_a", "custom": {"run": 1}},
+        ),
+        (CacheMetadataPolicy.HASHED, {"key": "key_a", "custom": {"run": 1}}),
+        (CacheMetadataPolicy.NONE, None),
+    ],
+)
+async def test_cache_metadata_policy(
+    policy: CacheMetadataPolicy, expected: dict | None
+) -> None:
+    """Test the metadata written with each metadata policy."""
+    cache = MemoryCache()
+    events = Mock()
+    events.on_cache_miss = AsyncMock(return_value=None)
+
+    adapter = Mock()
+    adapter.get_cache_input_data = lambda prompt, _: {"prompt": prompt}
+    adapter.build_cache_key_from_data = lambda prompt, _, __: f"key_{prompt}"
+    adapter.dump_raw_model = lambda output: {"output": output}
+
+    decorator = Cached(
+        cache=cache, events=events, cache_adapter=adapter, metadata_policy=policy
+    )
+    decorated = decorator.decorate(
+        AsyncMock(side_effect=lambda prompt, **_: LLMOutput(output=prompt))
+    )
+    await decorated("a", cache_metadata={"run": 1})
+
+    entries = {key: entry async for key, entry in cache.iter_entries()}
+    assert entries["key_a"]["metadata"] == expected
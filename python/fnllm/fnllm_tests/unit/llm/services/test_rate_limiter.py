@@ -5,12 +5,12 @@
 from asyncio import Semaphore
 from unittest.mock import AsyncMock, Mock, call
 
-from aiolimiter import AsyncLimiter
 from fnllm.base.services.rate_limiter import RateLimiter
 from fnllm.events.base import LLMEvents
 from fnllm.limiting.composite import CompositeLimiter
 from fnllm.limiting.concurrency import ConcurrencyLimiter
 from fnllm.limiting.rpm import RPMLimiter
+from fnllm.limiting.token_bucket import TokenBucket
 from fnllm.limiting.tpm import TPMLimiter
 from fnllm.limiting.types import Manifest
 from fnllm.types.generics import THistoryEntry, TJsonModel, TModelParameters
@@ -33,9 +33,9 @@ async def test_rate_limit_based_on_estimated_request_tokens():
     # mocking limiters to test
     concurrency_base_limiter = AsyncMock(spec=Semaphore)
     concurrency_limiter = ConcurrencyLimiter(concurrency_base_limiter)
-    rpm_base_limiter = AsyncMock(spec=AsyncLimiter)
+    rpm_base_limiter = AsyncMock(spec=TokenBucket)
     rpm_limiter = RPMLimiter(rpm_base_limiter, rps=False)
-    tpm_base_limiter = AsyncMock(spec=AsyncLimiter)
+    tpm_base_limiter = AsyncMock(spec=TokenBucket)
     tpm_limiter = TPMLimiter(tpm_base_limiter, 10_000)
     limiter = CompositeLimiter([concurrency_limiter, rpm_limiter, tpm_limiter])
 
@@ -89,9 +89,9 @@ async def test_rate_limit_with_post_limit():
     # mocking limiters to test
     concurrency_base_limiter = AsyncMock(spec=Semaphore)
     concurrency_limiter = ConcurrencyLimiter(concurrency_base_limiter)
-    rpm_base_limiter = AsyncMock(spec=AsyncLimiter)
+    rpm_base_limiter = AsyncMock(spec=TokenBucket)
     rpm_limiter = RPMLimiter(rpm_base_limiter, rps=False)
-    tpm_base_limiter = AsyncMock(spec=AsyncLimiter)
+    tpm_base_limiter = AsyncMock(spec=TokenBucket)
     tpm_limiter = TPMLimiter(tpm_base_limiter, 10_000)
     limiter = CompositeLimiter([concurrency_limiter, rpm_limiter, tpm_limiter])
 
@@ -137,3 +137,45 @@ async def test_rate_limit_with_post_limit():
 
     # check estimated metrics are populated on result
     assert result.metrics.estimated_input_tokens == estimated_input_tokens
+
+
+async def test_rate_limit_manifest_has_priority_and_deadline():
+    expected_output = LLMOutput(
+        output="content",
+        metrics=LLMMetrics(usage=LLMUsageMetrics(input_tokens=10, output_tokens=0)),
+    )
+    delegate = AsyncMock(spec=LLM, return_value=expected_output)
+    events = Mock(spec=LLMEvents)
+
+    limiter = CustomRateLimiter(
+        limiter=ConcurrencyLimiter.from_max_concurrency(1),
+        events=events,
+        estimator=lambda _, __: 10,
+    )
+    llm = limiter.decorate(delegate)
+    await llm(10, priority=3, deadline=123.0)
+
+    events.on_limit_acquired.assert_called_once_with(
+        Manifest(request_tokens=10, priority=3, deadline=123.0)
+    )
+
+
+async def test_rate_limit_child_manifest_has_flow():
+    expected_output = LLMOutput(
+        output="content",
+        metrics=LLMMetrics(usage=LLMUsageMetrics(input_tokens=10, output_tokens=0)),
+    )
+    delegate = AsyncMock(spec=LLM, return_value=expected_output)
+    events = Mock(spec=LLMEvents)
+
+    limiter = CustomRateLimiter(
+        limiter=ConcurrencyLimiter.from_max_concurrency(1),
+        events=events,
+        estimator=lambda _, __: 10,
+    )
+    llm = limiter.child("stage").child("tenant").decorate(delegate)
+    await llm(10)
+
+    events.on_limit_acquired.assert_called_once_with(
+        Manifest(request_tokens=10, flow="stage/tenant")
+    )
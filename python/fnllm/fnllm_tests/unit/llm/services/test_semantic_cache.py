@@ -0,0 +1,167 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""Tests for the semantic cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+from fnllm.base.services.cached import Cached
+from fnllm.base.services.semantic_cache import SemanticCache, SemanticCacheIndex
+from fnllm.caching.memory import MemoryCache
+from fnllm.types.generalized import EmbeddingsLLMOutput
+from fnllm.types.io import LLMOutput
+
+_VECTORS = {
+    "hello world": [1.0, 0.0, 0.0],
+    "hello  world!": [0.99, 0.1, 0.0],
+    "goodbye": [0.0, 1.0, 0.0],
+}
+
+
+def _embeddings_llm() -> AsyncMock:
+    def embed(texts: list[str], **_kwargs):
+        return LLMOutput(
+            output=EmbeddingsLLMOutput(embeddings=[_VECTORS[t] for t in texts])
+        )
+
+    return AsyncMock(side_effect=embed)
+
+
+def _adapter() -> Mock:
+    adapter = Mock()
+    adapter.get_cache_input_data = lambda prompt, _: {"prompt": prompt}
+    adapter.build_cache_key_from_data = lambda prompt, _, __: f"key_{prompt}"
+    adapter.get_semantic_cache_input = lambda prompt, _, __: ("scope", prompt)
+    adapter.dump_raw_model = lambda output: {"output": output}
+    adapter.wrap_output = lambda _, __, cached: cached["output"]
+    return adapter
+
+
+def test_index_search() -> None:
+    index = SemanticCacheIndex()
+    assert index.search(np.array([1.0, 0.0], np.float32)) is None
+
+    for i in range(100):
+        angle = i / 100
+        index.add(f"key{i}", np.array([np.cos(angle), np.sin(angle)], np.float32))
+    index.add("key0", np.array([0.0, 1.0], np.float32))
+    assert len(index) == 100
+
+    key, similarity = index.search(np.array([0.0, 1.0], np.float32))  # type: ignore
+    assert key == "key0"
+    assert similarity > 0.999
+
+    # vectors of other dimensions are ignored
+    assert index.search(np.array([1.0, 0.0, 0.0], np.float32)) is None
+
+
+async def test_semantic_cache_match() -> None:
+    store = MemoryCache()
+    semantic_cache = SemanticCache(store, _embeddings_llm(), threshold=0.9)
+
+    match = await semantic_cache.match("scope", "hello world")
+    assert match is not None
+    assert match.key is None
+    await semantic_cache.add(match, "key1")
+
+    match = await semantic_cache.match("scope", "hello  world!")
+    assert match is not None
+    assert match.key == "key1"
+    assert match.similarity > 0.9
+
+    match = await semantic_cache.match("scope", "goodbye")
+    assert match is not None
+    assert match.key is None
+    match = await semantic_cache.match("other", "hello world")
+    assert match is not None
+    assert match.key is None
+
+    # the index is loaded back from the cache
+    reloaded = SemanticCache(store, _embeddings_llm(), threshold=0.9)
+    match = await reloaded.match("scope", "hello  world!")
+    assert match is not None
+    assert match.key == "key1"
+
+
+async def test_cached_semantic_hit() -> None:
+    cache = MemoryCache()
+    events = Mock()
+    events.on_cache_miss = AsyncMock(return_value=None)
+    events.on_cache_hit = AsyncMock(return_value=None)
+    delegate = AsyncMock(side_effect=lambda prompt, **_: LLMOutput(output=prompt))
+
+    decorator = Cached(
+        cache=cache,
+        events=events,
+        cache_adapter=_adapter(),
+        semantic_cache=SemanticCache(
+            cache.child("semantic"), _embeddings_llm(), threshold=0.9
+        ),
+    )
+    decorated = decorator.decorate(delegate)
+
+    result = await decorated("hello world")
+    assert result.output == "hello world"
+    assert not result.cache_hit
+
+    result = await decorated("hello  world!")
+    assert result.output == "hello world"
+    assert result.cache_hit
+    events.on_cache_hit.assert_called_once_with("key_hello world", None)
+
+    # opting out only serves exact hits
+    result = await decorated("hello  world!", semantic_cache=False)
+    assert result.output == "hello  world!"
+    assert not result.cache_hit
+    assert delegate.call_count == 2
+
+
+async def test_semantic_cache_shares_response_cache() -> None:
+    cache = MemoryCache()
+    events = Mock()
+    events.on_cache_miss = AsyncMock(return_value=None)
+    events.on_cache_hit = AsyncMock(return_value=None)
+    delegate = AsyncMock(side_effect=lambda prompt, **_: LLMOutput(output=prompt))
+
+    decorator = Cached(
+        cache=cache,
+        events=events,
+        cache_adapter=_adapter(),
+        semantic_cache=SemanticCache(cache, _embeddings_llm(), threshold=0.9),
+    )
+    decorated = decorator.decorate(delegate)
+    await decorated("hello world")
+
+    # the index entry doesn't overwrite the cached response
+    result = await decorated("hello world")
+    assert result.output == "hello world"
+    assert result.cache_hit
+    result = await decorated("hello  world!")
+    assert result.output == "hello world"
+    assert result.cache_hit
+    assert delegate.call_count == 1
+
+
+async def test_semantic_lookup_once_per_inflight_request() -> None:
+    cache = MemoryCache()
+    events = Mock()
+    events.on_cache_miss = AsyncMock(return_value=None)
+    events.on_cache_hit = AsyncMock(return_value=None)
+    embeddings_llm = _embeddings_llm()
+
+    async def delegate(prompt, **_):
+        await asyncio.sleep(0.01)
+        return LLMOutput(output=prompt)
+
+    decorator = Cached(
+        cache=cache,
+        events=events,
+        cache_adapter=_adapter(),
+        semantic_cache=SemanticCache(cache, embeddings_llm, threshold=0.9),
+    )
+    decorated = decorator.decorate(delegate)
+
+    results = await asyncio.gather(*(decorated("hello world") for _ in range(5)))
+    assert all(r.output == "hello world" for r in results)
+    assert embeddings_llm.call_count == 1
@@ -72,3 +72,12 @@ def test_clone_valid():
     child = llm.child("test")
     # Cache, child is not llm
     assert child is not llm
+
+
+def test_clone_rate_limited():
+    rate_limiter = Mock()
+    llm = CustomLLM(rate_limiter=rate_limiter)
+    child = llm.child("test")
+    # Rate limiter, child has the child flow
+    assert child is not llm
+    rate_limiter.child.assert_called_once_with("test")
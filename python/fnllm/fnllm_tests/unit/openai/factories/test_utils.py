@@ -2,20 +2,26 @@
 
 """Tests for openai.factories.utils."""
 
+from pathlib import Path
 from typing import cast
 from unittest.mock import create_autospec
 
 import pytest
 from fnllm.base.services.rate_limiter import RateLimiter
 from fnllm.base.services.retryer import Retryer
+from fnllm.caching.content import CONTENT_STORE_NAMESPACE
+from fnllm.caching.memory import MemoryCache
 from fnllm.events.base import LLMEvents
 from fnllm.limiting.base import Limiter
 from fnllm.limiting.composite import CompositeLimiter
 from fnllm.limiting.concurrency import ConcurrencyLimiter
+from fnllm.limiting.remote import RemoteLimiter
 from fnllm.limiting.rpm import RPMLimiter
+from fnllm.limiting.shared_token_bucket import SharedTokenBucket
 from fnllm.limiting.tpm import TPMLimiter
-from fnllm.openai.config import AzureOpenAIConfig, OpenAIConfig
+from fnllm.openai.config import AzureOpenAIConfig, OpenAIConfig, PublicOpenAIConfig
 from fnllm.openai.factories.utils import (
+    create_content_store,
     create_limiter,
     create_rate_limiter,
     create_retryer,
@@ -100,13 +106,68 @@ def _assert_concurrency_tpm_rpm(limiter: Limiter | None, config: OpenAIConfig) -
     assert isinstance(limiter._limiters[1], RPMLimiter)
 
     if config.requests_burst_mode:
-        assert limiter._limiters[1]._limiter.max_rate == config.requests_per_minute
+        assert limiter._limiters[1]._limiter.capacity == config.requests_per_minute
         assert limiter._limiters[1]._limiter.time_period == 60
     else:
-        assert limiter._limiters[1]._limiter.max_rate == (100 / 60)
+        assert limiter._limiters[1]._limiter.capacity == (100 / 60)
         if config.requests_per_minute:
             assert limiter._limiters[1]._limiter.time_period == 1
 
     # TPMLimiter
     assert isinstance(limiter._limiters[2], TPMLimiter)
-    assert limiter._limiters[2]._limiter.max_rate == config.tokens_per_minute
+    assert limiter._limiters[2]._limiter.capacity == config.tokens_per_minute
+
+
+def test_create_limiter_with_shared_limits(tmp_path: Path):
+    config = AzureOpenAIConfig(
+        api_key="key",
+        api_version="api_version",
+        endpoint="endpoint",
+        deployment="deployment",
+        model="my_models",
+        requests_per_minute=100,
+        tokens_per_minute=200,
+        shared_limits_path=str(tmp_path / "limits.db"),
+    )
+    limiter = cast(CompositeLimiter, create_limiter(config, backoff_limiter=None))
+
+    rpm_bucket = limiter._limiters[0]._limiter
+    tpm_bucket = limiter._limiters[1]._limiter
+    assert isinstance(rpm_bucket, SharedTokenBucket)
+    assert rpm_bucket.name == "deployment:rpm"
+    assert isinstance(tpm_bucket, SharedTokenBucket)
+    assert tpm_bucket.name == "deployment:tpm"
+    assert tpm_bucket.capacity == 200
+
+
+def test_create_limiter_with_remote_limits():
+    config = AzureOpenAIConfig(
+        api_key="key",
+        api_version="api_version",
+        endpoint="endpoint",
+        deployment="deployment",
+        model="my_models",
+        max_concurrency=5,
+        requests_per_minute=100,
+        tokens_per_minute="auto",
+        remote_limits_address="localhost:7878",
+    )
+    limiter = cast(CompositeLimiter, create_limiter(config, backoff_limiter=None))
+
+    assert len(limiter._limiters) == 2
+    assert isinstance(limiter._limiters[0], ConcurrencyLimiter)
+    remote = limiter._limiters[1]
+    assert isinstance(remote, RemoteLimiter)
+    assert remote._capacities == {"deployment:rpm": 100, "deployment:tpm": 1}
+    assert list(remote._reconcilers) == ["deployment:tpm"]
+
+
+def test_create_content_store():
+    cache = MemoryCache()
+    config = PublicOpenAIConfig(api_key="key", model="model")
+    assert create_content_store(config, cache) is None
+
+    config = PublicOpenAIConfig(api_key="key", model="model", cache_content_store=True)
+    store = create_content_store(config, cache)
+    assert store is not None
+    assert store._cache._path_prefix == CONTENT_STORE_NAMESPACE  # type: ignore
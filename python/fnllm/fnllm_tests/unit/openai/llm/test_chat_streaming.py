@@ -3,6 +3,7 @@
 """Tests for openai.llm.chat."""
 
 import pytest
+from fnllm.caching.memory import MemoryCache
 from fnllm.openai.config import AzureOpenAIConfig
 from fnllm.openai.factories.chat import create_openai_chat_llm
 from fnllm.openai.types.aliases import OpenAICompletionUsageModel
@@ -203,3 +204,73 @@ def test_is_not_reasoning_model(
 
     # check reasoning model
     assert not llm.is_reasoning_model()
+
+
+async def test_streaming_chat_llm_cache(
+    chat_completion_streaming_client_mock: OpenAIChatCompletionStreamingClientMock,
+):
+    config = AzureOpenAIConfig(
+        api_version="api_version",
+        endpoint="endpoint",
+        model="my_model",
+        chat_parameters={"temperature": 0.5, "seed": 321},
+        track_stream_usage=True,
+    )
+    cache = MemoryCache()
+    llm = create_openai_chat_llm(
+        config=config,
+        cache=cache,
+        client=chat_completion_streaming_client_mock.mock_response(
+            message=["Hello", ", how can I help?"],
+            usage=OpenAICompletionUsageModel(
+                completion_tokens=10, prompt_tokens=20, total_tokens=30
+            ),
+            model=config.model,
+        ),
+    )
+
+    response = await llm("Hello!", stream=True)
+    assert not response.cache_hit
+    assert len(cache) == 0
+    result = [chunk async for chunk in response.output.content]
+    assert result == ["Hello", ", how can I help?"]
+    assert len(cache) == 1
+
+    # finished streams are replayed from the cache
+    response = await llm("Hello!", stream=True)
+    assert response.cache_hit
+    assert response.output.usage is not None
+    assert response.output.usage.input_tokens == 20
+    result = [chunk async for chunk in response.output.content]
+    assert result == ["Hello", ", how can I help?"]
+    chat_completion_streaming_client_mock.response_mock.assert_called_once()
+
+    # streams are cached in the child cache namespaces
+    response = await llm.child("child")("Hello!", stream=True)
+    assert not response.cache_hit
+
+
+async def test_streaming_chat_llm_cache_closed_stream(
+    chat_completion_streaming_client_mock: OpenAIChatCompletionStreamingClientMock,
+):
+    config = AzureOpenAIConfig(
+        api_version="api_version",
+        endpoint="endpoint",
+        model="my_model",
+    )
+    cache = MemoryCache()
+    llm = create_openai_chat_llm(
+        config=config,
+        cache=cache,
+        client=chat_completion_streaming_client_mock.mock_response(
+            message=["Hello", "there", "user"],
+            model=config.model,
+        ),
+    )
+
+    response = await llm("Hello!", stream=True)
+    async for _ in response.output.content:
+        await response.output.close()
+
+    # incomplete streams are not cached
+    assert len(cache) == 0
@@ -4,6 +4,9 @@
 from typing import Any
 from unittest.mock import AsyncMock, Mock
 
+import pytest
+from fnllm.caching.base import CacheMetadataPolicy
+from fnllm.caching.memory import MemoryCache
 from fnllm.openai.llm.openai_embeddings_batcher import OpenAIEmbeddingBatcher
 
 
@@ -137,3 +140,113 @@ async def test_batcher_two_calls_over_batch_size():
     assert e1 == r1
     assert e2 == r2
     assert llm.call_count == 2
+
+
+async def test_batcher_caches_per_text(memory_cache: MemoryCache):
+    llm = AsyncMock()
+    text_service = Mock()
+    text_service.count_tokens = Mock()
+    text_service.count_tokens.return_value = 1
+    batcher = OpenAIEmbeddingBatcher(
+        llm=llm,
+        text_service=text_service,
+        max_batch_size=10,
+        max_batch_tokens=10,
+        cache=memory_cache,
+        model="model",
+    )
+
+    llm.return_value = embeddings_response([[1.0], [2.0]])
+    f1 = batcher("text1")
+    f2 = batcher("text2")
+    await batcher.flush()
+    assert [await f1, await f2] == [[1.0], [2.0]]
+    llm.assert_called_once_with(["text1", "text2"])
+
+    # only the new text is sent to the LLM, and the results are stitched back in order
+    llm.reset_mock()
+    llm.return_value = embeddings_response([[3.0]])
+    f1 = batcher("text2")
+    f2 = batcher("text3")
+    f3 = batcher("text1")
+    await batcher.flush()
+    assert [await f1, await f2, await f3] == [[2.0], [3.0], [1.0]]
+    llm.assert_called_once_with(["text3"])
+
+    # fully cached batches don't call the LLM
+    llm.reset_mock()
+    f1 = batcher("text3")
+    await batcher.flush()
+    assert await f1 == [3.0]
+    llm.assert_not_called()
+
+
+async def test_batcher_cache_keys_include_model_parameters(memory_cache: MemoryCache):
+    llm = AsyncMock()
+    text_service = Mock()
+    text_service.count_tokens = Mock()
+    text_service.count_tokens.return_value = 1
+    llm.return_value = embeddings_response([[1.0]])
+
+    for dimensions in [1, 2]:
+        batcher = OpenAIEmbeddingBatcher(
+            llm=llm,
+            text_service=text_service,
+            max_batch_size=10,
+            max_batch_tokens=10,
+            cache=memory_cache,
+            model="model",
+            model_parameters={"dimensions": dimensions},
+        )
+        future = batcher("text")
+        await batcher.flush()
+        await future
+
+    assert llm.call_count == 2
+    assert len(memory_cache) == 2
+
+
+@pytest.mark.parametrize(
+    argnames=("policy", "expected"),
+    argvalues=[
+        (CacheMetadataPolicy.FULL, {"input", "key"}),
+        (CacheMetadataPolicy.HASHED, {"key"}),
+        (CacheMetadataPolicy.NONE, None),
+    ],
+)
+async def test_batcher_cache_metadata_policy(
+    memory_cache: MemoryCache, policy: CacheMetadataPolicy, expected: set[str] | None
+):
+    llm = AsyncMock()
+    text_service = Mock()
+    text_service.count_tokens = Mock()
+    text_service.count_tokens.return_value = 1
+    llm.return_value = embeddings_response([[1.0]])
+    batcher = OpenAIEmbeddingBatcher(
+        llm=llm,
+        text_service=text_service,
+        max_batch_size=10,
+        max_batch_tokens=10,
+        cache=memory_cache,
+        model="model",
+        metadata_policy=policy,
+    )
+    future = batcher("text")
+    await batcher.flush()
+    await future
+
+    entries = [entry async for _, entry in memory_cache.iter_entries()]
+    assert len(entries) == 1
+    metadata = entries[0]["metadata"]
+    assert (None if metadata is None else set(metadata)) == expected
+
+
+def test_batcher_cache_requires_model(memory_cache: MemoryCache):
+    with pytest.raises(ValueError, match="model"):
+        OpenAIEmbeddingBatcher(
+            llm=AsyncMock(),
+            text_service=Mock(),
+            max_batch_size=10,
+            max_batch_tokens=10,
+            cache=memory_cache,
+        )
@@ -83,3 +83,18 @@ async def test_retryable_error_handler_none_strategy_skips_sleep():
     )
     await handler.__call__(DummyAPIStatusError("1"))
     sleep_for.assert_not_called()
+
+
+async def test_retryable_error_handler_decreases_concurrency_on_retry_after():
+    concurrency_limiter = Mock()
+    handler = OpenAIRetryableErrorHandler(
+        Mock(),
+        strategy=OpenAIRateLimitBehavior.NONE,
+        concurrency_limiter=concurrency_limiter,
+    )
+    await handler.__call__(DummyAPIStatusError("2"))
+    concurrency_limiter.decrease.assert_called_once_with(2.0)
+
+    concurrency_limiter.reset_mock()
+    await handler.__call__(ValueError())
+    concurrency_limiter.decrease.assert_not_called()
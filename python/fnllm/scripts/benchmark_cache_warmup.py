@@ -0,0 +1,96 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""
+Benchmark a cold worker against a worker preloaded from a cache snapshot.
+
+A "remote" cache is simulated with a SQLite cache plus a fixed per-call latency. Each worker serves every cached key
+through a `TieredCache([MemoryCache(), remote])`; the time to first full throughput is how long it takes before
+requests are served at in-memory speed, i.e. until every key has been served once.
+
+    python scripts/benchmark_cache_warmup.py --entries 5000 --latency-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from fnllm.caching import (
+    MemoryCache,
+    SqliteCache,
+    TieredCache,
+    export_snapshot,
+    load_snapshot,
+)
+
+
+class _RemoteCache(SqliteCache):
+    """A SQLite cache with a simulated network round-trip on every read."""
+
+    def __init__(self, path: Path, latency: float):
+        super().__init__(path)
+        self._latency = latency
+
+    async def get(self, key: str) -> Any | None:
+        await asyncio.sleep(self._latency)
+        return await super().get(key)
+
+
+async def _serve(cache: TieredCache, keys: list[str], concurrency: int) -> float:
+    """Serve every key once, with bounded concurrency. Returns the elapsed time."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def serve(key: str) -> None:
+        async with semaphore:
+            await cache.get(key)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[serve(key) for key in keys])
+    return time.perf_counter() - start
+
+
+async def main(entries: int, latency_ms: float, concurrency: int) -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as tmp:
+        remote = _RemoteCache(Path(tmp) / "remote.db", latency_ms / 1000)
+        keys = [f"key{i}" for i in range(entries)]
+        await remote.set_many({
+            key: {"embedding": [i / entries] * 256} for i, key in enumerate(keys)
+        })
+
+        cold = await _serve(TieredCache([MemoryCache(), remote]), keys, concurrency)
+
+        snapshot = Path(tmp) / "snapshot.jsonl.gz"
+        start = time.perf_counter()
+        await export_snapshot(remote, snapshot)
+        export_time = time.perf_counter() - start
+
+        local = MemoryCache()
+        start = time.perf_counter()
+        await load_snapshot(local, snapshot)
+        load_time = time.perf_counter() - start
+        warm = await _serve(TieredCache([local, remote]), keys, concurrency)
+        snapshot_size = snapshot.stat().st_size
+        await remote.close()
+
+    print(f"entries: {entries}, remote latency: {latency_ms}ms")  # noqa: T201
+    print(f"snapshot size: {snapshot_size / 1024:.0f} KiB")  # noqa: T201
+    print(f"export: {export_time:.2f}s")  # noqa: T201
+    print(f"cold worker, time to first full throughput: {cold:.2f}s")  # noqa: T201
+    print(  # noqa: T201
+        f"warm worker, time to first full throughput: {load_time + warm:.2f}s "
+        f"(load {load_time:.2f}s + serve {warm:.2f}s)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(main(args.entries, args.latency_ms, args.concurrency))
@@ -0,0 +1,95 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""
+Benchmark the throughput of independent LLM deployments sharing a process.
+
+A "saturated" deployment is throttled by its TPM limit, while a "free" deployment has spare capacity. With a
+process-wide acquisition lock (the previous `LimitContext` behavior), requests to the free deployment queue behind
+the TPM waits of the saturated one; with per-limiter acquisition locks they proceed in parallel.
+
+    python scripts/benchmark_limiter_throughput.py --duration 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from fnllm.limiting import (
+    CompositeLimiter,
+    ConcurrencyLimiter,
+    Limiter,
+    Manifest,
+    TokenBucket,
+    TPMLimiter,
+)
+from fnllm.limiting.base import LimitContext
+
+if TYPE_CHECKING:
+    from asyncio import Lock
+
+_PROCESS_LOCK = asyncio.Lock()
+
+
+class _ProcessLockedLimiter(CompositeLimiter):
+    """A limiter whose acquisitions are serialized with every other limiter of the process."""
+
+    @property
+    def acquire_lock(self) -> Lock:
+        return _PROCESS_LOCK
+
+
+def _create_limiter(tokens_per_second: int, *, process_lock: bool) -> Limiter:
+    limiters = [
+        ConcurrencyLimiter.from_max_concurrency(64),
+        TPMLimiter(TokenBucket(tokens_per_second, time_period=1), tokens_per_second),
+    ]
+    return (
+        _ProcessLockedLimiter(limiters) if process_lock else CompositeLimiter(limiters)
+    )
+
+
+async def _run(limiter: Limiter, tokens: int, latency: float, deadline: float) -> int:
+    """Send requests through a limiter until the deadline. Returns the number of requests completed by then."""
+    completed = 0
+
+    async def worker() -> None:
+        nonlocal completed
+        while True:
+            async with LimitContext(limiter, Manifest(request_tokens=tokens)):
+                await asyncio.sleep(latency)
+            completed += 1
+
+    workers = [asyncio.create_task(worker()) for _ in range(32)]
+    await asyncio.sleep(deadline - time.perf_counter())
+    for task in workers:
+        task.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    return completed
+
+
+async def main(duration: float, latency_ms: float) -> None:
+    """Run the benchmark."""
+    for process_lock in (True, False):
+        saturated = _create_limiter(1_000, process_lock=process_lock)
+        free = _create_limiter(1_000_000, process_lock=process_lock)
+        deadline = time.perf_counter() + duration
+        saturated_count, free_count = await asyncio.gather(
+            _run(saturated, 500, latency_ms / 1000, deadline),
+            _run(free, 500, latency_ms / 1000, deadline),
+        )
+        mode = "process-wide lock" if process_lock else "per-limiter locks"
+        print(  # noqa: T201
+            f"{mode}: saturated deployment {saturated_count / duration:.1f} req/s, "
+            f"free deployment {free_count / duration:.1f} req/s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.duration, args.latency_ms))
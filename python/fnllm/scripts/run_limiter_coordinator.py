@@ -0,0 +1,36 @@
+# Copyright (c) 2025 Microsoft Corporation.
+
+"""
+Run the reference limiter coordinator, sharing RPM/TPM limits between the processes configured with its address.
+
+    python scripts/run_limiter_coordinator.py --host 0.0.0.0 --port 7878
+
+and set `remote_limits_address="<host>:7878"` in the LLM configurations.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from fnllm.limiting import LimiterCoordinator
+
+
+async def main(host: str, port: int) -> None:
+    """Serve the coordinator until interrupted."""
+    coordinator = LimiterCoordinator()
+    await coordinator.start(host, port)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await coordinator.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7878)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(args.host, args.port))